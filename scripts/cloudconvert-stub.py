@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+CloudConvert v2 작업 API 로컬 스텁 (convert-hwp-cloudconvert.py 시험용)
+
+실제 변환 없이 작업 흐름만 흉내 냄:
+- POST /v2/jobs            작업 생성 (import/upload 태스크에 업로드 폼 주소)
+- POST /upload/<태스크 id>  multipart 업로드 → 작업 processing
+- GET  /v2/jobs/<id>       조회 - 업로드 후 --polls번 조회해야 finished (backoff 확인용)
+- GET  /files/<작업>/<형식> 결과 파일 (PDF: %PDF, DOCX: zip - 다운로드 시그니처 검사 통과)
+- GET  /stats              작업/업로드/조회 횟수 (파일당 업로드 1회인지 확인)
+- --fail 이름: 해당 파일 작업은 error로 끝냄 / --rate-limit N: N번에 한 번 429 응답
+
+사용법:
+    python cloudconvert-stub.py --port 8765
+    CLOUDCONVERT_API_KEY=test python convert-hwp-cloudconvert.py --all --api-url http://127.0.0.1:8765/v2
+    curl http://127.0.0.1:8765/stats
+"""
+
+import io
+import json
+import uuid
+import email
+import zipfile
+import argparse
+import threading
+from email import policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+MIN_OUTPUT_SIZE = 1024
+
+
+class StubState:
+    def __init__(self, polls=2, fail=(), rate_limit=0):
+        self.polls = polls
+        self.fail = set(fail)
+        self.rate_limit = rate_limit
+        self.jobs = {}          # 작업 id → 작업
+        self.upload_tasks = {}  # 업로드 태스크 id → 작업 id
+        self.stats = {"jobs": 0, "uploads": 0, "polls": 0, "downloads": 0, "rateLimited": 0, "requests": 0}
+        self.lock = threading.Lock()
+
+
+def _output_bytes(fmt, source_name, content):
+    """형식 시그니처만 맞춘 가짜 결과 파일"""
+    note = f"stub {fmt} of {source_name} ({len(content)} bytes)".encode("utf-8")
+    if fmt == "pdf":
+        return b"%PDF-1.4\n%" + note + b"\n" + b" " * MIN_OUTPUT_SIZE + b"\n%%EOF\n"
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_STORED) as archive:
+        archive.writestr("stub.txt", note + b" " * MIN_OUTPUT_SIZE)
+    return buffer.getvalue()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    state: StubState = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b"", content_type="application/json", headers=None):
+        if isinstance(body, (dict, list)):
+            body = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _base(self):
+        return f"http://{self.headers.get('Host')}"
+
+    def _authorized(self):
+        if not self.headers.get("Authorization", "").startswith("Bearer "):
+            self._send(401, {"message": "Unauthenticated.", "code": "UNAUTHENTICATED"})
+            return False
+        return True
+
+    def _rate_limited(self):
+        state = self.state
+        with state.lock:
+            state.stats["requests"] += 1
+            limited = state.rate_limit and state.stats["requests"] % state.rate_limit == 0
+            if limited:
+                state.stats["rateLimited"] += 1
+        if limited:
+            self._send(429, {"message": "Too Many Requests", "code": "RATE_LIMIT"}, headers={"Retry-After": "1"})
+        return limited
+
+    def _read_body(self):
+        return self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
+    # === 작업 API ===
+    def do_POST(self):
+        if self.path == "/v2/jobs":
+            if not self._authorized() or self._rate_limited():
+                return
+            self._create_job(json.loads(self._read_body() or b"{}"))
+        elif self.path.startswith("/upload/"):
+            self._upload(self.path.rsplit("/", 1)[1])
+        else:
+            self._send(404, {"message": "Not found"})
+
+    def do_GET(self):
+        if self.path.startswith("/v2/jobs/"):
+            if not self._authorized() or self._rate_limited():
+                return
+            self._get_job(self.path.rsplit("/", 1)[1])
+        elif self.path.startswith("/files/"):
+            self._file(*self.path.split("/")[2:4])
+        elif self.path == "/stats":
+            with self.state.lock:
+                self._send(200, dict(self.state.stats))
+        else:
+            self._send(404, {"message": "Not found"})
+
+    def _create_job(self, payload):
+        state = self.state
+        job_id = str(uuid.uuid4())
+        tasks = []
+        for name, spec in (payload.get("tasks") or {}).items():
+            task = {"id": str(uuid.uuid4()), "name": name, "operation": spec.get("operation"),
+                    "status": "waiting", "result": None, **{k: v for k, v in spec.items() if k != "operation"}}
+            if task["operation"] == "import/upload":
+                task["result"] = {"form": {"url": f"{self._base()}/upload/{task['id']}",
+                                           "parameters": {"expires": "3600", "signature": "stub"}}}
+                state.upload_tasks[task["id"]] = job_id
+            tasks.append(task)
+        job = {"id": job_id, "tag": payload.get("tag"), "status": "waiting", "tasks": tasks,
+               "_uploaded": None, "_polls": 0}
+        with state.lock:
+            state.jobs[job_id] = job
+            state.stats["jobs"] += 1
+        self._send(201, {"data": self._public(job)})
+
+    def _upload(self, task_id):
+        state = self.state
+        job_id = state.upload_tasks.get(task_id)
+        if not job_id:
+            self._send(404, {"message": "Task not found"})
+            return
+        body = self._read_body()
+        message = email.message_from_bytes(
+            f"Content-Type: {self.headers.get('Content-Type')}\r\n\r\n".encode("utf-8") + body,
+            policy=policy.default,
+        )
+        upload = next((part for part in message.iter_parts() if part.get_filename()), None)
+        if upload is None:
+            self._send(400, {"message": "file missing"})
+            return
+        with state.lock:
+            job = state.jobs[job_id]
+            if job["_uploaded"] is not None:
+                self._send(409, {"message": "already uploaded"})
+                return
+            job["_uploaded"] = (upload.get_filename(), upload.get_payload(decode=True))
+            job["status"] = "processing"
+            state.stats["uploads"] += 1
+        self._send(201, b"", "text/plain")
+
+    def _get_job(self, job_id):
+        state = self.state
+        with state.lock:
+            job = state.jobs.get(job_id)
+            if not job:
+                self._send(404, {"message": "Job not found"})
+                return
+            state.stats["polls"] += 1
+            if job["status"] == "processing":
+                job["_polls"] += 1
+                if job["_polls"] >= state.polls:
+                    self._finish(job)
+            data = self._public(job)
+        self._send(200, {"data": data})
+
+    def _finish(self, job):
+        source_name = job["_uploaded"][0]
+        if source_name in self.state.fail:
+            job["status"] = "error"
+            for task in job["tasks"]:
+                if task["operation"] == "convert":
+                    task.update(status="error", code="CONVERSION_FAILED", message="stub failure")
+            return
+
+        stem = source_name.rsplit(".", 1)[0]
+        files = []
+        for task in job["tasks"]:
+            task["status"] = "finished"
+            if task["operation"] == "convert":
+                fmt = task["output_format"]
+                files.append({"filename": f"{stem}.{fmt}", "url": f"{self._base()}/files/{job['id']}/{fmt}"})
+        for task in job["tasks"]:
+            if task["operation"] == "export/url":
+                task["result"] = {"files": files}
+        job["status"] = "finished"
+
+    def _file(self, job_id, fmt):
+        state = self.state
+        with state.lock:
+            job = state.jobs.get(job_id)
+            if not job or job["status"] != "finished":
+                self._send(404, {"message": "File not found"})
+                return
+            state.stats["downloads"] += 1
+        source_name, content = job["_uploaded"]
+        self._send(200, _output_bytes(fmt, source_name, content), "application/octet-stream")
+
+    @staticmethod
+    def _public(job):
+        return {key: value for key, value in job.items() if not key.startswith("_")}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CloudConvert v2 작업 API 로컬 스텁")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--polls", type=int, default=2, help="업로드 후 완료까지 필요한 조회 횟수 (기본: 2)")
+    parser.add_argument("--fail", action="append", default=[], help="작업을 실패시킬 파일명 (여러 번 지정 가능)")
+    parser.add_argument("--rate-limit", type=int, default=0, help="N번째 API 요청마다 429 응답 (기본: 끔)")
+    args = parser.parse_args()
+
+    StubHandler.state = StubState(args.polls, args.fail, args.rate_limit)
+    server = ThreadingHTTPServer((args.host, args.port), StubHandler)
+    print(f"🧪 CloudConvert 스텁: http://{args.host}:{args.port}/v2 (통계: /stats)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
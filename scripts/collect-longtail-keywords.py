@@ -5,6 +5,7 @@
 - 꼬리물기: 연관검색어의 연관검색어 재귀 수집
 - 2024년 이전 구버전 키워드 자동 필터링
 - 허브 → 스포크 → 서브스포크 → 슈퍼롱테일 구조 자동 분류
+- 띄어쓰기/조사만 다른 유사 키워드는 하나의 클러스터로 묶음
 
 사용법:
   python collect-longtail-keywords.py 퇴직금
@@ -21,6 +22,9 @@ import sys
 import os
 from urllib.parse import quote
 from datetime import datetime
+from functools import lru_cache
+
+from keyword_normalize import cluster_keywords, compact_key, default_rank, to_slug
 
 # === 설정 ===
 headers = {
@@ -54,72 +58,124 @@ def is_current_keyword(keyword):
 
 
 # === 키워드 관련성 필터 ===
-def is_relevant_keyword(keyword, seed_keyword):
-    """시드 키워드와 관련 없는 노이즈 필터링"""
-    keyword_lower = keyword.lower().strip()
-
-    # 1. 너무 짧거나 긴 키워드 제외
-    if len(keyword) < 2 or len(keyword) > 50:
-        return False
-
-    # 2. UI 요소/네비게이션 제외
-    ui_patterns = [
-        r"^열기$", r"^닫기$", r"^더보기$", r"^도움말$", r"^검색$",
-        r"검색어.*기능", r"기능 닫기", r"기능 열기",
-        r"^신고$", r"^공유$", r"^저장$", r"^설정$",
-        r"html.*열기", r"파일.*열기"
-    ]
-    for pattern in ui_patterns:
-        if re.search(pattern, keyword, re.IGNORECASE):
+# UI 요소/네비게이션 패턴
+UI_PATTERNS = [
+    r"^열기$", r"^닫기$", r"^더보기$", r"^도움말$", r"^검색$",
+    r"검색어.*기능", r"기능 닫기", r"기능 열기",
+    r"^신고$", r"^공유$", r"^저장$", r"^설정$",
+    r"html.*열기", r"파일.*열기"
+]
+
+# 깨진 문자/특수문자 패턴
+BROKEN_PATTERNS = [
+    r"[鹹赽鎗跺湮齪秷夔鎮肭楷珋岆樑億]",
+    r"[\u4e00-\u9fff]{5,}",  # 연속 한자 5개 이상
+]
+
+# 명확히 무관한 주제 패턴 (시드에 포함된 패턴은 제외)
+NOISE_PATTERNS = [
+    r"게임", r"영화", r"드라마", r"노래", r"음악",
+    r"요리", r"레시피", r"맛집", r"여행",
+    r"축구", r"야구", r"농구", r"스포츠",
+    r"가연성", r"누출사고", r"가스.*누출",
+    r"kijul", r"개걸스럽다"
+]
+
+# 시드별 관련 용어 매핑
+RELATED_MAP = {
+    "퇴직금": ["퇴직", "퇴사", "이직", "근로", "급여", "임금", "고용", "노동", "연금", "IRP", "DC", "DB"],
+    "연말정산": ["소득", "공제", "세금", "세액", "연봉", "급여", "원천징수"],
+    "실업급여": ["고용보험", "실업", "구직", "이직", "퇴사"],
+}
+
+
+def _combine(patterns, flags=0):
+    """패턴 목록을 하나의 alternation 정규식으로 컴파일 (비어 있으면 None)"""
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+class RelevanceFilter:
+    """
+    시드 키워드 기준 노이즈 필터 (시드당 한 번만 컴파일)
+
+    수만 개의 수집 키워드를 걸러낼 때 패턴 재컴파일과
+    관련 용어 재계산 없이 배치로 처리한다.
+
+    사용법:
+        relevance = RelevanceFilter("퇴직금")
+        kept = relevance.filter_batch(candidates)
+    """
+
+    def __init__(self, seed_keyword):
+        self.seed_keyword = seed_keyword
+        self.ui_regex = _combine(UI_PATTERNS, re.IGNORECASE)
+        self.broken_regex = _combine(BROKEN_PATTERNS)
+
+        # 시드 자체에 걸리는 노이즈 패턴은 미리 제외
+        active_noise = [p for p in NOISE_PATTERNS if not re.search(p, seed_keyword, re.IGNORECASE)]
+        self.noise_regex = _combine(active_noise, re.IGNORECASE)
+
+        # 시드 핵심 단어 (한글 기준)
+        seed_core = re.sub(r'[^\w가-힣]', '', seed_keyword)
+        self.seed_first = seed_core[0] if len(seed_core) >= 2 else None
+
+        terms = {term for term in get_related_terms(seed_keyword) if term}
+        # 긴 용어 우선으로 alternation 구성
+        self.related_regex = _combine(
+            [re.escape(t) for t in sorted(terms, key=len, reverse=True)]
+        )
+
+    def __call__(self, keyword):
+        """단일 키워드 관련성 판정"""
+        # 1. 너무 짧거나 긴 키워드 제외
+        if len(keyword) < 2 or len(keyword) > 50:
+            return False
+
+        # 2. UI 요소/네비게이션 제외
+        if self.ui_regex.search(keyword):
+            return False
+
+        # 3. 깨진 문자/특수문자 제외
+        if self.broken_regex.search(keyword):
             return False
 
-    # 3. 깨진 문자/특수문자 제외
-    if re.search(r"[鹹赽鎗跺湮齪秷夔鎮肭楷珋岆樑億]", keyword):
-        return False
-    if re.search(r"[\u4e00-\u9fff]{5,}", keyword):  # 연속 한자 5개 이상
-        return False
-
-    # 4. 명확히 무관한 주제 패턴
-    noise_patterns = [
-        r"게임", r"영화", r"드라마", r"노래", r"음악",
-        r"요리", r"레시피", r"맛집", r"여행",
-        r"축구", r"야구", r"농구", r"스포츠",
-        r"가연성", r"누출사고", r"가스.*누출",
-        r"kijul", r"개걸스럽다"
-    ]
-
-    for pattern in noise_patterns:
-        if re.search(pattern, keyword, re.IGNORECASE) and not re.search(pattern, seed_keyword, re.IGNORECASE):
+        # 4. 명확히 무관한 주제 패턴
+        if self.noise_regex and self.noise_regex.search(keyword):
             return False
 
-    # 5. 시드 키워드와 전혀 관련 없는지 체크 (한글 기준)
-    # 시드의 핵심 단어가 키워드에 포함되어야 함
-    seed_core = re.sub(r'[^\w가-힣]', '', seed_keyword)
-    if len(seed_core) >= 2:
-        # 시드 키워드의 첫 글자라도 포함되어 있는지
-        if seed_core[0] not in keyword and seed_keyword not in keyword:
-            # 완전히 무관해 보이면 추가 검사
-            related_terms = get_related_terms(seed_keyword)
-            if not any(term in keyword for term in related_terms):
-                return False
+        # 5. 시드 키워드와 전혀 관련 없는지 체크
+        if self.seed_first is not None:
+            if self.seed_first not in keyword and self.seed_keyword not in keyword:
+                if not (self.related_regex and self.related_regex.search(keyword)):
+                    return False
 
-    return True
+        return True
+
+    def filter_batch(self, keywords):
+        """키워드 묶음에서 관련 키워드만 set으로 반환"""
+        return {kw for kw in keywords if self(kw)}
+
+
+@lru_cache(maxsize=32)
+def get_relevance_filter(seed_keyword):
+    """시드별 RelevanceFilter 캐시"""
+    return RelevanceFilter(seed_keyword)
+
+
+def is_relevant_keyword(keyword, seed_keyword):
+    """시드 키워드와 관련 없는 노이즈 필터링"""
+    return get_relevance_filter(seed_keyword)(keyword)
 
 
 def get_related_terms(seed_keyword):
     """시드 키워드와 관련된 용어 목록"""
-    # 시드별 관련 용어 매핑
-    related_map = {
-        "퇴직금": ["퇴직", "퇴사", "이직", "근로", "급여", "임금", "고용", "노동", "연금", "IRP", "DC", "DB"],
-        "연말정산": ["소득", "공제", "세금", "세액", "연봉", "급여", "원천징수"],
-        "실업급여": ["고용보험", "실업", "구직", "이직", "퇴사"],
-    }
-
     # 기본 관련 용어
     base_terms = seed_keyword.split() + [seed_keyword]
 
     # 매핑된 관련 용어 추가
-    for key, terms in related_map.items():
+    for key, terms in RELATED_MAP.items():
         if key in seed_keyword:
             base_terms.extend(terms)
 
@@ -315,7 +371,7 @@ def collect_all_portals(keyword):
 
     # 노이즈 필터링 (시드 키워드와 무관한 키워드 제거)
     if SEED_KEYWORD:
-        filtered = {kw for kw in all_results if is_relevant_keyword(kw, SEED_KEYWORD)}
+        filtered = get_relevance_filter(SEED_KEYWORD).filter_batch(all_results)
         removed = len(all_results) - len(filtered)
         if removed > 0:
             print(f"    - 노이즈 제거: {removed}개")
@@ -325,6 +381,17 @@ def collect_all_portals(keyword):
 
 
 # === 꼬리물기 (재귀 확장) ===
+def drop_seen(keywords, seen_keys):
+    """정규화 키 기준으로 이미 수집된 키워드 제거 (seen_keys 갱신)"""
+    fresh = set()
+    for kw in sorted(keywords, key=default_rank):
+        key = compact_key(kw)
+        if key and key not in seen_keys:
+            seen_keys.add(key)
+            fresh.add(kw)
+    return fresh
+
+
 def collect_with_tail_biting(seed_keyword, max_depth=2, max_expand=15):
     """
     꼬리물기: 연관검색어의 연관검색어를 재귀적으로 수집
@@ -337,13 +404,14 @@ def collect_with_tail_biting(seed_keyword, max_depth=2, max_expand=15):
     global SEED_KEYWORD
     SEED_KEYWORD = seed_keyword  # 노이즈 필터용 시드 설정
     all_keywords = {seed_keyword}  # 중복 방지용 전체 집합
+    seen_keys = {compact_key(seed_keyword)}  # 띄어쓰기/조사만 다른 키워드 중복 방지
     level_keywords = {0: {seed_keyword}}  # 레벨별 키워드
 
     print(f"\n🔥 [1단계] '{seed_keyword}' 1차 수집 중...")
 
     # 1단계: 시드 키워드에서 수집
     level1 = collect_all_portals(seed_keyword)
-    level1 = level1 - all_keywords  # 중복 제거
+    level1 = drop_seen(level1, seen_keys)  # 중복 제거
     all_keywords.update(level1)
     level_keywords[1] = level1
 
@@ -360,7 +428,7 @@ def collect_with_tail_biting(seed_keyword, max_depth=2, max_expand=15):
         for i, kw in enumerate(prev_level):
             print(f"  [{i+1}/{len(prev_level)}] 확장: '{kw}'")
             new_keywords = collect_all_portals(kw)
-            new_keywords = new_keywords - all_keywords  # 중복 제거
+            new_keywords = drop_seen(new_keywords, seen_keys)  # 중복 제거
             current_level.update(new_keywords)
             all_keywords.update(new_keywords)
             time.sleep(random.uniform(0.3, 0.7))
@@ -372,45 +440,55 @@ def collect_with_tail_biting(seed_keyword, max_depth=2, max_expand=15):
 
 
 # === 허브-스포크 구조 분류 ===
+LEVEL_NAMES = {1: "스포크", 2: "서브스포크"}  # 3단계+ = 슈퍼롱테일
+
+
 def classify_structure(seed_keyword, level_keywords):
     """
     허브 → 스포크 → 서브스포크 → 슈퍼롱테일 구조 자동 분류
+
+    전체 키워드를 유사 키워드 클러스터로 묶은 뒤 (띄어쓰기/조사/접미어 차이),
+    각 클러스터를 가장 얕은 단계에 배치하고 대표 키워드만 단계 목록에 올린다.
     """
     structure = {
         "허브": seed_keyword,
         "스포크": [],        # 1단계 (메인 연관)
         "서브스포크": [],    # 2단계 (세부 연관)
-        "슈퍼롱테일": []     # 3단계+ (초롱테일)
+        "슈퍼롱테일": [],    # 3단계+ (초롱테일)
+        "클러스터": []       # [{"대표", "단계", "변형"}]
     }
 
-    # 1단계 = 스포크
-    if 1 in level_keywords:
-        structure["스포크"] = sorted(list(level_keywords[1]))
+    # 키워드별 최초 등장 단계
+    first_level = {}
+    for depth in sorted(level_keywords):
+        if depth == 0:
+            continue
+        for kw in level_keywords[depth]:
+            first_level.setdefault(kw, depth)
+
+    # 얕은 단계 → 짧은 키워드 순으로 대표 선정
+    clusters = cluster_keywords(
+        first_level,
+        rank=lambda kw: (first_level[kw],) + default_rank(kw)
+    )
 
-    # 2단계 = 서브스포크
-    if 2 in level_keywords:
-        structure["서브스포크"] = sorted(list(level_keywords[2]))
+    hub_key = compact_key(seed_keyword)
+    for cluster in clusters:
+        # 허브와 같은 클러스터는 허브에 흡수
+        if compact_key(cluster["대표"]) == hub_key:
+            continue
+        depth = first_level[cluster["대표"]]
+        cluster["단계"] = depth
+        structure[LEVEL_NAMES.get(depth, "슈퍼롱테일")].append(cluster["대표"])
+        structure["클러스터"].append(cluster)
 
-    # 3단계+ = 슈퍼롱테일
-    super_longtail = set()
-    for depth in range(3, max(level_keywords.keys()) + 1):
-        if depth in level_keywords:
-            super_longtail.update(level_keywords[depth])
-    structure["슈퍼롱테일"] = sorted(list(super_longtail))
+    for name in ("스포크", "서브스포크", "슈퍼롱테일"):
+        structure[name].sort()
+    structure["클러스터"].sort(key=lambda c: (c["단계"], c["대표"]))
 
     return structure
 
 
-# === 파일 슬러그 변환 ===
-def to_slug(keyword):
-    """키워드를 파일명용 슬러그로 변환"""
-    # 공백 → 하이픈
-    slug = keyword.replace(" ", "-")
-    # 특수문자 제거
-    slug = re.sub(r'[^\w가-힣-]', '', slug)
-    return slug
-
-
 # === 결과 저장 ===
 def save_results(seed_keyword, all_keywords, structure):
     """결과를 JSON 파일로 저장"""
@@ -434,6 +512,7 @@ def save_results(seed_keyword, all_keywords, structure):
             "2단계_서브스포크": structure["서브스포크"][:30],
             "3단계_슈퍼롱테일": structure["슈퍼롱테일"][:50]
         },
+        "클러스터": structure["클러스터"],
         "전체_키워드": sorted(list(all_keywords))
     }
 
@@ -1,11 +1,19 @@
 #!/usr/bin/env python3
 """
-CloudConvert API를 사용한 HWP 파일 변환
+CloudConvert API를 사용한 HWP 파일 변환 (일괄 모드)
 
 CloudConvert는 HWP → PDF, DOCX 직접 변환을 지원합니다.
 
+- 파일당 작업(job) 하나: 한 번 업로드 → 모든 형식으로 변환 태스크 분기 → 결과를 한 번에 내보내기
+  (예전처럼 형식마다 작업을 만들어 같은 HWP를 다시 올리지 않음)
+- 여러 파일의 작업을 동시에 제출 (--jobs), 완료 대기는 점점 간격을 늘려 조회 (backoff)
+- 같은 내용의 HWP를 이미 변환했으면 API 호출 없이 양식 저장소의 결과 재사용
+- API 주소를 바꿀 수 있어 로컬 스텁 서버(cloudconvert-stub.py)로 시험 가능
+    python cloudconvert-stub.py --port 8765 &
+    CLOUDCONVERT_API_KEY=test python convert-hwp-cloudconvert.py --all --api-url http://127.0.0.1:8765/v2
+
 설치:
-    pip install cloudconvert
+    pip install requests
 
 API 키 발급:
     1. https://cloudconvert.com 가입
@@ -16,22 +24,16 @@ API 키 발급:
     - 매일 25분 변환 시간 무료
     - Sandbox API로 무제한 테스트 가능
 
-참고: https://github.com/cloudconvert/cloudconvert-python
+참고: https://cloudconvert.com/api/v2
 """
 
 import os
 import sys
 import time
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import argparse
 
-try:
-    import cloudconvert
-except ImportError:
-    print("cloudconvert 패키지가 필요합니다.")
-    print("설치: pip install cloudconvert")
-    sys.exit(1)
-
 try:
     import requests
 except ImportError:
@@ -40,13 +42,157 @@ except ImportError:
     sys.exit(1)
 
 
+from form_store import FormStore, sha256_file, split_name, sync_downloads
+from form_download import check_magic, DownloadError
+
 # 프로젝트 경로
 PROJECT_ROOT = Path(__file__).parent.parent
 PUBLIC_FILES = PROJECT_ROOT / "public" / "files" / "forms"
 
+API_URL = "https://api.cloudconvert.com/v2"
+SANDBOX_API_URL = "https://api.sandbox.cloudconvert.com/v2"
+
+DEFAULT_FORMATS = ["pdf", "docx"]
+DEFAULT_CONCURRENCY = 4
+
+# 완료 대기: 1초부터 1.5배씩 최대 15초 간격으로 조회
+POLL_INITIAL = 1.0
+POLL_FACTOR = 1.5
+POLL_MAX = 15.0
+JOB_TIMEOUT = 600      # 작업 하나 최대 대기 (초)
+REQUEST_TIMEOUT = 60
+RETRY_STATUS = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+
+CONVERTER = "CloudConvert"
+
+
+class CloudConvertError(Exception):
+    """API 오류 / 작업 실패"""
+
+
+class CloudConvertClient:
+    """CloudConvert v2 작업 API (requests 세션 재사용, 스레드마다 공유 가능)"""
+
+    def __init__(self, api_key, api_url=API_URL, timeout=REQUEST_TIMEOUT):
+        self.api_url = api_url.rstrip("/")
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({"Authorization": f"Bearer {api_key}"})
 
-def setup_api(sandbox: bool = False):
-    """CloudConvert API 설정"""
+    def _request(self, method, path, **kwargs):
+        """API 호출 → 응답의 data (429/5xx는 Retry-After 또는 backoff 후 재시도)"""
+        delay = POLL_INITIAL
+        for attempt in range(MAX_RETRIES + 1):
+            try:
+                response = self.session.request(method, f"{self.api_url}{path}", timeout=self.timeout, **kwargs)
+            except requests.RequestException as e:
+                if attempt == MAX_RETRIES:
+                    raise CloudConvertError(f"{method} {path} 실패: {e}") from e
+            else:
+                if response.status_code not in RETRY_STATUS or attempt == MAX_RETRIES:
+                    break
+                retry_after = response.headers.get("Retry-After", "")
+                delay = float(retry_after) if retry_after.isdigit() else delay
+            time.sleep(delay)
+            delay = min(delay * POLL_FACTOR, POLL_MAX)
+
+        if response.status_code >= 400:
+            try:
+                message = response.json().get("message", response.text)
+            except ValueError:
+                message = response.text
+            raise CloudConvertError(f"{method} {path} → HTTP {response.status_code}: {' '.join(str(message).split())[:200]}")
+        return response.json()["data"]
+
+    def create_job(self, payload):
+        return self._request("POST", "/jobs", json=payload)
+
+    def get_job(self, job_id):
+        return self._request("GET", f"/jobs/{job_id}")
+
+    def upload(self, task, path):
+        """import/upload 태스크의 업로드 폼으로 파일 전송 (폼 주소는 API 밖이라 인증 헤더 없이)"""
+        form = (task.get("result") or {}).get("form")
+        if not form:
+            raise CloudConvertError("업로드 폼 없음")
+        with open(path, "rb") as f:
+            response = requests.post(
+                form["url"], data=form.get("parameters") or {}, files={"file": (Path(path).name, f)},
+                timeout=self.timeout,
+            )
+        if response.status_code >= 400:
+            raise CloudConvertError(f"업로드 실패 HTTP {response.status_code}")
+
+    def wait(self, job_id, timeout=JOB_TIMEOUT):
+        """작업 완료까지 조회 간격을 늘려 가며 대기 → 완료된 작업 (실패/시간 초과면 예외)"""
+        deadline = time.monotonic() + timeout
+        delay = POLL_INITIAL
+        while True:
+            job = self.get_job(job_id)
+            if job["status"] == "finished":
+                return job
+            if job["status"] == "error":
+                errors = [
+                    f"{task['name']}: {task.get('message') or task.get('code')}"
+                    for task in job.get("tasks", []) if task.get("status") == "error"
+                ]
+                raise CloudConvertError("작업 실패 - " + ("; ".join(errors) or "원인 불명"))
+            if time.monotonic() + delay > deadline:
+                raise CloudConvertError(f"작업 대기 시간 초과 ({timeout}초)")
+            time.sleep(delay)
+            delay = min(delay * POLL_FACTOR, POLL_MAX)
+
+    def download(self, url, save_path, ext):
+        """결과 파일 → save_path (.part로 받은 뒤 시그니처 확인 후 교체)"""
+        part_path = save_path.with_name(save_path.name + ".part")
+        with requests.get(url, stream=True, timeout=self.timeout) as response:
+            if response.status_code >= 400:
+                raise DownloadError(f"HTTP {response.status_code}")
+            with open(part_path, "wb") as f:
+                for chunk in response.iter_content(64 * 1024):
+                    f.write(chunk)
+        with open(part_path, "rb") as f:
+            head = f.read(16)
+        if not check_magic(head, ext):
+            part_path.unlink()
+            raise DownloadError(f"{ext.upper()} 형식이 아님")
+        os.replace(part_path, save_path)
+        return save_path
+
+
+def job_payload(file_name, formats, input_format="hwp"):
+    """업로드 1회 → 형식별 변환 태스크 → 결과 내보내기 1회"""
+    tasks = {"upload-file": {"operation": "import/upload"}}
+    for fmt in formats:
+        tasks[f"convert-{fmt}"] = {
+            "operation": "convert",
+            "input": "upload-file",
+            "input_format": input_format,
+            "output_format": fmt,
+        }
+    tasks["export-files"] = {
+        "operation": "export/url",
+        "input": [f"convert-{fmt}" for fmt in formats],
+    }
+    return {"tasks": tasks, "tag": file_name}
+
+
+def exported_files(job, formats):
+    """완료된 작업의 내보내기 결과 → {형식: 다운로드 URL}"""
+    urls = {}
+    for task in job["tasks"]:
+        if task["operation"] != "export/url" or not task.get("result"):
+            continue
+        for file_info in task["result"].get("files", []):
+            ext = Path(file_info.get("filename", "")).suffix.lower().lstrip(".")
+            if ext in formats and file_info.get("url"):
+                urls[ext] = file_info["url"]
+    return urls
+
+
+def setup_api(sandbox: bool = False, api_url: str = None):
+    """CloudConvert API 클라이언트 (API 키 없으면 None)"""
     api_key = os.environ.get("CLOUDCONVERT_API_KEY")
 
     if not api_key:
@@ -55,101 +201,155 @@ def setup_api(sandbox: bool = False):
         print("  Windows: set CLOUDCONVERT_API_KEY=your_api_key")
         print("  Linux/Mac: export CLOUDCONVERT_API_KEY=your_api_key")
         print("\nAPI 키 발급: https://cloudconvert.com/dashboard/api/v2/keys")
-        return False
+        return None
 
-    cloudconvert.configure(
-        api_key=api_key,
-        sandbox=sandbox  # True면 테스트용 (무제한, 결과물 워터마크)
-    )
-    return True
+    # sandbox: 테스트용 (무제한, 결과물 워터마크)
+    return CloudConvertClient(api_key, api_url or (SANDBOX_API_URL if sandbox else API_URL))
 
 
-def convert_hwp_to_formats(hwp_path: Path, output_dir: Path, formats: list = ["pdf", "docx"]) -> dict:
-    """HWP 파일을 여러 포맷으로 변환"""
-    print(f"\n📄 변환: {hwp_path.name}")
+def reuse_conversions(name: str, output_dir: Path, formats, store, source_sha, use_store) -> dict:
+    """이미 변환한 형식은 저장소 결과로 채움 → {형식: 경로}"""
+    results = {}
+    for fmt in formats:
+        cached = store.cached_conversion(source_sha, fmt)
+        if not cached:
+            continue
+        out_name = f"{name}.{fmt}"
+        if use_store:
+            store.link(out_name, cached)
+            results[fmt] = store.path_for(out_name)
+        else:
+            results[fmt] = output_dir / out_name
+            results[fmt].write_bytes(store.blob_path(cached, fmt).read_bytes())
+        print(f"  ♻️ {name} {fmt.upper()} 변환 결과 재사용")
+    return results
 
-    results = {"hwp": hwp_path}
 
+def run_job(client: CloudConvertClient, name: str, hwp_path: Path, output_dir: Path, formats, store, source_sha,
+            use_store) -> dict:
+    """
+    HWP 하나: 작업 생성 → 업로드 1회 → 완료 대기 → 형식별 결과 저장 → {형식: 경로}
+    name은 양식 이름 (저장소 blob은 파일명이 해시라 결과 파일명은 name 기준)
+    """
+    input_format = hwp_path.suffix.lower().lstrip(".") or "hwp"
+    job = client.create_job(job_payload(f"{name}.{input_format}", formats, input_format))
+    upload_task = next((task for task in job["tasks"] if task["name"] == "upload-file"), None)
+    if not upload_task:
+        raise CloudConvertError("업로드 태스크 생성 실패")
+    client.upload(upload_task, hwp_path)
+    print(f"  ⬆️ {name} 업로드 → {', '.join(fmt.upper() for fmt in formats)} 변환 대기")
+
+    job = client.wait(job["id"])
+    urls = exported_files(job, formats)
+
+    results = {}
     for fmt in formats:
-        print(f"  → {fmt.upper()} 변환 중...")
-
+        if fmt not in urls:
+            print(f"    ✗ {name} {fmt.upper()} 결과 없음")
+            continue
+        output_path = output_dir / f"{name}.{fmt}"
         try:
-            # 1. Job 생성
-            job = cloudconvert.Job.create(payload={
-                "tasks": {
-                    "upload-file": {
-                        "operation": "import/upload"
-                    },
-                    "convert-file": {
-                        "operation": "convert",
-                        "input": "upload-file",
-                        "output_format": fmt
-                    },
-                    "export-file": {
-                        "operation": "export/url",
-                        "input": "convert-file"
-                    }
-                }
-            })
-
-            # 2. 파일 업로드
-            upload_task = None
-            for task in job["tasks"]:
-                if task["name"] == "upload-file":
-                    upload_task = task
-                    break
+            client.download(urls[fmt], output_path, fmt)
+        except (DownloadError, requests.RequestException) as e:
+            print(f"    ✗ {name} {fmt.upper()} 다운로드 실패: {e}")
+            continue
+        if use_store:
+            out_sha, _ = store.add_file(output_path)
+            store.record_conversion(source_sha, fmt, out_sha, CONVERTER)
+            results[fmt] = store.path_for(output_path.name)
+        else:
+            # 저장소 밖 출력(-o)은 저장소 이름/변환 기록을 건드리지 않음
+            results[fmt] = output_path
+        print(f"    ✓ {fmt.upper()} 저장: {output_path.name}")
+    return results
 
-            if not upload_task:
-                print(f"    ✗ 업로드 태스크 생성 실패")
-                continue
 
-            # 업로드 실행
-            cloudconvert.Task.upload(
-                file_name=hwp_path.name,
-                task=upload_task,
-                file=open(hwp_path, "rb")
-            )
+def share_results(job_results: dict, name: str, output_dir: Path, store, use_store) -> dict:
+    """같은 내용의 다른 양식에 작업 결과를 나눠 줌 (업로드/변환 없이) → {형식: 경로}"""
+    results = {}
+    for fmt, path in job_results.items():
+        out_name = f"{name}.{fmt}"
+        if use_store:
+            store.link(out_name, Path(path).stem)  # blob 파일명이 곧 sha256
+            results[fmt] = store.path_for(out_name)
+        else:
+            results[fmt] = output_dir / out_name
+            if results[fmt] != path:
+                results[fmt].write_bytes(Path(path).read_bytes())
+    return results
 
-            # 3. 완료 대기
-            job = cloudconvert.Job.wait(id=job["id"])
-
-            # 4. 결과 다운로드
-            for task in job["tasks"]:
-                if task["name"] == "export-file" and task.get("result"):
-                    for file_info in task["result"].get("files", []):
-                        download_url = file_info.get("url")
-                        if download_url:
-                            output_path = output_dir / f"{hwp_path.stem}.{fmt}"
-                            response = requests.get(download_url)
-                            with open(output_path, "wb") as f:
-                                f.write(response.content)
-                            results[fmt] = output_path
-                            print(f"    ✓ {fmt.upper()} 저장: {output_path.name}")
-
-        except cloudconvert.exceptions.APIError as e:
-            print(f"    ✗ API 오류: {e}")
-        except Exception as e:
-            print(f"    ✗ 오류: {e}")
 
-    return results
+def convert_batch(client: CloudConvertClient, sources, output_dir: Path, formats=DEFAULT_FORMATS,
+                  concurrency: int = DEFAULT_CONCURRENCY, store: FormStore = None) -> list:
+    """
+    HWP 여러 개를 동시에 변환 (원본 내용당 작업 하나, 동시 제출 concurrency개)
+    sources: {양식 이름: HWP 경로} 또는 HWP 경로 목록 (이름 = 파일명)
+    Returns: [{"name": 이름, "hwp": 경로, 형식: 경로 또는 없음}, ...]
+    """
+    store = store or FormStore.load()
+    use_store = output_dir.resolve() == PUBLIC_FILES.resolve()
+    if not isinstance(sources, dict):
+        sources = {Path(path).stem: Path(path) for path in sources}
+
+    results = {}
+    pending = {}  # 원본 sha256 → (없는 형식, 같은 내용의 양식 이름들) - 같은 내용은 한 번만 업로드
+    for name, hwp_path in sources.items():
+        source_sha = sha256_file(hwp_path)
+        results[name] = {"name": name, "hwp": hwp_path,
+                         **reuse_conversions(name, output_dir, formats, store, source_sha, use_store)}
+        missing = [fmt for fmt in formats if fmt not in results[name]]
+        if missing:
+            pending.setdefault(source_sha, (missing, []))[1].append(name)
+
+    if pending:
+        print(f"\n☁️ 작업 {len(pending)}개 제출 (동시 {min(concurrency, len(pending))}개)")
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(pending) or 1))) as pool:
+        futures = {
+            pool.submit(run_job, client, names[0], sources[names[0]], output_dir, missing, store, source_sha,
+                        use_store): names
+            for source_sha, (missing, names) in pending.items()
+        }
+        for future in as_completed(futures):
+            first, *duplicates = futures[future]
+            try:
+                job_results = future.result()
+                results[first].update(job_results)
+                for name in duplicates:
+                    results[name].update(share_results(job_results, name, output_dir, store, use_store))
+                    print(f"  ♻️ {name}: 같은 내용({first}) 작업 결과 공유")
+            except (CloudConvertError, requests.RequestException, OSError) as e:
+                # 한 파일의 오류로 나머지 작업이 멈추지 않도록
+                for name in futures[future]:
+                    print(f"    ✗ {name}: {e}")
+
+    if pending:
+        print(f"⏱️ API 변환 {len(pending)}개 {time.monotonic() - started:.1f}초")
+    return [results[name] for name in sources]
+
+
+def convert_hwp_to_formats(client: CloudConvertClient, hwp_path: Path, output_dir: Path, formats: list = DEFAULT_FORMATS) -> dict:
+    """HWP 파일 하나를 여러 포맷으로 변환 (업로드 1회)"""
+    print(f"\n📄 변환: {hwp_path.name}")
+    return convert_batch(client, [hwp_path], output_dir, formats, concurrency=1)[0]
 
 
-def convert_all_files(formats: list = ["pdf", "docx"]):
-    """public/files/forms/ 내 모든 HWP 파일 변환"""
+def convert_all_files(client: CloudConvertClient, formats: list = DEFAULT_FORMATS, concurrency: int = DEFAULT_CONCURRENCY):
+    """양식 저장소의 HWP + 아직 저장소로 옮기지 않은 public/files/forms/*.hwp 변환"""
     PUBLIC_FILES.mkdir(parents=True, exist_ok=True)
 
-    hwp_files = list(PUBLIC_FILES.glob("*.hwp"))
+    store = FormStore.load()
+    sources = {split_name(name)[0]: store.path_for(name) for name in store.names_with_ext("hwp")}
+    for hwp_path in PUBLIC_FILES.glob("*.hwp"):
+        sources.setdefault(hwp_path.stem, hwp_path)
 
-    if not hwp_files:
-        print(f"\n⚠️  HWP 파일이 없습니다: {PUBLIC_FILES}")
+    if not sources:
+        print(f"\n⚠️  HWP 파일이 없습니다 (양식 저장소, {PUBLIC_FILES})")
         return
 
-    print(f"\n🔄 총 {len(hwp_files)}개 파일 변환")
+    print(f"\n🔄 총 {len(sources)}개 파일 변환")
 
-    all_results = []
-    for hwp_file in hwp_files:
-        result = convert_hwp_to_formats(hwp_file, PUBLIC_FILES, formats)
-        all_results.append(result)
+    all_results = convert_batch(client, dict(sorted(sources.items())), PUBLIC_FILES, formats, concurrency, store)
 
     # 결과 요약
     print("\n" + "="*50)
@@ -157,20 +357,29 @@ def convert_all_files(formats: list = ["pdf", "docx"]):
     print("="*50)
 
     for result in all_results:
-        hwp_name = result["hwp"].stem
+        hwp_name = result["name"]
         status = " | ".join([
             f"{fmt.upper()}: {'✓' if result.get(fmt) else '✗'}"
             for fmt in formats
         ])
         print(f"  {hwp_name}: {status}")
 
+    # 변환 기록 → 양식 JSON 다운로드 경로
+    changed = sync_downloads(store)
+    if changed:
+        print(f"📝 JSON {changed}개 downloads 갱신 (변환 기록 기준)")
+
 
 def main():
     parser = argparse.ArgumentParser(description="CloudConvert API로 HWP 변환")
     parser.add_argument("input", nargs="?", help="HWP 파일 경로")
     parser.add_argument("--all", action="store_true", help="모든 HWP 파일 변환")
     parser.add_argument("--sandbox", action="store_true", help="Sandbox API 사용 (테스트용)")
-    parser.add_argument("--formats", default="pdf,docx", help="출력 포맷 (기본: pdf,docx)")
+    parser.add_argument("--api-url", default=os.environ.get("CLOUDCONVERT_API_URL"),
+                        help="API 주소 (기본: CloudConvert, 로컬 스텁: http://127.0.0.1:8765/v2)")
+    parser.add_argument("--formats", default=",".join(DEFAULT_FORMATS), help="출력 포맷 (기본: pdf,docx)")
+    parser.add_argument("--jobs", "-j", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"동시에 제출할 작업 수 (기본: {DEFAULT_CONCURRENCY})")
     parser.add_argument("-o", "--output", default=str(PUBLIC_FILES), help="출력 디렉토리")
 
     args = parser.parse_args()
@@ -179,10 +388,13 @@ def main():
     print("☁️  CloudConvert HWP 변환")
     print("="*50)
 
-    if not setup_api(sandbox=args.sandbox):
+    client = setup_api(sandbox=args.sandbox, api_url=args.api_url)
+    if not client:
         sys.exit(1)
 
-    if args.sandbox:
+    if args.api_url:
+        print(f"🔌 API: {client.api_url}")
+    elif args.sandbox:
         print("⚠️  Sandbox 모드 (테스트용, 워터마크 포함)")
 
     formats = [f.strip() for f in args.formats.split(",")]
@@ -190,13 +402,13 @@ def main():
     output_dir.mkdir(parents=True, exist_ok=True)
 
     if args.all:
-        convert_all_files(formats)
+        convert_all_files(client, formats, max(1, args.jobs))
     elif args.input:
         hwp_path = Path(args.input)
         if not hwp_path.exists():
             print(f"❌ 파일 없음: {hwp_path}")
             sys.exit(1)
-        convert_hwp_to_formats(hwp_path, output_dir, formats)
+        convert_hwp_to_formats(client, hwp_path, output_dir, formats)
     else:
         parser.print_help()
 
@@ -1,13 +1,17 @@
 #!/usr/bin/env python3
 """
-HWP 파일을 PDF, DOCX로 변환하는 스크립트
+HWP / HWPX 파일을 PDF, DOCX, PNG 썸네일로 변환하는 스크립트
 
-방법 1: pyhwp → ODT → LibreOffice → PDF/DOCX
+방법 1: pyhwp → ODT → LibreOffice → PDF/DOCX/PNG (ODT를 한 번 열어 모든 형식으로 내보냄)
+HWPX: hwp_reader(iterparse) → 단일 파일 ODT(.fodt) → 같은 LibreOffice 변환 백엔드
+      (LibreOffice는 HWPX를 직접 열지 못함, 확장자가 .hwp여도 내용이 zip이면 HWPX로 처리)
 방법 2: CloudConvert API (설정 시)
 
 사용법:
-    python convert-hwp.py <input.hwp> [--output-dir <dir>]
-    python convert-hwp.py --all  # public/files/forms/*.hwp 전체 변환
+    python convert-hwp.py <input.hwp|input.hwpx> [--output-dir <dir>]
+    python convert-hwp.py --all  # public/files/forms/*.hwp, *.hwpx 전체 변환
+    python convert-hwp.py --all --jobs 4  # LibreOffice 4개로 병렬 변환
+    python convert-hwp.py --all --force   # 변환 기록 무시하고 전부 다시 변환
 
 필요 패키지:
     pip install pyhwp
@@ -18,20 +22,37 @@ HWP 파일을 PDF, DOCX로 변환하는 스크립트
 참고:
     - pyhwp: https://github.com/mete0r/pyhwp
     - LibreOffice headless: soffice --headless --convert-to pdf
+    - 변환은 상주 LibreOffice 서버(office_server.py, UNO 소켓)로 처리
+      → 파일/형식마다 soffice를 새로 띄우지 않음 (uno 모듈이 없으면 1회 실행 방식)
+    - 변환 기록(data/form-store.json conversions): 원본 SHA-256 + 변환기 버전 → 결과 해시
+      → --all 재실행 시 새 양식/바뀐 양식/변환기가 바뀐 경우만 변환,
+        끝나면 기록으로 data/forms/*.json downloads(pdf/doc) 갱신
 """
 
-import os
 import sys
+import time
+import queue
+import threading
 import subprocess
 import argparse
 from pathlib import Path
 import shutil
 import tempfile
+from importlib import metadata
+
+from form_store import FormStore, sha256_file, split_name, sync_downloads
+from hwp_reader import iter_blocks, detect_kind, HwpError
+from odf_writer import write_fodt
+from office_server import open_office, find_soffice, HAS_UNO
 
 # 프로젝트 루트 경로
 PROJECT_ROOT = Path(__file__).parent.parent
 PUBLIC_FILES = PROJECT_ROOT / "public" / "files" / "forms"
 
+OUTPUT_FORMATS = ("pdf", "docx", "png")  # png: 첫 페이지 썸네일
+SOURCE_FORMATS = ("hwp", "hwpx")
+DEFAULT_TIMEOUT = 120  # LibreOffice 변환 1회 제한 (초)
+
 
 def check_dependencies():
     """필요한 도구들이 설치되어 있는지 확인"""
@@ -44,37 +65,34 @@ def check_dependencies():
     except ImportError:
         errors.append("pyhwp가 설치되지 않았습니다. 설치: pip install pyhwp")
 
-    # LibreOffice 확인
-    libreoffice_paths = [
-        r"C:\Program Files\LibreOffice\program\soffice.exe",
-        r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
-        "/usr/bin/soffice",
-        "/usr/bin/libreoffice",
-        "/Applications/LibreOffice.app/Contents/MacOS/soffice",
-    ]
-
-    soffice_path = None
-    for path in libreoffice_paths:
-        if os.path.exists(path):
-            soffice_path = path
-            break
-
+    # LibreOffice 확인 (설치 위치 → PATH)
+    soffice_path = find_soffice()
     if soffice_path:
         print(f"✓ LibreOffice 발견: {soffice_path}")
     else:
-        # PATH에서 찾기
-        soffice_path = shutil.which("soffice") or shutil.which("libreoffice")
-        if soffice_path:
-            print(f"✓ LibreOffice 발견: {soffice_path}")
-        else:
-            errors.append("LibreOffice가 설치되지 않았습니다. https://www.libreoffice.org/download/download/")
+        errors.append("LibreOffice가 설치되지 않았습니다. https://www.libreoffice.org/download/download/")
+
+    # UNO 확인 (없어도 변환은 가능, 느릴 뿐)
+    if HAS_UNO:
+        print("✓ uno 모듈 사용 가능 (상주 변환 서버)")
+    else:
+        print("- uno 모듈 없음 (변환마다 soffice 실행, 설치: apt install python3-uno)")
 
     return errors, soffice_path
 
 
+def converter_version(office) -> str:
+    """변환 기록용 변환기 버전 ('pyhwp 0.1b15 + LibreOffice 7.6.4.1')"""
+    try:
+        pyhwp = f"pyhwp {metadata.version('pyhwp')}"
+    except metadata.PackageNotFoundError:
+        pyhwp = "pyhwp 없음"
+    return f"{pyhwp} + {office.version}"
+
+
 def hwp_to_odt(hwp_path: Path, output_dir: Path) -> Path:
     """pyhwp를 사용하여 HWP를 ODT로 변환"""
-    print(f"  [1/3] HWP → ODT 변환 중...")
+    print(f"  [1/2] HWP → ODT 변환 중...")
 
     odt_path = output_dir / f"{hwp_path.stem}.odt"
 
@@ -106,156 +124,189 @@ def hwp_to_odt(hwp_path: Path, output_dir: Path) -> Path:
         return None
 
 
-def odt_to_pdf(odt_path: Path, output_dir: Path, soffice_path: str) -> Path:
-    """LibreOffice를 사용하여 ODT를 PDF로 변환"""
-    print(f"  [2/3] ODT → PDF 변환 중...")
+def hwpx_to_fodt(hwpx_path: Path, output_dir: Path, title: str = None) -> Path:
+    """HWPX 본문(문단/표)을 스트리밍으로 읽어 단일 파일 ODT 작성"""
+    print(f"  [1/2] HWPX → ODT 변환 중...")
 
+    fodt_path = output_dir / f"{hwpx_path.stem}.fodt"
     try:
-        result = subprocess.run(
-            [
-                soffice_path,
-                "--headless",
-                "--convert-to", "pdf",
-                "--outdir", str(output_dir),
-                str(odt_path)
-            ],
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
-
-        pdf_path = output_dir / f"{odt_path.stem}.pdf"
-        if pdf_path.exists():
-            print(f"    ✓ PDF 생성: {pdf_path.name}")
-            return pdf_path
-        else:
-            print(f"    ✗ PDF 생성 실패: {result.stderr}")
-            return None
-
-    except subprocess.TimeoutExpired:
-        print("    ✗ 변환 시간 초과")
+        write_fodt(iter_blocks(hwpx_path), fodt_path, title=title)
+    except HwpError as e:
+        print(f"    ✗ HWPX 읽기 실패: {e}")
         return None
+    print(f"    ✓ ODT 생성: {fodt_path.name}")
+    return fodt_path
 
 
-def odt_to_docx(odt_path: Path, output_dir: Path, soffice_path: str) -> Path:
-    """LibreOffice를 사용하여 ODT를 DOCX로 변환"""
-    print(f"  [3/3] ODT → DOCX 변환 중...")
+def odt_to_formats(odt_path: Path, output_dir: Path, office, formats=OUTPUT_FORMATS) -> dict:
+    """ODT를 한 번 열어 모든 형식으로 내보내기 (LibreOffice 세션 1회)"""
+    print(f"  [2/2] ODT → {'/'.join(fmt.upper() for fmt in formats)} 변환 중...")
+
+    results = office.convert_all(odt_path, output_dir, formats)
+    for fmt, path in results.items():
+        if path:
+            print(f"    ✓ {fmt.upper()} 생성: {path.name}")
+    return results
 
-    try:
-        result = subprocess.run(
-            [
-                soffice_path,
-                "--headless",
-                "--convert-to", "docx",
-                "--outdir", str(output_dir),
-                str(odt_path)
-            ],
-            capture_output=True,
-            text=True,
-            timeout=120
-        )
 
-        docx_path = output_dir / f"{odt_path.stem}.docx"
-        if docx_path.exists():
-            print(f"    ✓ DOCX 생성: {docx_path.name}")
-            return docx_path
+def convert_hwp(hwp_path: Path, output_dir: Path, office, name: str = None, store: FormStore = None,
+                force: bool = False) -> dict:
+    """
+    HWP/HWPX 파일을 PDF, DOCX, PNG 썸네일(첫 페이지)로 변환
+
+    output_dir가 public/files/forms일 때만 결과를 양식 저장소(form_store)에 넣고 변환 기록을 남기고
+    (다른 폴더는 저장소 이름/blob을 건드리지 않음), 같은 내용의 HWP를 같은 변환기로 이미 변환한
+    형식은 변환 없이 결과 blob을 재사용 (없는 형식만 변환)
+    """
+    stem = name or hwp_path.stem
+    print(f"\n📄 변환 시작: {stem}{hwp_path.suffix}")
+
+    store = store or FormStore.load()
+    use_store = output_dir.resolve() == PUBLIC_FILES.resolve()
+    source_sha = sha256_file(hwp_path)
+    converter = converter_version(office)
+
+    results = {"hwp": hwp_path, "name": stem, "reused": False}
+    cached = {
+        fmt: None if force else store.cached_conversion(source_sha, fmt, converter)
+        for fmt in OUTPUT_FORMATS
+    }
+    for fmt, out_sha in cached.items():
+        if not out_sha:
+            continue
+        out_name = f"{stem}.{fmt}"
+        if use_store:
+            store.link(out_name, out_sha, save=False)
+            results[fmt] = store.path_for(out_name)
         else:
-            print(f"    ✗ DOCX 생성 실패: {result.stderr}")
-            return None
+            results[fmt] = output_dir / out_name
+            shutil.copy(store.blob_path(out_sha, fmt), results[fmt])
 
-    except subprocess.TimeoutExpired:
-        print("    ✗ 변환 시간 초과")
-        return None
+    missing = tuple(fmt for fmt in OUTPUT_FORMATS if not cached[fmt])
+    if not missing:
+        store.save()
+        print(f"  ♻️ 같은 원본의 변환 결과 재사용 (sha256 {source_sha[:12]})")
+        results["reused"] = True
+        return results
 
+    with tempfile.TemporaryDirectory() as temp_dir:
+        converted = convert_in_temp(hwp_path, Path(temp_dir), office, missing, title=stem)
+
+        for fmt in missing:
+            path = converted.get(fmt)
+            if not path:
+                results[fmt] = None
+                continue
+            out_name = f"{stem}.{fmt}"
+            if use_store:
+                # 결과는 원본 해시 기준으로 기록 → 다른 이름의 같은 서식도 재사용
+                out_sha, _ = store.add_file(path, out_name, save=False)
+                store.record_conversion(source_sha, fmt, out_sha, converter, save=False)
+                results[fmt] = store.path_for(out_name)
+            else:
+                # 저장소 밖 출력(임시 변환)은 이름을 바꾸거나 blob을 남기지 않음
+                results[fmt] = output_dir / out_name
+                shutil.copy(path, results[fmt])
+
+        store.save()
 
-def convert_hwp(hwp_path: Path, output_dir: Path, soffice_path: str) -> dict:
-    """HWP 파일을 PDF, DOCX로 변환"""
-    print(f"\n📄 변환 시작: {hwp_path.name}")
+    return results
 
-    results = {"hwp": hwp_path, "odt": None, "pdf": None, "docx": None}
 
-    # 임시 디렉토리 사용
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        # 1. HWP → ODT
-        odt_path = hwp_to_odt(hwp_path, temp_path)
-        if not odt_path:
-            print("  ✗ ODT 변환 실패, 대체 방법 시도...")
-            # 직접 LibreOffice로 HWP → PDF 시도
-            return convert_hwp_direct(hwp_path, output_dir, soffice_path)
-
-        # 2. ODT → PDF
-        pdf_path = odt_to_pdf(odt_path, temp_path, soffice_path)
-        if pdf_path:
-            final_pdf = output_dir / pdf_path.name
-            shutil.copy(pdf_path, final_pdf)
-            results["pdf"] = final_pdf
-
-        # 3. ODT → DOCX
-        docx_path = odt_to_docx(odt_path, temp_path, soffice_path)
-        if docx_path:
-            final_docx = output_dir / docx_path.name
-            shutil.copy(docx_path, final_docx)
-            results["docx"] = final_docx
+def convert_in_temp(hwp_path: Path, temp_path: Path, office, formats=OUTPUT_FORMATS, title: str = None) -> dict:
+    """
+    임시 디렉토리에서 HWP(X) → ODT 1회 → 모든 형식 변환 (실패 시 LibreOffice 직접 변환)
+    원본은 형식 수와 관계없이 한 번만 열림
+    """
+    try:
+        kind = detect_kind(hwp_path)
+    except HwpError as e:
+        print(f"  ✗ {e}")
+        return {}
 
-    return results
+    if kind == "hwpx":
+        fodt_path = hwpx_to_fodt(hwp_path, temp_path, title)
+        return odt_to_formats(fodt_path, temp_path, office, formats) if fodt_path else {}
+
+    # 1. HWP → ODT
+    odt_path = hwp_to_odt(hwp_path, temp_path)
+    if not odt_path:
+        print("  ✗ ODT 변환 실패, 대체 방법 시도...")
+        # 직접 LibreOffice로 HWP → PDF/DOCX/PNG 시도
+        return convert_hwp_direct(hwp_path, temp_path, office, formats)
+
+    # 2. ODT → PDF/DOCX/PNG
+    return odt_to_formats(odt_path, temp_path, office, formats)
 
 
-def convert_hwp_direct(hwp_path: Path, output_dir: Path, soffice_path: str) -> dict:
-    """LibreOffice로 직접 HWP → PDF/DOCX 변환 시도 (pyhwp 실패 시 대체)"""
+def convert_hwp_direct(hwp_path: Path, output_dir: Path, office, formats=OUTPUT_FORMATS) -> dict:
+    """LibreOffice로 직접 HWP → PDF/DOCX/PNG 변환 시도 (pyhwp 실패 시 대체, HWP는 한 번만 열림)"""
     print("  직접 변환 시도 (LibreOffice)...")
 
-    results = {"hwp": hwp_path, "pdf": None, "docx": None}
+    results = office.convert_all(hwp_path, output_dir, formats)
+    for fmt, path in results.items():
+        if path:
+            print(f"    ✓ {fmt.upper()} 직접 변환 성공")
+        else:
+            print(f"    ✗ {fmt.upper()} 직접 변환 실패")
 
-    # HWP → PDF
-    try:
-        subprocess.run(
-            [soffice_path, "--headless", "--convert-to", "pdf",
-             "--outdir", str(output_dir), str(hwp_path)],
-            capture_output=True, timeout=120
-        )
-        pdf_path = output_dir / f"{hwp_path.stem}.pdf"
-        if pdf_path.exists():
-            results["pdf"] = pdf_path
-            print(f"    ✓ PDF 직접 변환 성공")
-    except Exception as e:
-        print(f"    ✗ PDF 직접 변환 실패: {e}")
-
-    # HWP → DOCX
-    try:
-        subprocess.run(
-            [soffice_path, "--headless", "--convert-to", "docx",
-             "--outdir", str(output_dir), str(hwp_path)],
-            capture_output=True, timeout=120
-        )
-        docx_path = output_dir / f"{hwp_path.stem}.docx"
-        if docx_path.exists():
-            results["docx"] = docx_path
-            print(f"    ✓ DOCX 직접 변환 성공")
-    except Exception as e:
-        print(f"    ✗ DOCX 직접 변환 실패: {e}")
+    return {"hwp": hwp_path, **results}
 
-    return results
 
+def convert_all_hwp_files(office, jobs=1, force=False):
+    """
+    public/files/forms/ 내 모든 HWP/HWPX 파일 변환
 
-def convert_all_hwp_files(soffice_path: str):
-    """public/files/forms/ 내 모든 HWP 파일 변환"""
+    jobs > 1이면 작업 큐에서 파일을 꺼내는 변환 스레드 N개를 동시에 실행
+    (office는 jobs개 인스턴스로 열어야 실제로 병렬 처리됨 - 인스턴스마다 별도 프로필)
+    """
     PUBLIC_FILES.mkdir(parents=True, exist_ok=True)
 
-    hwp_files = list(PUBLIC_FILES.glob("*.hwp"))
-
-    if not hwp_files:
-        print(f"\n⚠️  {PUBLIC_FILES}에 HWP 파일이 없습니다.")
+    # 양식 저장소의 HWP/HWPX + 아직 저장소로 옮기지 않은 public/files/forms/*.hwp, *.hwpx
+    # (같은 이름이 둘 다 있으면 HWP 우선)
+    store = FormStore.load()
+    sources = {}
+    for ext in SOURCE_FORMATS:
+        for name in store.names_with_ext(ext):
+            sources.setdefault(split_name(name)[0], store.path_for(name))
+        for source_file in PUBLIC_FILES.glob(f"*.{ext}"):
+            sources.setdefault(source_file.stem, source_file)
+
+    if not sources:
+        print(f"\n⚠️  {PUBLIC_FILES}에 HWP/HWPX 파일이 없습니다.")
         print("먼저 HWP 파일을 해당 폴더에 넣어주세요.")
         return
 
-    print(f"\n🔄 총 {len(hwp_files)}개 HWP 파일 변환 시작")
-
-    all_results = []
-    for hwp_file in hwp_files:
-        result = convert_hwp(hwp_file, PUBLIC_FILES, soffice_path)
-        all_results.append(result)
+    jobs = max(1, min(jobs, len(sources)))
+    print(f"\n🔄 총 {len(sources)}개 HWP/HWPX 파일 변환 시작" + (f" (동시 {jobs}개)" if jobs > 1 else ""))
+
+    work = queue.Queue()
+    for item in sorted(sources.items()):
+        work.put(item)
+
+    results = {}
+    started = time.monotonic()
+
+    def worker():
+        while True:
+            try:
+                name, hwp_file = work.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                results[name] = convert_hwp(hwp_file, PUBLIC_FILES, office, name=name, store=store, force=force)
+            except Exception as e:
+                # 한 파일의 오류로 나머지 변환이 멈추지 않도록
+                print(f"  ✗ {name} 변환 오류: {e}")
+                results[name] = {"name": name, **{fmt: None for fmt in OUTPUT_FORMATS}}
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(jobs)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    all_results = [results[name] for name in sorted(results)]
 
     # 결과 요약
     print("\n" + "="*50)
@@ -263,21 +314,38 @@ def convert_all_hwp_files(soffice_path: str):
     print("="*50)
 
     for result in all_results:
-        hwp_name = result["hwp"].stem
+        hwp_name = result["name"]
         pdf_ok = "✓" if result.get("pdf") else "✗"
         docx_ok = "✓" if result.get("docx") else "✗"
-        print(f"  {hwp_name}: PDF {pdf_ok} | DOCX {docx_ok}")
+        png_ok = "✓" if result.get("png") else "✗"
+        print(f"  {hwp_name}: PDF {pdf_ok} | DOCX {docx_ok} | PNG {png_ok}")
+
+    reused = sum(1 for result in all_results if result.get("reused"))
+    print(f"\n♻️ 재사용 {reused}개 / 변환 {len(all_results) - reused}개 ⏱️ {time.monotonic() - started:.1f}초")
+
+    # 변환 기록 → 양식 JSON 다운로드 경로
+    changed = sync_downloads(store)
+    if changed:
+        print(f"📝 JSON {changed}개 downloads 갱신 (변환 기록 기준)")
 
 
 def main():
-    parser = argparse.ArgumentParser(description="HWP 파일을 PDF, DOCX로 변환")
-    parser.add_argument("input", nargs="?", help="변환할 HWP 파일 경로")
+    parser = argparse.ArgumentParser(description="HWP/HWPX 파일을 PDF, DOCX, PNG 썸네일로 변환")
+    parser.add_argument("input", nargs="?", help="변환할 HWP/HWPX 파일 경로")
     parser.add_argument("--output-dir", "-o", default=str(PUBLIC_FILES),
                        help="출력 디렉토리 (기본: public/files/forms/)")
     parser.add_argument("--all", action="store_true",
-                       help="public/files/forms/ 내 모든 HWP 파일 변환")
+                       help="public/files/forms/ 내 모든 HWP/HWPX 파일 변환")
     parser.add_argument("--check", action="store_true",
                        help="필요한 도구 설치 확인만")
+    parser.add_argument("--no-server", action="store_true",
+                       help="상주 LibreOffice 서버 대신 변환마다 soffice 실행")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                       help="--all 병렬 변환 수 (LibreOffice 인스턴스 수, 기본: 1)")
+    parser.add_argument("--force", action="store_true",
+                       help="변환 기록을 무시하고 다시 변환")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT,
+                       help=f"LibreOffice 변환 1회 제한 시간 (초, 기본: {DEFAULT_TIMEOUT})")
 
     args = parser.parse_args()
 
@@ -307,16 +375,22 @@ def main():
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    if args.all:
-        convert_all_hwp_files(soffice_path)
-    elif args.input:
-        hwp_path = Path(args.input)
-        if not hwp_path.exists():
-            print(f"❌ 파일을 찾을 수 없습니다: {hwp_path}")
-            sys.exit(1)
-        convert_hwp(hwp_path, output_dir, soffice_path)
-    else:
+    if not args.all and not args.input:
         parser.print_help()
+        return
+
+    hwp_path = Path(args.input) if args.input else None
+    if hwp_path and not hwp_path.exists():
+        print(f"❌ 파일을 찾을 수 없습니다: {hwp_path}")
+        sys.exit(1)
+
+    # LibreOffice는 한 번만 띄워 두고 모든 변환에 재사용
+    instances = max(1, args.jobs) if args.all else 1
+    with open_office(soffice_path, instances=instances, server=not args.no_server, timeout=args.timeout) as office:
+        if args.all:
+            convert_all_hwp_files(office, args.jobs, args.force)
+        else:
+            convert_hwp(hwp_path, output_dir, office, force=args.force)
 
 
 if __name__ == "__main__":
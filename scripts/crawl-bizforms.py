@@ -2,7 +2,16 @@
 # -*- coding: utf-8 -*-
 """
 비즈폼/예스폼 양식 키워드 수집 스크립트
-결과: data/form-keywords.csv
+- 카테고리별 병렬 수집 (워커 수 제한)
+- 새 항목이 없는 페이지에서 페이지네이션 조기 종료
+- 수집 즉시 누적 CSV에 새 키워드만 추가 (기존 기록 유지)
+결과: data/form-keywords.csv (+ data/form-keywords.index.json: 최초/최근 수집일, 카테고리, 출처)
+
+사용법:
+  python crawl-bizforms.py
+  python crawl-bizforms.py --workers 8 --max-pages 5
+  python crawl-bizforms.py --save-pages data/fixtures/bizforms   # 페이지 원본 저장
+  python crawl-bizforms.py --bench data/fixtures/bizforms        # 파싱 벤치마크
 """
 
 import requests
@@ -10,8 +19,20 @@ from bs4 import BeautifulSoup
 import csv
 import time
 import os
+import re
+import json
+import codecs
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+try:
+    import lxml.html as lxml_html
+    _LXML_PARSER = lxml_html.HTMLParser(encoding='utf-8')
+except ImportError:
+    lxml_html = None
+
 # 결과 저장 경로
 OUTPUT_DIR = os.path.join(os.path.dirname(__file__), '..', 'data')
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, 'form-keywords.csv')
@@ -78,133 +99,403 @@ BIZFORMS_CATEGORIES = [
     ("취업-경력기술서", "https://resume.bizforms.co.kr/statement-of-career.asp"),
 ]
 
-def get_page(url, retry=3):
-    """페이지 HTML 가져오기"""
+# 목록 링크 후보 (CSS 셀렉터 7개를 하나로 합친 것)
+LINK_SELECTOR = ', '.join([
+    'a.subject',  # 일반 목록
+    'td.subject a',
+    'div.subject a',
+    'a[href*="form_view"]',
+    'a[href*="view.asp"]',
+    'li a',
+    'td a',
+])
+# 같은 조건의 XPath (lxml 경로, 문서 1회 탐색)
+_SUBJECT_CLASS = "contains(concat(' ', normalize-space(@class), ' '), ' subject ')"
+LINK_XPATH = (
+    f"//a[{_SUBJECT_CLASS} or contains(@href, 'form_view') or contains(@href, 'view.asp')"
+    f" or ancestor::li or ancestor::td or ancestor::div[{_SUBJECT_CLASS}]]"
+)
+
+SKIP_WORDS = ['로그인', '회원가입', '더보기', '이전', '다음', '검색', '홈', '카테고리']
+
+# 인코딩 판별에 쓰는 앞부분 크기
+SNIFF_BYTES = 4096
+_HEADER_CHARSET_RE = re.compile(r'charset\s*=\s*["\']?([\w-]+)', re.I)
+_META_CHARSET_RE = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w-]+)', re.I)
+CHARSET_ALIASES = {
+    'euc-kr': 'cp949', 'euc_kr': 'cp949', 'euckr': 'cp949',
+    'ks_c_5601-1987': 'cp949', 'ksc5601': 'cp949', 'x-windows-949': 'cp949',
+}
+
+# 동시에 수집할 카테고리 수 (기본값)
+DEFAULT_WORKERS = 4
+
+_thread_local = threading.local()
+_print_lock = threading.Lock()
+
+
+def log(message):
+    """워커 스레드 출력이 섞이지 않도록 한 줄씩 출력"""
+    with _print_lock:
+        print(message, flush=True)
+
+
+def get_session():
+    """스레드별 requests 세션 (연결 재사용)"""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        session.headers.update(HEADERS)
+        _thread_local.session = session
+    return session
+
+
+def sniff_charset(content_type, head):
+    """
+    응답 인코딩 판별 (본문 전체를 디코딩하지 않음)
+
+    Content-Type 헤더 → BOM → 앞부분 <meta charset> → UTF-8 검사 순.
+    EUC-KR 계열은 확장 문자까지 읽을 수 있도록 cp949로 통일.
+    """
+    match = _HEADER_CHARSET_RE.search(content_type or '')
+    if not match:
+        if head.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        match = _META_CHARSET_RE.search(head)
+    if match:
+        name = match.group(1)
+        name = name.decode('ascii', 'ignore') if isinstance(name, bytes) else name
+        name = CHARSET_ALIASES.get(name.strip().lower(), name.strip().lower())
+        try:
+            return codecs.lookup(name).name
+        except LookupError:
+            pass
+
+    # 선언이 없으면 앞부분이 UTF-8로 읽히는지 확인 (끝에서 잘린 멀티바이트는 허용)
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'cp949'
+
+
+def get_page(url, retry=3, save_dir=None):
+    """페이지 HTML 가져오기 (save_dir 지정 시 원본 바이트를 벤치마크용으로 저장)"""
     for i in range(retry):
         try:
-            response = requests.get(url, headers=HEADERS, timeout=10)
-            # 인코딩 자동 감지 또는 EUC-KR 시도
-            if 'charset' in response.headers.get('Content-Type', ''):
-                response.encoding = response.apparent_encoding
-            else:
-                # EUC-KR 먼저 시도, 실패하면 UTF-8
-                try:
-                    response.content.decode('euc-kr')
-                    response.encoding = 'euc-kr'
-                except:
-                    response.encoding = 'utf-8'
-            return response.text
+            response = get_session().get(url, timeout=10)
+            content = response.content
+            if save_dir:
+                save_fixture(save_dir, url, content, response.headers.get('Content-Type', ''))
+            charset = sniff_charset(response.headers.get('Content-Type', ''), content[:SNIFF_BYTES])
+            return content.decode(charset, errors='replace')
         except Exception as e:
-            print(f"  재시도 {i+1}/{retry}: {e}")
+            log(f"  재시도 {i+1}/{retry}: {e}")
             time.sleep(2)
     return None
 
+
+def save_fixture(save_dir, url, content, content_type):
+    """수집 페이지를 fixture로 저장 (--bench 입력)"""
+    os.makedirs(save_dir, exist_ok=True)
+    name = re.sub(r'[^\w.-]+', '_', url.split('://', 1)[-1])[:150]
+    with open(os.path.join(save_dir, f"{name}.html"), 'wb') as f:
+        f.write(content)
+    with open(os.path.join(save_dir, f"{name}.content-type"), 'w', encoding='utf-8') as f:
+        f.write(content_type)
+
+
+def extract_link_texts(html):
+    """목록 후보 링크 텍스트 (한 번의 XPath 탐색, lxml이 없으면 BeautifulSoup)"""
+    if not html or not html.strip():
+        return []
+    if lxml_html is None:
+        return extract_link_texts_soup(html)
+    doc = lxml_html.fromstring(html.encode('utf-8'), parser=_LXML_PARSER)
+    # get_text(strip=True)와 같은 정규화 (텍스트 노드별 strip 후 구분자 없이 결합)
+    return [''.join(t.strip() for t in a.itertext()) for a in doc.xpath(LINK_XPATH)]
+
+
+def extract_link_texts_soup(html):
+    """BeautifulSoup 경로 (lxml 미설치 환경)"""
+    soup = BeautifulSoup(html, 'html.parser')
+    return [a.get_text(strip=True) for a in soup.select(LINK_SELECTOR)]
+
+
 def parse_bizforms_list(html, category):
     """비즈폼 목록 페이지에서 양식명 추출"""
     keywords = []
-    soup = BeautifulSoup(html, 'html.parser')
 
-    # 다양한 선택자 시도
-    selectors = [
-        'a.subject',  # 일반 목록
-        'td.subject a',
-        'div.subject a',
-        'a[href*="form_view"]',
-        'a[href*="view.asp"]',
-        'li a',
-        'td a',
-    ]
-
-    for selector in selectors:
-        links = soup.select(selector)
-        for link in links:
-            text = link.get_text(strip=True)
-            # 필터링: 빈 텍스트, 메뉴, 버튼 등 제외
-            if text and len(text) > 2 and len(text) < 100:
-                if not any(skip in text for skip in ['로그인', '회원가입', '더보기', '이전', '다음', '검색', '홈', '카테고리']):
-                    keywords.append({
-                        'keyword': text,
-                        'category': category,
-                        'source': 'bizforms'
-                    })
+    for text in extract_link_texts(html):
+        # 필터링: 빈 텍스트, 메뉴, 버튼 등 제외
+        if text and len(text) > 2 and len(text) < 100:
+            if not any(skip in text for skip in SKIP_WORDS):
+                keywords.append({
+                    'keyword': text,
+                    'category': category,
+                    'source': 'bizforms'
+                })
 
     return keywords
 
-def crawl_multiple_pages(base_url, category, max_pages=5):
-    """여러 페이지 크롤링"""
+
+def benchmark(fixture_dir, repeat=5):
+    """저장된 fixture 페이지로 인코딩 판별 + 파싱 속도 측정"""
+    pages = []
+    for name in sorted(os.listdir(fixture_dir)):
+        if not name.endswith('.html'):
+            continue
+        path = os.path.join(fixture_dir, name)
+        with open(path, 'rb') as f:
+            content = f.read()
+        ct_path = path[:-len('.html')] + '.content-type'
+        content_type = ''
+        if os.path.exists(ct_path):
+            with open(ct_path, encoding='utf-8') as f:
+                content_type = f.read().strip()
+        pages.append((content, content_type))
+
+    if not pages:
+        print(f"❌ fixture 없음: {fixture_dir} (--save-pages로 먼저 수집)")
+        return
+
+    def decode_all():
+        return [c.decode(sniff_charset(ct, c[:SNIFF_BYTES]), errors='replace') for c, ct in pages]
+
+    def timed(func, *args):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            result = func(*args)
+        return (time.perf_counter() - start) / repeat, result
+
+    decode_time, texts = timed(decode_all)
+    paths = [('soup(html.parser)', extract_link_texts_soup)]
+    if lxml_html is not None:
+        paths.insert(0, ('lxml(xpath)', extract_link_texts))
+
+    total_bytes = sum(len(c) for c, _ in pages)
+    print(f"📊 fixture {len(pages)}개 ({total_bytes / 1024:.0f}KB), {repeat}회 평균")
+    print(f"   인코딩 판별+디코딩: {decode_time * 1000 / len(pages):.2f}ms/페이지")
+    baseline = None
+    for label, func in paths:
+        elapsed, links = timed(lambda: [func(t) for t in texts])
+        per_page = elapsed * 1000 / len(pages)
+        baseline = baseline or per_page
+        print(f"   {label:<18} {per_page:8.2f}ms/페이지 | 링크 {sum(len(l) for l in links)}개"
+              f" | x{per_page / baseline:.1f}")
+
+
+def page_url(base_url, page):
+    """카테고리 URL의 페이지 번호 변경"""
+    if 'list_1.asp' in base_url:
+        return base_url.replace('list_1.asp', f'list_{page}.asp')
+    elif 'page=' in base_url:
+        return base_url.split('page=')[0] + f'page={page}'
+    return f"{base_url}&page={page}" if '?' in base_url else f"{base_url}?page={page}"
+
+
+def crawl_multiple_pages(base_url, category, max_pages=5, on_page=None, save_dir=None):
+    """
+    여러 페이지 크롤링
+
+    새 항목이 하나도 없는 페이지(빈 페이지, 마지막 페이지 반복)를 만나면 중단.
+    on_page가 주어지면 페이지마다 수집 결과를 바로 넘긴다.
+    """
     all_keywords = []
+    seen = set()
 
     for page in range(1, max_pages + 1):
-        # URL 페이지 번호 변경
-        if 'list_1.asp' in base_url:
-            url = base_url.replace('list_1.asp', f'list_{page}.asp')
-        elif 'page=' in base_url:
-            url = base_url.split('page=')[0] + f'page={page}'
-        else:
-            url = f"{base_url}&page={page}" if '?' in base_url else f"{base_url}?page={page}"
-
-        print(f"    페이지 {page}: {url}")
-        html = get_page(url)
+        url = page_url(base_url, page)
+        html = get_page(url, save_dir=save_dir)
 
         if html:
-            keywords = parse_bizforms_list(html, category)
-            if not keywords:
-                print(f"    → 더 이상 결과 없음")
+            fresh = []
+            for kw in parse_bizforms_list(html, category):
+                key = kw['keyword'].lower()
+                if key not in seen:
+                    seen.add(key)
+                    fresh.append(kw)
+            if not fresh:
+                log(f"    [{category}] 페이지 {page}: 새 항목 없음 → 중단")
                 break
-            all_keywords.extend(keywords)
-            print(f"    → {len(keywords)}개 수집")
+            all_keywords.extend(fresh)
+            log(f"    [{category}] 페이지 {page}: {len(fresh)}개 수집")
+            if on_page:
+                on_page(fresh)
 
         time.sleep(0.5)  # 서버 부하 방지
 
     return all_keywords
 
-def remove_duplicates(keywords):
-    """중복 제거"""
-    seen = set()
-    unique = []
-    for kw in keywords:
-        key = kw['keyword'].lower()
-        if key not in seen:
-            seen.add(key)
-            unique.append(kw)
-    return unique
-
-def save_to_csv(keywords, filepath):
-    """CSV 파일로 저장"""
-    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-    with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
-        writer = csv.DictWriter(f, fieldnames=['keyword', 'category', 'source'])
-        writer.writeheader()
-        writer.writerows(keywords)
-
-    print(f"\n✅ 저장 완료: {filepath}")
-    print(f"   총 {len(keywords)}개 키워드")
+
+class FormKeywordStore:
+    """
+    누적 양식 키워드 데이터셋 (스레드 안전)
+
+    - CSV: 키워드당 한 줄, 새 키워드만 끝에 추가 (기존 줄은 건드리지 않음)
+    - 인덱스 JSON: 키워드 → first_seen / last_seen / categories / sources
+      (dict 조회로 중복 확인, 재수집 시 last_seen과 카테고리/출처만 갱신)
+    """
+
+    FIELDNAMES = ['keyword', 'category', 'source', 'first_seen']
+
+    def __init__(self, filepath, index_path=None):
+        os.makedirs(os.path.dirname(os.path.abspath(filepath)), exist_ok=True)
+        self.filepath = filepath
+        self.index_path = index_path or os.path.splitext(filepath)[0] + '.index.json'
+        self.today = datetime.now().strftime('%Y-%m-%d')
+        self.lock = threading.Lock()
+        self.total = 0
+        self.added = 0
+        self.updated = set()
+
+        self._migrate_header()
+        self.index = self._load_index()
+        self.file = open(filepath, 'a', newline='', encoding='utf-8-sig' if self._is_new_file() else 'utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=self.FIELDNAMES, extrasaction='ignore')
+        if self._is_new_file():
+            self.writer.writeheader()
+            self.file.flush()
+
+    def _is_new_file(self):
+        return not os.path.exists(self.filepath) or os.path.getsize(self.filepath) == 0
+
+    def _read_rows(self):
+        if self._is_new_file():
+            return None, []
+        with open(self.filepath, newline='', encoding='utf-8-sig') as f:
+            reader = csv.DictReader(f)
+            return reader.fieldnames, list(reader)
+
+    def _migrate_header(self):
+        """이전 형식(keyword,category,source) CSV에 first_seen 열 추가 (1회)"""
+        fieldnames, rows = self._read_rows()
+        if fieldnames is None or fieldnames == self.FIELDNAMES:
+            return
+        tmp_path = self.filepath + '.tmp'
+        with open(tmp_path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.DictWriter(f, fieldnames=self.FIELDNAMES, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(tmp_path, self.filepath)
+
+    def _load_index(self):
+        """인덱스 로드 (없거나 CSV와 어긋나면 CSV에서 재구성)"""
+        index = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding='utf-8') as f:
+                index = json.load(f)
+
+        _, rows = self._read_rows()
+        if len(index) != len({row['keyword'].lower() for row in rows if row.get('keyword')}):
+            index = {}
+            for row in rows:
+                keyword = row.get('keyword')
+                if not keyword:
+                    continue
+                entry = index.setdefault(keyword.lower(), {
+                    'keyword': keyword,
+                    'first_seen': row.get('first_seen') or '',
+                    'last_seen': row.get('first_seen') or '',
+                    'categories': [],
+                    'sources': [],
+                })
+                for field, value in (('categories', row.get('category')), ('sources', row.get('source'))):
+                    if value and value not in entry[field]:
+                        entry[field].append(value)
+        return index
+
+    def write(self, keywords):
+        """키워드 병합, 새로 추가한 개수 반환"""
+        with self.lock:
+            count = 0
+            for kw in keywords:
+                self.total += 1
+                key = kw['keyword'].lower()
+                entry = self.index.get(key)
+                if entry is None:
+                    self.index[key] = {
+                        'keyword': kw['keyword'],
+                        'first_seen': self.today,
+                        'last_seen': self.today,
+                        'categories': [kw['category']],
+                        'sources': [kw['source']],
+                    }
+                    self.writer.writerow({**kw, 'first_seen': self.today})
+                    count += 1
+                    continue
+
+                entry['last_seen'] = self.today
+                if kw['category'] not in entry['categories']:
+                    entry['categories'].append(kw['category'])
+                if kw['source'] not in entry['sources']:
+                    entry['sources'].append(kw['source'])
+                self.updated.add(key)
+            self.file.flush()
+            self.added += count
+            return count
+
+    def save_index(self):
+        """인덱스 원자적 저장"""
+        tmp_path = self.index_path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.index_path)
+
+    def close(self):
+        self.file.close()
+        self.save_index()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
 
 def main():
+    parser = argparse.ArgumentParser(description='비즈폼 양식 키워드 수집')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='동시 수집 카테고리 수')
+    parser.add_argument('--max-pages', type=int, default=3, help='카테고리별 최대 페이지 수')
+    parser.add_argument('--output', default=OUTPUT_FILE, help='누적 CSV 경로 (새 키워드만 추가)')
+    parser.add_argument('--save-pages', metavar='DIR', help='수집한 원본 페이지를 fixture로 저장')
+    parser.add_argument('--bench', metavar='DIR', help='저장된 fixture로 파싱 벤치마크만 실행')
+    args = parser.parse_args()
+
+    if args.bench:
+        benchmark(args.bench)
+        return
+
     print("=" * 60)
     print("🔍 비즈폼 양식 키워드 수집 시작")
     print(f"   시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"   카테고리: {len(BIZFORMS_CATEGORIES)}개 | 워커: {args.workers}개")
     print("=" * 60)
 
-    all_keywords = []
-
-    for category, url in BIZFORMS_CATEGORIES:
-        print(f"\n📁 [{category}]")
-        keywords = crawl_multiple_pages(url, category, max_pages=3)
-        all_keywords.extend(keywords)
-        print(f"   소계: {len(keywords)}개")
-
-    # 중복 제거
-    unique_keywords = remove_duplicates(all_keywords)
-    print(f"\n📊 중복 제거: {len(all_keywords)} → {len(unique_keywords)}개")
+    start = time.time()
+    with FormKeywordStore(args.output) as store:
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            futures = {
+                executor.submit(crawl_multiple_pages, url, category, args.max_pages,
+                                store.write, args.save_pages): category
+                for category, url in BIZFORMS_CATEGORIES
+            }
+            for future in as_completed(futures):
+                category = futures[future]
+                try:
+                    keywords = future.result()
+                    log(f"📁 [{category}] 소계: {len(keywords)}개")
+                except Exception as e:
+                    log(f"❌ [{category}] 실패: {e}")
 
-    # 저장
-    save_to_csv(unique_keywords, OUTPUT_FILE)
+    print(f"\n📊 수집 {store.total}개 → 신규 {store.added}개 / 기존 갱신 {len(store.updated)}개")
+    print(f"\n✅ 저장 완료: {args.output}")
+    print(f"   누적 {len(store.index)}개 키워드 ({time.time() - start:.1f}초)")
+    print(f"   인덱스: {store.index_path}")
 
     print("\n" + "=" * 60)
     print(f"✅ 수집 완료!")
-    print(f"   파일 위치: {os.path.abspath(OUTPUT_FILE)}")
+    print(f"   파일 위치: {os.path.abspath(args.output)}")
     print("=" * 60)
 
 if __name__ == "__main__":
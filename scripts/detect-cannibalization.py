@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+키워드 카니발리제이션 탐지기
+- frontmatter keywords / title 기준으로 같은 검색어를 노리는 문서 찾기
+- 유사 키워드 클러스터 → 역색인으로 키워드를 공유하는 문서쌍만 집계 (전체 쌍 비교 없음)
+- 같은 검색어(클러스터)를 공유하는 경쟁 문서끼리 그룹으로 출력 (한 문서가 여러 그룹에 나올 수 있음)
+
+사용법:
+  python detect-cannibalization.py
+  python detect-cannibalization.py --min-shared 2 --min-score 0.6
+  python detect-cannibalization.py --json scripts/cannibalization-report.json
+"""
+
+import json
+import math
+import argparse
+from pathlib import Path
+from itertools import combinations
+
+from keyword_index import KeywordIndex, WIKI_DIR
+from keyword_normalize import cluster_keywords, compact_key
+
+# 전체 문서의 이 비율을 넘게 등장하는 키워드는 쌍 집계에서 제외 ('연말정산' 같은 범용 키워드)
+MAX_DOC_RATIO = 0.02
+MIN_POSTING_CAP = 10
+
+
+def build_doc_features(files):
+    """
+    문서별 키워드 클러스터 집합 구성
+
+    Returns:
+        doc_features: {slug: {cluster_id}}
+        title_cluster: {slug: cluster_id}
+        labels: {cluster_id: 대표 키워드}
+    """
+    terms_by_doc = {}
+    all_terms = set()
+    for slug, info in files.items():
+        terms = list(info.get("keywords") or [])
+        if info.get("title"):
+            terms.append(info["title"])
+        terms_by_doc[slug] = terms
+        all_terms.update(terms)
+
+    # 띄어쓰기/조사/접미어만 다른 키워드는 같은 클러스터로
+    key_to_cluster = {}
+    labels = {}
+    for cid, cluster in enumerate(cluster_keywords(all_terms)):
+        labels[cid] = cluster["대표"]
+        for kw in [cluster["대표"]] + cluster["변형"]:
+            key_to_cluster[compact_key(kw)] = cid
+
+    doc_features = {}
+    title_cluster = {}
+    for slug, terms in terms_by_doc.items():
+        features = {key_to_cluster[compact_key(t)] for t in terms if compact_key(t) in key_to_cluster}
+        doc_features[slug] = features
+        title = files[slug].get("title")
+        if title and compact_key(title) in key_to_cluster:
+            title_cluster[slug] = key_to_cluster[compact_key(title)]
+
+    return doc_features, title_cluster, labels
+
+
+def build_postings(doc_features):
+    """클러스터 → 문서 목록 역색인"""
+    postings = {}
+    for slug, features in doc_features.items():
+        for cid in features:
+            postings.setdefault(cid, []).append(slug)
+    return postings
+
+
+def find_overlapping_pairs(postings, max_posting):
+    """역색인으로 클러스터를 공유하는 문서쌍과 공유 클러스터 집계"""
+    shared = {}
+    skipped = 0
+    for cid, slugs in postings.items():
+        if len(slugs) < 2:
+            continue
+        if len(slugs) > max_posting:
+            skipped += 1
+            continue
+        for a, b in combinations(sorted(slugs), 2):
+            shared.setdefault((a, b), set()).add(cid)
+
+    return shared, skipped
+
+
+def score_pair(a, b, shared, doc_weights, weights, title_cluster):
+    """
+    겹침 점수: 공유 키워드 IDF 합 / 작은 쪽 문서의 IDF 합
+    (흔한 키워드를 공유할수록 점수가 덜 오름, 제목 클러스터 일치 시 1.0)
+    shared에는 상한 이하 클러스터만 있으므로, 범용 제목(상한 초과)은 1.0 처리하지 않음
+    """
+    title = title_cluster.get(a)
+    if title is not None and title == title_cluster.get(b) and title in shared:
+        return 1.0
+    smaller = min(doc_weights[a], doc_weights[b]) or 1.0
+    return sum(weights[cid] for cid in shared) / smaller
+
+
+def group_by_query(pairs):
+    """
+    경쟁 문서쌍을 공유 검색어(클러스터)별로 묶기 → [(검색어 목록, 문서쌍 목록)]
+    같은 검색어를 함께 노리는 문서만 한 그룹 (쌍을 이어 붙이면 A-B, B-C가 무관한 A-C까지 묶임)
+    문서 구성이 같은 검색어들은 한 그룹으로 합침
+    """
+    by_query = {}
+    for pair in pairs:
+        for query in pair["shared"]:
+            by_query.setdefault(query, []).append(pair)
+
+    groups = {}
+    for query, query_pairs in by_query.items():
+        docs = tuple(sorted({slug for p in query_pairs for slug in p["docs"]}))
+        queries, merged = groups.setdefault(docs, ([], {}))
+        queries.append(query)
+        for p in query_pairs:
+            merged[tuple(p["docs"])] = p
+    return [(queries, list(merged.values())) for queries, merged in groups.values()]
+
+
+def detect(files, min_shared=1, min_score=0.4):
+    """카니발리제이션 그룹 탐지 (공유 검색어별)"""
+    doc_features, title_cluster, labels = build_doc_features(files)
+    postings = build_postings(doc_features)
+
+    total = len(doc_features) or 1
+    weights = {cid: math.log(total / len(slugs)) + 1.0 for cid, slugs in postings.items()}
+    doc_weights = {slug: sum(weights[cid] for cid in features) for slug, features in doc_features.items()}
+
+    max_posting = max(MIN_POSTING_CAP, int(total * MAX_DOC_RATIO))
+    shared_map, skipped = find_overlapping_pairs(postings, max_posting)
+
+    pairs = []
+    for (a, b), shared in shared_map.items():
+        score = score_pair(a, b, shared, doc_weights, weights, title_cluster)
+        if len(shared) >= min_shared and score >= min_score:
+            pairs.append({
+                "docs": [a, b],
+                "score": round(score, 3),
+                "shared": sorted(labels[cid] for cid in shared),
+            })
+
+    groups = []
+    for queries, query_pairs in group_by_query(pairs):
+        groups.append({
+            "docs": sorted({slug for p in query_pairs for slug in p["docs"]}),
+            "max_score": max(p["score"] for p in query_pairs),
+            "queries": sorted(queries),
+            "pairs": sorted(query_pairs, key=lambda p: -p["score"]),
+        })
+
+    groups.sort(key=lambda g: (-g["max_score"], -len(g["docs"]), g["docs"][0]))
+    return groups, skipped, max_posting
+
+
+def main():
+    parser = argparse.ArgumentParser(description="키워드 카니발리제이션 탐지")
+    parser.add_argument("--wiki-dir", default=str(WIKI_DIR), help="wiki 문서 디렉토리")
+    parser.add_argument("--min-shared", type=int, default=1, help="공유 키워드 최소 개수")
+    parser.add_argument("--min-score", type=float, default=0.4, help="IDF 가중 겹침 점수 최소값 (0~1)")
+    parser.add_argument("--top", type=int, default=30, help="출력할 그룹 수")
+    parser.add_argument("--json", help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    index = KeywordIndex.load(args.wiki_dir)
+    groups, skipped, max_posting = detect(index.files, args.min_shared, args.min_score)
+
+    print("=" * 60)
+    print("키워드 카니발리제이션 리포트")
+    print("=" * 60)
+    print(f"문서: {len(index.files)}개 | 경쟁 그룹: {len(groups)}개")
+    if skipped:
+        print(f"(문서 {max_posting}개 초과 범용 키워드 {skipped}개는 제외)")
+
+    for i, group in enumerate(groups[:args.top], 1):
+        print(f"\n[{i}] 문서 {len(group['docs'])}개 | 최대 겹침 {group['max_score']:.0%}")
+        print(f"    검색어: {', '.join(group['queries'][:5])}")
+        for slug in group["docs"]:
+            print(f"    - {slug}")
+
+    if len(groups) > args.top:
+        print(f"\n... 외 {len(groups) - args.top}개 그룹")
+
+    if args.json:
+        output = Path(args.json)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump({"total_docs": len(index.files), "groups": groups}, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 저장: {output}")
+
+
+if __name__ == "__main__":
+    main()
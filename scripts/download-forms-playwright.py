@@ -9,10 +9,22 @@ Playwright 브라우저 자동화로 양식 다운로드
 3. HWP/PDF 다운로드 링크 클릭
 4. 파일 저장
 
+단계별 획득:
+- 먼저 HTTP + lxml로 검색/다운로드 (정적 페이지는 브라우저 없이 처리)
+- JS 다운로드 버튼/껍데기 페이지/HTTP 차단일 때만 Playwright로 재시도
+- 도메인별 성공 단계를 기억해 브라우저가 필요했던 사이트는 바로 브라우저로
+- Chromium은 브라우저 단계가 처음 필요할 때 실행
+
+동시 처리:
+- 재사용 브라우저 컨텍스트 N개(--workers)가 양식 큐를 나눠 처리
+- 이미지/폰트/미디어/분석 스크립트 요청은 차단 (HTML과 다운로드만 받음)
+
 사용법:
     python download-forms-playwright.py 각서
     python download-forms-playwright.py --all
     python download-forms-playwright.py --batch 10
+    python download-forms-playwright.py --all --workers 6
+    python download-forms-playwright.py 각서 --site-base http://127.0.0.1:8000   # 로컬 HTML 픽스처
 """
 
 import os
@@ -23,16 +35,46 @@ import re
 import argparse
 import asyncio
 from pathlib import Path
-from urllib.parse import quote, unquote, urlparse
+from urllib.parse import quote, unquote, urlparse, urljoin
 
 from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeout
 
+import requests
+
+from form_acquire import (
+    HEADERS, TIER_BROWSER, TIER_HTTP, TierMemory, anchor_links, discover, fetch_html, learn_link, needs_javascript,
+)
+from form_download import DownloadError, check_magic, download, is_complete, load_checksums, sha256_file
+from form_store import FormStore, download_url
+
 # ============================================================
 # 설정
 # ============================================================
 PROJECT_ROOT = Path(__file__).parent.parent
 FORMS_DIR = PROJECT_ROOT / "public" / "files" / "forms"
 DATA_DIR = PROJECT_ROOT / "data" / "forms"
+STORE = FormStore.load()
+TIERS = TierMemory.load()
+
+# 검색 시작 주소 (--site-base로 로컬 픽스처 서버에 연결 가능)
+GANGNAM_BASE = "https://www.gangnam.go.kr"
+NAVER_SEARCH_URL = "https://search.naver.com/search.naver"
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+# 동시 처리 기본값
+DEFAULT_WORKERS = 4
+FORM_DELAY = 0.5  # 워커별 양식 간 대기 (초)
+
+# 받지 않을 리소스 (다운로드 링크 탐색에 필요 없음)
+BLOCKED_RESOURCE_TYPES = {'image', 'font', 'media'}
+BLOCKED_URL_RE = re.compile(
+    r'google-analytics\.com|googletagmanager\.com|doubleclick\.net|googlesyndication\.com'
+    r'|wcs\.naver\.net|nlog\.naver\.com|lcs\.naver\.com|ssl\.pstatic\.net/tveta'
+    r'|facebook\.net|connect\.facebook|/gtag/js'
+    # analytics/beacon은 호스트 라벨이 그 이름으로 시작할 때만 (경로의 analytics_report.hwp 등은 통과)
+    r'|^https?://(?:[\w-]+\.)*(?:analytics|beacon)[\w-]*\.'
+)
 
 # 신뢰할 수 있는 정부기관 도메인
 TRUSTED_DOMAINS = [
@@ -53,7 +95,7 @@ async def search_gangnam_direct(form_name, page):
     print(f"  🔍 강남구청 직접 검색...")
 
     try:
-        url = f"https://www.gangnam.go.kr/board/B_000060/list.do?searchKeyword={quote(form_name)}"
+        url = f"{GANGNAM_BASE}/board/B_000060/list.do?searchKeyword={quote(form_name)}"
         await page.goto(url, timeout=30000)
         await page.wait_for_load_state('networkidle', timeout=10000)
 
@@ -66,7 +108,7 @@ async def search_gangnam_direct(form_name, page):
                 href = await link.get_attribute('href')
                 if href:
                     # 상세 페이지로 이동
-                    detail_url = f"https://www.gangnam.go.kr{href}" if href.startswith('/') else href
+                    detail_url = urljoin(page.url, href)
                     await page.goto(detail_url, timeout=30000)
                     await page.wait_for_load_state('networkidle', timeout=10000)
 
@@ -94,7 +136,7 @@ async def search_naver(form_name, page):
 
     try:
         query = f"{form_name} 양식 hwp 다운로드 site:gov.kr"
-        url = f"https://search.naver.com/search.naver?query={quote(query)}"
+        url = f"{NAVER_SEARCH_URL}?query={quote(query)}"
 
         await page.goto(url, timeout=30000)
         await page.wait_for_load_state('networkidle', timeout=10000)
@@ -172,18 +214,7 @@ async def try_download_from_page(form_name, page, url):
                             save_path = FORMS_DIR / f"{form_name}.{ext}"
                             await download.save_as(str(save_path))
 
-                            # 검증
-                            if save_path.exists() and save_path.stat().st_size > 1000:
-                                # HWP 파일 시그니처 체크
-                                with open(save_path, 'rb') as f:
-                                    header = f.read(8)
-
-                                if ext == 'hwp' and not header.startswith(b'\xd0\xcf\x11\xe0'):
-                                    print(f"    ⚠️ 유효한 HWP 아님")
-                                    save_path.unlink()
-                                    continue
-
-                                print(f"    ✅ 다운로드 완료: {save_path.name} ({save_path.stat().st_size:,} bytes)")
+                            if store_download(save_path):
                                 return ext
 
                         except PlaywrightTimeout:
@@ -201,72 +232,306 @@ async def try_download_from_page(form_name, page, url):
         return None
 
 
+def store_download(save_path):
+    """받은 파일 검증 (크기 + 시그니처) 후 양식 저장소로 이동"""
+    if not save_path.exists() or save_path.stat().st_size <= 1000:
+        return False
+
+    with open(save_path, 'rb') as f:
+        header = f.read(16)
+    ext = save_path.suffix.lstrip('.')
+    if not check_magic(header, ext):
+        print(f"    ⚠️ 유효한 {ext.upper()} 아님")
+        save_path.unlink()
+        return False
+
+    size = save_path.stat().st_size
+    _, duplicate = STORE.add_file(save_path, sha=sha256_file(save_path))
+    reused = " (blob 재사용)" if duplicate else ""
+    print(f"    ✅ 다운로드 완료: {save_path.name} ({size:,} bytes){reused}")
+    return True
+
+
 # ============================================================
-# 메인 다운로드 로직
+# 브라우저 컨텍스트
 # ============================================================
-async def download_form(form_name, browser):
-    """양식 다운로드"""
-    print(f"\n{'='*60}")
-    print(f"📋 {form_name}")
-    print('='*60)
+async def block_resources(route):
+    """이미지/폰트/분석 요청 차단"""
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_RE.search(request.url):
+        await route.abort()
+    else:
+        await route.continue_()
 
-    # 이미 다운로드됐는지 확인
-    for ext in ['hwp', 'pdf', 'docx']:
-        existing = FORMS_DIR / f"{form_name}.{ext}"
-        if existing.exists() and existing.stat().st_size > 1000:
-            print(f"  ✅ 이미 존재: {form_name}.{ext}")
-            return True
 
-    context = await browser.new_context(
-        accept_downloads=True,
-        user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-    )
-    page = await context.new_page()
+async def create_context(browser):
+    """리소스 차단이 걸린 재사용 컨텍스트"""
+    context = await browser.new_context(accept_downloads=True, user_agent=USER_AGENT)
+    await context.route('**/*', block_resources)
+    return context
+
 
+# ============================================================
+# 1단계: HTTP (브라우저 없음)
+# ============================================================
+def http_search_gangnam(form_name):
+    """
+    강남구청 민원서식 목록을 HTTP로 검색
+
+    Returns:
+        (상세 페이지 URL 목록, 브라우저 필요 여부)
+    """
+    url = f"{GANGNAM_BASE}/board/B_000060/list.do?searchKeyword={quote(form_name)}"
     try:
-        # 1. 강남구청 직접 검색
-        dl_link = await search_gangnam_direct(form_name, page)
-        if dl_link:
-            try:
-                async with page.expect_download(timeout=30000) as download_info:
-                    await dl_link.click()
+        doc = fetch_html(url)
+    except (requests.RequestException, ValueError) as e:
+        print(f"    ⚠️ 강남구청 HTTP 검색 실패: {e}")
+        return [], True
+    urls = [href for href, text in anchor_links(doc) if 'view.do' in href and form_name in text]
+    return list(dict.fromkeys(urls)), needs_javascript(doc)
 
-                download = await download_info.value
-                save_path = FORMS_DIR / f"{form_name}.hwp"
-                await download.save_as(str(save_path))
 
-                if save_path.exists() and save_path.stat().st_size > 1000:
-                    print(f"    ✅ 강남구청에서 다운로드: {save_path.name}")
-                    update_json(form_name, 'hwp')
-                    await context.close()
-                    return True
+def http_search_naver(form_name):
+    """네이버 검색 결과에서 정부 사이트 링크 (HTTP)"""
+    query = f"{form_name} 양식 hwp 다운로드 site:gov.kr"
+    try:
+        doc = fetch_html(f"{NAVER_SEARCH_URL}?query={quote(query)}")
+    except (requests.RequestException, ValueError) as e:
+        print(f"    ⚠️ 네이버 HTTP 검색 실패: {e}")
+        return [], True
+
+    gov_links = [
+        href for href, _ in anchor_links(doc)
+        if any(domain in href for domain in TRUSTED_DOMAINS) and href.startswith('http') and 'naver.com' not in href
+    ]
+    return list(dict.fromkeys(gov_links))[:5], needs_javascript(doc)
+
+
+def http_download(form_name, page_url):
+    """
+    정적 페이지의 다운로드 링크를 바로 받기
+
+    Returns:
+        (확장자 또는 None, 브라우저 필요 여부)
+    """
+    links, dynamic = discover(page_url, form_name, limit=3)
+    for link in links:
+        save_path = FORMS_DIR / f"{form_name}.{link['ext']}"
+        print(f"    ⬇️ HTTP 다운로드 시도: {link['text'][:30]}")
+        try:
+            result = download(link['url'], save_path, headers=HEADERS, sniff=True)
+        except (DownloadError, requests.RequestException, OSError) as e:
+            print(f"    ⚠️ {e}")
+            learn_link(link, False)
+            continue
+        learn_link(link, True)
+        _, duplicate = STORE.add_file(result['path'], sha=result['sha256'])
+        reused = " (blob 재사용)" if duplicate else ""
+        print(f"    ✅ 다운로드 완료: {Path(result['path']).name} ({result['size']:,} bytes){reused}")
+        return result['ext'], False
+    return None, dynamic
+
+
+# ============================================================
+# 2단계: 브라우저 (필요할 때만 실행)
+# ============================================================
+class BrowserLauncher:
+    """첫 브라우저 단계에서 Chromium 실행 (모두 HTTP로 끝나면 실행하지 않음)"""
+
+    def __init__(self, playwright):
+        self.playwright = playwright
+        self.browser = None
+        self.lock = asyncio.Lock()
+
+    async def get(self):
+        async with self.lock:
+            if self.browser is None:
+                print("  🌐 Chromium 실행")
+                self.browser = await self.playwright.chromium.launch(
+                    headless=True,
+                    args=['--no-sandbox', '--disable-setuid-sandbox']
+                )
+        return self.browser
+
+    async def close(self):
+        if self.browser:
+            await self.browser.close()
 
-            except:
-                pass
+
+class BrowserSlot:
+    """워커 하나가 재사용하는 컨텍스트/페이지 (처음 필요할 때 생성)"""
+
+    def __init__(self, launcher):
+        self.launcher = launcher
+        self.context = None
+        self._page = None
+
+    async def page(self):
+        if self._page is None or self._page.is_closed():
+            if self.context is None:
+                self.context = await create_context(await self.launcher.get())
+            self._page = await self.context.new_page()
+        return self._page
+
+    async def close(self):
+        if self.context:
+            await self.context.close()
+
+
+# ============================================================
+# 메인 다운로드 로직
+# ============================================================
+def already_downloaded(form_name, checksums=None):
+    """저장소 또는 public/files/forms에 온전한 파일이 있는지"""
+    checksums = checksums if checksums is not None else load_checksums()
+    return any(STORE.has(f"{form_name}.{ext}") or is_complete(FORMS_DIR / f"{form_name}.{ext}", checksums)
+               for ext in ['hwp', 'pdf', 'docx'])
+
+
+async def acquire_from_page(form_name, url, slot):
+    """페이지에서 양식 받기 - HTTP 먼저, 필요할 때만 브라우저 (확장자 또는 None)"""
+    if TIERS.tier_for(url) == TIER_HTTP:
+        ext, needs_browser = await asyncio.to_thread(http_download, form_name, url)
+        if ext:
+            TIERS.record(url, TIER_HTTP)
+            return ext
+        if not needs_browser:
+            return None
+        print(f"    ↗️ 브라우저로 재시도: {url[:50]}")
+
+    ext = await try_download_from_page(form_name, await slot.page(), url)
+    if ext:
+        TIERS.record(url, TIER_BROWSER)
+    return ext
+
+
+async def download_from_gangnam(form_name, slot):
+    """강남구청 민원서식 (HTTP 목록 검색 → 상세 페이지, 필요 시 브라우저)"""
+    if TIERS.tier_for(GANGNAM_BASE) == TIER_HTTP:
+        print(f"  🔍 [{form_name}] 강남구청 검색 (HTTP)...")
+        detail_urls, needs_browser = await asyncio.to_thread(http_search_gangnam, form_name)
+        for detail_url in detail_urls[:3]:
+            ext = await acquire_from_page(form_name, detail_url, slot)
+            if ext:
+                return ext
+        if detail_urls or not needs_browser:
+            return None
+
+    page = await slot.page()
+    dl_link = await search_gangnam_direct(form_name, page)
+    if not dl_link:
+        return None
+    try:
+        async with page.expect_download(timeout=30000) as download_info:
+            await dl_link.click()
+
+        download = await download_info.value
+        save_path = FORMS_DIR / f"{form_name}.hwp"
+        await download.save_as(str(save_path))
+
+        if store_download(save_path):
+            print(f"    🏛️ 강남구청에서 다운로드: {form_name}")
+            TIERS.record(GANGNAM_BASE, TIER_BROWSER)
+            return 'hwp'
+    except Exception:
+        pass
+    return None
+
+
+async def find_gov_links(form_name, slot):
+    """네이버 검색 → 정부 사이트 링크 (HTTP 먼저, 결과가 JS로 그려지면 브라우저)"""
+    if TIERS.tier_for(NAVER_SEARCH_URL) == TIER_HTTP:
+        gov_links, needs_browser = await asyncio.to_thread(http_search_naver, form_name)
+        if gov_links:
+            TIERS.record(NAVER_SEARCH_URL, TIER_HTTP)
+            return gov_links
+        if not needs_browser:
+            return []
+
+    gov_links = await search_naver(form_name, await slot.page())
+    if gov_links:
+        TIERS.record(NAVER_SEARCH_URL, TIER_BROWSER)
+    return gov_links
+
+
+async def download_form(form_name, slot):
+    """양식 다운로드 (워커의 브라우저 슬롯은 필요할 때만 사용)"""
+    print(f"\n📋 {form_name}")
+
+    # 이미 다운로드됐는지 확인
+    if already_downloaded(form_name):
+        print(f"  ✅ 이미 존재: {form_name}")
+        return True
+
+    try:
+        # 1. 강남구청 직접 검색
+        ext = await download_from_gangnam(form_name, slot)
+        if ext:
+            update_json(form_name, ext)
+            return True
 
         # 2. 네이버 검색 → 정부 사이트 방문
-        gov_links = await search_naver(form_name, page)
+        gov_links = await find_gov_links(form_name, slot)
 
         if gov_links:
-            print(f"  📄 {len(gov_links)}개 정부 사이트 발견")
+            print(f"  📄 [{form_name}] {len(gov_links)}개 정부 사이트 발견")
 
             for url in gov_links:
-                ext = await try_download_from_page(form_name, page, url)
+                ext = await acquire_from_page(form_name, url, slot)
                 if ext:
                     update_json(form_name, ext)
-                    await context.close()
                     return True
 
-        print(f"  ❌ 다운로드 실패")
-        await context.close()
+        print(f"  ❌ [{form_name}] 다운로드 실패")
         return False
 
     except Exception as e:
-        print(f"  ❌ 오류: {e}")
-        await context.close()
+        print(f"  ❌ [{form_name}] 오류: {e}")
         return False
 
 
+async def worker(launcher, queue, results, delay=FORM_DELAY):
+    """브라우저 슬롯 하나로 큐의 양식을 차례로 처리"""
+    slot = BrowserSlot(launcher)
+    try:
+        while True:
+            try:
+                form_name = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            results[form_name] = await download_form(form_name, slot)
+            await asyncio.sleep(delay)
+    finally:
+        await slot.close()
+
+
+async def download_forms(launcher, form_names, workers=DEFAULT_WORKERS, delay=FORM_DELAY):
+    """
+    양식 목록을 N개 워커로 동시 처리
+
+    Returns:
+        {form_name: 성공 여부}
+    """
+    queue = asyncio.Queue()
+    for form_name in form_names:
+        queue.put_nowait(form_name)
+
+    results = {}
+    count = max(1, min(workers, len(form_names)))
+    await asyncio.gather(*(worker(launcher, queue, results, delay) for _ in range(count)))
+    return results
+
+
+def use_site_base(site_base):
+    """검색 시작 주소를 로컬 픽스처 서버로 교체 (<base>/gangnam, <base>/naver)"""
+    global GANGNAM_BASE, NAVER_SEARCH_URL
+    base = site_base.rstrip('/')
+    GANGNAM_BASE = f"{base}/gangnam"
+    NAVER_SEARCH_URL = f"{base}/naver/search.naver"
+    TRUSTED_DOMAINS.append(urlparse(base).hostname)
+
+
 # ============================================================
 # JSON 업데이트
 # ============================================================
@@ -286,7 +551,7 @@ def update_json(form_name, ext):
         if 'downloadNames' not in data or not data['downloadNames']:
             data['downloadNames'] = {}
 
-        data['downloads'][ext] = f"/files/forms/{form_name}.{ext}"
+        data['downloads'][ext] = download_url(form_name, ext, STORE)
         data['downloadNames'][ext] = f"{form_name}.{ext}"
 
         with open(json_path, 'w', encoding='utf-8') as f:
@@ -303,12 +568,11 @@ def update_json(form_name, ext):
 # ============================================================
 def get_missing_forms():
     """다운로드 파일이 없는 양식"""
+    checksums = load_checksums()
     missing = []
     for json_file in DATA_DIR.glob('*.json'):
         form_name = json_file.stem
-        has_file = any((FORMS_DIR / f"{form_name}.{ext}").exists()
-                       for ext in ['hwp', 'pdf', 'docx'])
-        if not has_file:
+        if not already_downloaded(form_name, checksums):
             missing.append(form_name)
     return sorted(missing)
 
@@ -317,45 +581,38 @@ async def main_async(args):
     FORMS_DIR.mkdir(parents=True, exist_ok=True)
 
     async with async_playwright() as p:
-        browser = await p.chromium.launch(
-            headless=True,
-            args=['--no-sandbox', '--disable-setuid-sandbox']
-        )
+        launcher = BrowserLauncher(p)
 
         try:
             if args.form_name:
-                await download_form(args.form_name, browser)
+                await download_forms(launcher, [args.form_name], workers=1)
 
             elif args.all or args.batch:
                 missing = get_missing_forms()
                 limit = args.batch if args.batch else len(missing)
 
-                print(f"\n🚀 다운로드 시작: {min(limit, len(missing))}개")
-
-                success = 0
-                fail = 0
+                targets = missing[:limit]
+                print(f"\n🚀 다운로드 시작: {len(targets)}개 (워커 {args.workers}개)")
+                started = time.monotonic()
 
-                for form in missing[:limit]:
-                    if await download_form(form, browser):
-                        success += 1
-                    else:
-                        fail += 1
-
-                    await asyncio.sleep(2)
+                results = await download_forms(launcher, targets, args.workers, args.delay)
+                success = sum(1 for ok in results.values() if ok)
+                fail = len(results) - success
 
                 print(f"\n{'='*60}")
+                print(f"⏱️ {time.monotonic() - started:.1f}초")
                 print(f"📊 결과: 성공 {success}개, 실패 {fail}개")
 
             elif args.list:
                 missing = get_missing_forms()
-                downloaded = list(FORMS_DIR.glob('*.hwp')) + list(FORMS_DIR.glob('*.pdf'))
-                print(f"\n📊 현황: 다운로드 {len(downloaded)}개 / 미다운로드 {len(missing)}개")
+                downloaded = len(list(DATA_DIR.glob('*.json'))) - len(missing)
+                print(f"\n📊 현황: 다운로드 {downloaded}개 / 미다운로드 {len(missing)}개")
                 print(f"\n미다운로드 목록 (상위 20개):")
                 for f in missing[:20]:
                     print(f"  ⬜ {f}")
 
         finally:
-            await browser.close()
+            await launcher.close()
 
 
 def main():
@@ -364,9 +621,15 @@ def main():
     parser.add_argument('--all', '-a', action='store_true', help='전체 다운로드')
     parser.add_argument('--batch', '-b', type=int, help='N개만 다운로드')
     parser.add_argument('--list', '-l', action='store_true', help='목록 확인')
+    parser.add_argument('--workers', '-w', type=int, default=DEFAULT_WORKERS, help=f'동시 브라우저 컨텍스트 수 (기본 {DEFAULT_WORKERS})')
+    parser.add_argument('--delay', type=float, default=FORM_DELAY, help=f'워커별 양식 간 대기 초 (기본 {FORM_DELAY})')
+    parser.add_argument('--site-base', help='강남구청/네이버 대신 사용할 로컬 픽스처 서버 주소')
 
     args = parser.parse_args()
 
+    if args.site_base:
+        use_site_base(args.site_base)
+
     if not any([args.form_name, args.all, args.batch, args.list]):
         print("\n사용법:")
         print("  python download-forms-playwright.py 각서           # 특정 양식")
@@ -13,20 +13,27 @@
     python download-gov-forms.py                    # 전체 다운로드
     python download-gov-forms.py --form 폐업신고서   # 특정 양식만
     python download-gov-forms.py --list             # 다운 가능 목록 확인
+    python download-gov-forms.py --all --jobs 8 --per-host 2   # 병렬 다운로드
+    python download-gov-forms.py --all --site-base http://127.0.0.1:8000   # 로컬 테스트 서버
 """
 
-import os
 import sys
 import json
 import time
-import re
+import asyncio
 import argparse
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from urllib.parse import urljoin, quote, unquote
+from urllib.parse import urljoin, urlparse, quote
 
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 
+from form_download import download, DownloadError, is_complete, load_checksums
+from form_store import FormStore, download_url
+
 # ============================================================
 # 설정
 # ============================================================
@@ -40,6 +47,66 @@ HEADERS = {
     'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
 }
 
+# 사이트별 기본 주소 (--site-base로 로컬 테스트 서버에 연결 가능)
+SITE_BASES = {
+    "law": "https://www.law.go.kr",
+    "nts": "https://www.nts.go.kr",
+    "moel": "https://www.moel.go.kr",
+    "scourt": "https://ecfs.scourt.go.kr",
+}
+
+# 동시 처리 기본값
+DEFAULT_JOBS = 8        # 동시에 처리할 양식 수
+DEFAULT_PER_HOST = 2    # 호스트별 동시 요청 수
+MIN_HOST_INTERVAL = 0.5 # 같은 호스트 요청 간 최소 간격 (초, 서버 부하 방지)
+
+
+class HostLimiter:
+    """호스트별 동시 요청 수 + 요청 간격 제한 (스레드 안전)"""
+
+    def __init__(self, per_host=DEFAULT_PER_HOST, min_interval=MIN_HOST_INTERVAL):
+        self.per_host = per_host
+        self.min_interval = min_interval
+        self.lock = threading.Lock()
+        self.semaphores = {}
+        self.next_slot = {}
+
+    @contextmanager
+    def slot(self, url):
+        host = urlparse(url).netloc
+        with self.lock:
+            semaphore = self.semaphores.setdefault(host, threading.BoundedSemaphore(self.per_host))
+        with semaphore:
+            with self.lock:
+                now = time.monotonic()
+                start = max(now, self.next_slot.get(host, now))
+                self.next_slot[host] = start + self.min_interval
+            if start > now:
+                time.sleep(start - now)
+            yield
+
+
+def create_session(pool_size=DEFAULT_JOBS * 2):
+    """모든 사이트가 공유하는 커넥션 풀 세션"""
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = create_session()
+LIMITER = HostLimiter()
+STORE = FormStore.load()
+
+
+def http_get(url, **kwargs):
+    """공유 세션 + 호스트별 제한을 거치는 GET (stream=True면 호출자가 닫아야 함)"""
+    with LIMITER.slot(url):
+        return SESSION.get(url, **kwargs)
+
+
 # 양식별 다운로드 URL 매핑
 # 형식: "양식명": {"source": "출처", "url": "다운로드URL", "type": "hwp|pdf|xls"}
 FORM_SOURCES = {
@@ -146,10 +213,10 @@ def search_law_forms(law_name, attachment_name):
     print(f"  🔍 법제처 검색: {law_name} - {attachment_name}")
 
     # 1. 법령 검색
-    search_url = f"https://www.law.go.kr/법령/{quote(law_name)}"
+    search_url = f"{SITE_BASES['law']}/법령/{quote(law_name)}"
 
     try:
-        response = requests.get(search_url, headers=HEADERS, timeout=30)
+        response = http_get(search_url, timeout=30)
         response.encoding = 'utf-8'
         soup = BeautifulSoup(response.text, 'lxml')
 
@@ -161,12 +228,12 @@ def search_law_forms(law_name, attachment_name):
             if attachment_name in link.get_text():
                 href = link.get('href')
                 if href:
-                    download_url = urljoin("https://www.law.go.kr", href)
+                    download_url = urljoin(search_url, href)
                     return download_url
 
         # 직접 서식 페이지 접근 시도
-        form_url = f"https://www.law.go.kr/법령서식/{quote(law_name)}"
-        response = requests.get(form_url, headers=HEADERS, timeout=30)
+        form_url = f"{SITE_BASES['law']}/법령서식/{quote(law_name)}"
+        response = http_get(form_url, timeout=30)
         response.encoding = 'utf-8'
         soup = BeautifulSoup(response.text, 'lxml')
 
@@ -174,7 +241,7 @@ def search_law_forms(law_name, attachment_name):
         download_links = soup.select('a[href*=".hwp"]') or soup.select('a[href*="download"]')
         for link in download_links:
             if attachment_name in link.get_text() or attachment_name in str(link):
-                return urljoin("https://www.law.go.kr", link.get('href'))
+                return urljoin(form_url, link.get('href'))
 
     except Exception as e:
         print(f"    ❌ 법제처 검색 실패: {e}")
@@ -192,10 +259,10 @@ def search_nts_forms(keyword):
     print(f"  🔍 국세청 검색: {keyword}")
 
     # 국세청 서식 검색 페이지
-    search_url = f"https://www.nts.go.kr/nts/cm/cntnts/cntntsView.do?mi=2272&cntntsId=7693"
+    search_url = f"{SITE_BASES['nts']}/nts/cm/cntnts/cntntsView.do?mi=2272&cntntsId=7693"
 
     try:
-        response = requests.get(search_url, headers=HEADERS, timeout=30)
+        response = http_get(search_url, timeout=30)
         response.encoding = 'utf-8'
         soup = BeautifulSoup(response.text, 'lxml')
 
@@ -206,7 +273,7 @@ def search_nts_forms(keyword):
             if keyword in text:
                 href = link.get('href')
                 if href and ('.hwp' in href or 'download' in href):
-                    return urljoin("https://www.nts.go.kr", href)
+                    return urljoin(search_url, href)
 
         # 홈택스 서식 검색 시도
         hometax_url = f"https://www.hometax.go.kr/websquare/websquare.html?w2xPath=/ui/pp/index_pp.xml"
@@ -228,14 +295,14 @@ def search_moel_forms(keyword):
     print(f"  🔍 고용노동부 검색: {keyword}")
 
     # 고용노동부 정책자료실
-    search_url = f"https://www.moel.go.kr/policy/policydata/list.do"
+    search_url = f"{SITE_BASES['moel']}/policy/policydata/list.do"
 
     try:
         params = {
             'searchText': keyword,
             'searchKeyword': keyword,
         }
-        response = requests.get(search_url, headers=HEADERS, params=params, timeout=30)
+        response = http_get(search_url, params=params, timeout=30)
         response.encoding = 'utf-8'
         soup = BeautifulSoup(response.text, 'lxml')
 
@@ -243,7 +310,7 @@ def search_moel_forms(keyword):
         links = soup.select('a[href*="download"]') or soup.select('a[href*=".hwp"]')
         for link in links:
             if keyword in link.get_text() or keyword in str(link.get('title', '')):
-                return urljoin("https://www.moel.go.kr", link.get('href'))
+                return urljoin(search_url, link.get('href'))
 
     except Exception as e:
         print(f"    ❌ 고용노동부 검색 실패: {e}")
@@ -261,10 +328,10 @@ def search_scourt_forms(keyword):
     print(f"  🔍 대법원 검색: {keyword}")
 
     # 대법원 전자소송 서식 페이지
-    search_url = "https://ecfs.scourt.go.kr/ecf/ecf300/ECF302.jsp"
+    search_url = f"{SITE_BASES['scourt']}/ecf/ecf300/ECF302.jsp"
 
     try:
-        response = requests.get(search_url, headers=HEADERS, timeout=30)
+        response = http_get(search_url, timeout=30)
         response.encoding = 'utf-8'
         soup = BeautifulSoup(response.text, 'lxml')
 
@@ -275,7 +342,7 @@ def search_scourt_forms(keyword):
             if keyword in text:
                 href = link.get('href')
                 if href:
-                    return urljoin("https://ecfs.scourt.go.kr", href)
+                    return urljoin(search_url, href)
 
     except Exception as e:
         print(f"    ❌ 대법원 검색 실패: {e}")
@@ -288,32 +355,34 @@ def search_scourt_forms(keyword):
 # ============================================================
 def download_file(url, save_path):
     """
-    URL에서 파일 다운로드
+    URL에서 파일 다운로드 (.part 이어받기 + 시그니처 검증 + 원자적 저장)
+    save_path의 확장자는 URL로 추정한 값 - 내용이 PDF/HWP면 그 확장자로 저장
+
+    Returns:
+        저장된 확장자 (실패 시 None)
     """
+    # 이미 가진 파일은 조건부 요청 (서버에서 바뀌지 않았으면 304로 전송 생략)
+    name = Path(save_path).name
+    conditional = STORE.has(name) or is_complete(save_path)
     try:
-        response = requests.get(url, headers=HEADERS, timeout=60, stream=True)
-        response.raise_for_status()
-
-        # Content-Disposition에서 파일명 추출
-        content_disp = response.headers.get('Content-Disposition', '')
-        if 'filename=' in content_disp:
-            # 인코딩된 파일명 처리
-            match = re.search(r'filename[*]?=(?:UTF-8\'\')?([^;\s]+)', content_disp)
-            if match:
-                filename = unquote(match.group(1))
-
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        with LIMITER.slot(url):
+            result = download(url, save_path, session=SESSION, conditional=conditional, sniff=True)
+    except (DownloadError, requests.RequestException, OSError) as e:
+        print(f"    ❌ 다운로드 실패: {e}")
+        return None
 
-        with open(save_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+    if result['notModified']:
+        print(f"    ⏭️ 변경 없음 (304): {name}")
+        return result['ext']
 
-        print(f"    ✅ 다운로드 완료: {save_path}")
-        return True
+    resumed = " (이어받기)" if result['resumed'] else ""
+    print(f"    ✅ 다운로드 완료{resumed}: {result['path']} ({result['size']:,} bytes, sha256 {result['sha256'][:12]})")
 
-    except Exception as e:
-        print(f"    ❌ 다운로드 실패: {e}")
-        return False
+    # 내용 기준 저장소로 이동 (같은 서식을 다른 이름으로 받았으면 blob 재사용)
+    _, duplicate = STORE.add_file(result['path'], sha=result['sha256'])
+    if duplicate:
+        print(f"    ♻️ 이미 저장된 파일과 동일 (blob 재사용)")
+    return result['ext']
 
 
 # ============================================================
@@ -340,6 +409,37 @@ def find_download_url(form_name, form_info):
     return None
 
 
+def guess_extension(download_url):
+    """다운로드 URL로 파일 확장자 추정 (기본 hwp)"""
+    lowered = download_url.lower()
+    if '.pdf' in lowered:
+        return 'pdf'
+    elif '.doc' in lowered:
+        return 'docx'
+    elif '.xls' in lowered:
+        return 'xlsx'
+    return 'hwp'
+
+
+def save_form(form_name, form_info, download_url):
+    """찾은 URL에서 양식 다운로드 + JSON 업데이트"""
+    print(f"    🔗 [{form_name}] 다운로드 URL: {download_url}")
+    ext = guess_extension(download_url)
+    save_path = FORMS_DIR / f"{form_name}.{ext}"
+
+    saved_ext = download_file(download_url, str(save_path))
+    if saved_ext:
+        # JSON 파일 업데이트
+        update_form_json(form_name, form_info, saved_ext)
+        return True
+    return False
+
+
+def report_missing_url(form_name, form_info):
+    print(f"    ⚠️ [{form_name}] 다운로드 URL을 찾지 못했습니다.")
+    print(f"    💡 수동 다운로드 필요: {form_info.get('sourceUrl', '')}")
+
+
 def process_form(form_name):
     """
     단일 양식 처리
@@ -356,30 +456,57 @@ def process_form(form_name):
     download_url = find_download_url(form_name, form_info)
 
     if download_url:
-        print(f"    🔗 다운로드 URL: {download_url}")
-
-        # 파일 확장자 추출
-        ext = 'hwp'
-        if '.pdf' in download_url.lower():
-            ext = 'pdf'
-        elif '.doc' in download_url.lower():
-            ext = 'docx'
-        elif '.xls' in download_url.lower():
-            ext = 'xlsx'
-
-        save_path = FORMS_DIR / f"{form_name}.{ext}"
-
-        if download_file(download_url, str(save_path)):
-            # JSON 파일 업데이트
-            update_form_json(form_name, form_info, ext)
-            return True
-    else:
-        print(f"    ⚠️ 다운로드 URL을 찾지 못했습니다.")
-        print(f"    💡 수동 다운로드 필요: {form_info.get('sourceUrl', '')}")
+        return save_form(form_name, form_info, download_url)
 
+    report_missing_url(form_name, form_info)
     return False
 
 
+async def process_form_async(form_name, jobs):
+    """
+    양식 하나를 URL 탐색 → 다운로드 2단계로 처리
+    (각 단계는 스레드에서 실행, 실제 요청 수는 LIMITER가 호스트별로 제한)
+    """
+    form_info = FORM_SOURCES[form_name]
+    async with jobs:
+        print(f"📄 {form_name} 처리 중...")
+        download_url = await asyncio.to_thread(find_download_url, form_name, form_info)
+        if not download_url:
+            report_missing_url(form_name, form_info)
+            return False
+        return await asyncio.to_thread(save_form, form_name, form_info, download_url)
+
+
+async def process_all_async(form_names, max_jobs=DEFAULT_JOBS):
+    """
+    여러 양식을 동시에 처리 - 서로 다른 사이트의 탐색/다운로드가 겹쳐서 진행됨
+
+    Returns:
+        {form_name: 성공 여부}
+    """
+    jobs = asyncio.Semaphore(max_jobs)
+    tasks = [process_form_async(name, jobs) for name in form_names]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    outcome = {}
+    for name, result in zip(form_names, results):
+        if isinstance(result, Exception):
+            print(f"    ❌ [{name}] 처리 실패: {result}")
+            result = False
+        outcome[name] = result
+    return outcome
+
+
+def configure(jobs=DEFAULT_JOBS, per_host=DEFAULT_PER_HOST, min_interval=MIN_HOST_INTERVAL, site_base=None):
+    """동시성 설정 적용 + 로컬 테스트 서버 지정 (site_base/law, site_base/nts ...)"""
+    global SESSION, LIMITER
+    SESSION = create_session(pool_size=max(jobs, per_host) * 2)
+    LIMITER = HostLimiter(per_host=per_host, min_interval=min_interval)
+    if site_base:
+        for key in SITE_BASES:
+            SITE_BASES[key] = f"{site_base.rstrip('/')}/{key}"
+
+
 def update_form_json(form_name, form_info, ext):
     """
     양식 JSON 파일에 다운로드 경로 추가
@@ -399,7 +526,7 @@ def update_form_json(form_name, form_info, ext):
     if 'downloadNames' not in data or not data['downloadNames']:
         data['downloadNames'] = {}
 
-    data['downloads'][ext] = f"/files/forms/{form_name}.{ext}"
+    data['downloads'][ext] = download_url(form_name, ext, STORE)
     data['downloadNames'][ext] = f"{form_name}_{form_info['source']}.{ext}"
     data['source'] = form_info['source']
     data['sourceUrl'] = form_info['sourceUrl']
@@ -417,6 +544,12 @@ def list_available_forms():
     print("\n📋 다운로드 가능한 양식 목록")
     print("=" * 60)
 
+    checksums = load_checksums()
+
+    def downloaded(form):
+        return any(STORE.has(f"{form}.{ext}") or is_complete(FORMS_DIR / f"{form}.{ext}", checksums)
+                   for ext in ['hwp', 'pdf', 'docx'])
+
     by_source = {}
     for form_name, info in FORM_SOURCES.items():
         source = info['source']
@@ -428,14 +561,13 @@ def list_available_forms():
         print(f"\n🏛️ {source}")
         for form in forms:
             # 이미 다운로드된 파일 확인
-            exists = any((FORMS_DIR / f"{form}.{ext}").exists() for ext in ['hwp', 'pdf', 'docx'])
-            status = "✅" if exists else "⬜"
+            status = "✅" if downloaded(form) else "⬜"
             print(f"   {status} {form}")
 
     print("\n" + "=" * 60)
     total = len(FORM_SOURCES)
-    downloaded = sum(1 for f in FORM_SOURCES if any((FORMS_DIR / f"{f}.{e}").exists() for e in ['hwp', 'pdf', 'docx']))
-    print(f"총 {total}개 중 {downloaded}개 다운로드 완료")
+    done = sum(1 for f in FORM_SOURCES if downloaded(f))
+    print(f"총 {total}개 중 {done}개 다운로드 완료")
 
 
 def main():
@@ -443,8 +575,13 @@ def main():
     parser.add_argument('--form', '-f', help='특정 양식만 다운로드')
     parser.add_argument('--list', '-l', action='store_true', help='다운로드 가능 목록')
     parser.add_argument('--all', '-a', action='store_true', help='전체 다운로드')
+    parser.add_argument('--jobs', '-j', type=int, default=DEFAULT_JOBS, help=f'동시 처리 양식 수 (기본 {DEFAULT_JOBS})')
+    parser.add_argument('--per-host', type=int, default=DEFAULT_PER_HOST, help=f'호스트별 동시 요청 수 (기본 {DEFAULT_PER_HOST})')
+    parser.add_argument('--interval', type=float, default=MIN_HOST_INTERVAL, help=f'같은 호스트 요청 간격 초 (기본 {MIN_HOST_INTERVAL})')
+    parser.add_argument('--site-base', help='정부 사이트 대신 사용할 로컬 테스트 서버 주소')
 
     args = parser.parse_args()
+    configure(args.jobs, args.per_host, args.interval, args.site_base)
 
     if args.list:
         list_available_forms()
@@ -455,18 +592,14 @@ def main():
         return
 
     if args.all:
-        print("🚀 전체 양식 다운로드 시작")
-        success = 0
-        fail = 0
-
-        for form_name in FORM_SOURCES:
-            if process_form(form_name):
-                success += 1
-            else:
-                fail += 1
-            time.sleep(1)  # 서버 부하 방지
-
-        print(f"\n📊 결과: 성공 {success}개, 실패 {fail}개")
+        print(f"🚀 전체 양식 다운로드 시작 (동시 {args.jobs}개, 호스트별 {args.per_host}개)")
+        started = time.monotonic()
+
+        outcome = asyncio.run(process_all_async(list(FORM_SOURCES), args.jobs))
+        success = sum(1 for ok in outcome.values() if ok)
+        fail = len(outcome) - success
+
+        print(f"\n📊 결과: 성공 {success}개, 실패 {fail}개 ({time.monotonic() - started:.1f}초)")
         return
 
     # 기본: 목록 출력
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+로컬 가짜 사이트 공용 도구 (다운로더 오프라인 점검용)
+
+- FixtureHandler: 경로 → 응답 함수 등록, 요청마다 지연(latency), 동시 요청 수/304 횟수 기록
+- 가짜 양식 파일: 형식 시그니처(OLE/PDF/ZIP) + 패딩, ETag/Last-Modified 조건부 요청 지원
+- Sandbox: scripts/를 임시 프로젝트에 복사해 실제 CLI를 실행
+  (PROJECT_ROOT가 임시 디렉토리가 되므로 저장소/체크섬/캐시/양식 JSON이 실제 트리에 남지 않음)
+
+사용법:
+  from fixture_server import FixtureHandler, Sandbox, start_server, serve
+  server, base = start_server(MySiteHandler)
+  with Sandbox(["혼인신고서"]) as sandbox:
+      output = sandbox.run("download-gov-forms.py", "--all", "--site-base", base)
+"""
+
+import sys
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+from email.utils import formatdate
+from urllib.parse import urlsplit, unquote, quote, parse_qs
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SCRIPTS_DIR = Path(__file__).parent
+
+OLE_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+LAST_MODIFIED = formatdate(0, usegmt=True)
+FILE_PADDING = 2048
+
+
+def fake_file(name, ext):
+    """이름별로 내용이 다른 가짜 양식 파일 (다운로더 시그니처 검사 통과)"""
+    body = f'fixture {name}'.encode('utf-8') + b' ' * FILE_PADDING
+    if ext == 'pdf':
+        return b'%PDF-1.4\n%' + body + b'\n%%EOF\n'
+    if ext in ('docx', 'hwpx', 'xlsx'):
+        return b'PK\x03\x04' + body
+    return OLE_MAGIC + body
+
+
+class FixtureState:
+    """요청 통계 (스레드 안전)"""
+
+    def __init__(self, latency=0.0):
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.stats = {'requests': 0, 'pages': 0, 'files': 0, 'notModified': 0, 'maxConcurrent': 0, 'paths': {}}
+
+    def begin(self, path):
+        with self.lock:
+            self.in_flight += 1
+            self.stats['requests'] += 1
+            self.stats['maxConcurrent'] = max(self.stats['maxConcurrent'], self.in_flight)
+            self.stats['paths'][path] = self.stats['paths'].get(path, 0) + 1
+
+    def end(self, kind):
+        with self.lock:
+            self.in_flight -= 1
+            if kind:
+                self.stats[kind] += 1
+
+    def snapshot(self):
+        with self.lock:
+            return json.loads(json.dumps(self.stats))
+
+    def reset(self):
+        with self.lock:
+            self.stats = {'requests': 0, 'pages': 0, 'files': 0, 'notModified': 0, 'maxConcurrent': 0, 'paths': {}}
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    """
+    ROUTES의 (접두어, 메서드 이름)으로 GET을 나눠 처리
+
+    응답 메서드는 (경로, 쿼리 dict)를 받아 self.page() / self.file()로 응답
+    """
+    state: FixtureState = None
+    ROUTES = ()
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        path = unquote(parts.path)
+        query = {key: values[0] for key, values in parse_qs(parts.query).items()}
+        if path == '/stats':
+            self._send(200, json.dumps(self.state.snapshot(), ensure_ascii=False).encode('utf-8'), 'application/json')
+            return
+
+        self.state.begin(path)
+        self._kind = None
+        try:
+            if self.state.latency:
+                time.sleep(self.state.latency)
+            for prefix, method in self.ROUTES:
+                if path.startswith(prefix):
+                    getattr(self, method)(path, query)
+                    break
+            else:
+                self.not_found()
+        finally:
+            self.state.end(self._kind)
+
+    def _send(self, status, body, content_type, headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def page(self, html):
+        self._kind = 'pages'
+        self._send(200, html.encode('utf-8'), 'text/html; charset=utf-8')
+
+    def file(self, name, ext):
+        """가짜 양식 파일 (If-None-Match / If-Modified-Since가 맞으면 304)"""
+        content = fake_file(name, ext)
+        etag = '"' + hashlib.sha256(content).hexdigest()[:16] + '"'
+        validators = {'ETag': etag, 'Last-Modified': LAST_MODIFIED}
+        if self.headers.get('If-None-Match') == etag or self.headers.get('If-Modified-Since') == LAST_MODIFIED:
+            self._kind = 'notModified'
+            self.send_response(304)
+            for key, value in validators.items():
+                self.send_header(key, value)
+            self.end_headers()
+            return
+        self._kind = 'files'
+        disposition = f"attachment; filename*=UTF-8''{quote(f'{name}.{ext}')}"
+        self._send(200, content, 'application/octet-stream', {**validators, 'Content-Disposition': disposition})
+
+    def not_found(self):
+        self._send(404, b'<html><body>Not found</body></html>', 'text/html; charset=utf-8')
+
+
+def start_server(handler_class, host='127.0.0.1', port=0, latency=0.0):
+    """
+    백그라운드 스레드로 서버 실행 → (서버, 기본 주소)
+    같은 핸들러로 여러 주소를 띄우면 통계(state)를 공유
+    """
+    if handler_class.state is None:
+        handler_class.state = FixtureState(latency)
+    server = ThreadingHTTPServer((host, port), handler_class)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://{host}:{server.server_address[1]}'
+
+
+def serve(handler_class, title, host='127.0.0.1', port=8000, latency=0.0):
+    """포그라운드 실행 (Ctrl+C로 종료)"""
+    if handler_class.state is None:
+        handler_class.state = FixtureState(latency)
+    server = ThreadingHTTPServer((host, port), handler_class)
+    print(f"🧪 {title}: http://{host}:{port} (통계: /stats)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+class Sandbox:
+    """scripts/를 복사한 임시 프로젝트 (양식 JSON은 이름만 담아 생성)"""
+
+    def __init__(self, form_names=()):
+        self.form_names = list(form_names)
+        self.root = None
+
+    def __enter__(self):
+        self.root = Path(tempfile.mkdtemp(prefix='fixture-site-'))
+        shutil.copytree(SCRIPTS_DIR, self.root / 'scripts', ignore=shutil.ignore_patterns('__pycache__', '*.json'))
+        data_dir = self.root / 'data' / 'forms'
+        data_dir.mkdir(parents=True)
+        for name in self.form_names:
+            (data_dir / f'{name}.json').write_text(
+                json.dumps({'title': name, 'downloads': {}}, ensure_ascii=False), encoding='utf-8'
+            )
+        (self.root / 'public' / 'files' / 'forms').mkdir(parents=True)
+        return self
+
+    def __exit__(self, *exc):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def run(self, script, *args, timeout=600):
+        """샌드박스에서 스크립트 실행 → (종료 코드, 출력, 걸린 시간)"""
+        started = time.monotonic()
+        completed = subprocess.run(
+            [sys.executable, str(self.root / 'scripts' / script), *args],
+            cwd=self.root / 'scripts', capture_output=True, text=True, timeout=timeout,
+        )
+        return completed.returncode, completed.stdout + completed.stderr, time.monotonic() - started
+
+    def form_json(self, name):
+        return json.loads((self.root / 'data' / 'forms' / f'{name}.json').read_text(encoding='utf-8'))
+
+    def read_json(self, relative):
+        path = self.root / relative
+        return json.loads(path.read_text(encoding='utf-8')) if path.exists() else {}
+
+
+class CheckReport:
+    """점검 결과 출력 (✓/✗) + 실패 수"""
+
+    def __init__(self):
+        self.failures = 0
+
+    def check(self, ok, message):
+        print(f"  {'✓' if ok else '✗'} {message}")
+        if not ok:
+            self.failures += 1
+        return ok
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+양식 다운로드 링크 수집 - 단계별(tier) 획득
+
+- 1단계 http: requests + lxml로 정적 HTML에서 다운로드 링크 추출 (브라우저 없음)
+  후보 순위는 form_links.LinkRanker (도메인별 학습 패턴 포함)
+- 2단계 browser: JavaScript가 필요한 페이지만 Playwright로 처리 (호출하는 스크립트 담당)
+- 도메인별로 마지막에 성공한 단계를 .claude/cache/acquire-tiers.json에 기억
+  → 브라우저가 필요했던 사이트는 다음 실행에서 http 단계를 건너뜀
+
+사용법:
+  from form_acquire import fetch_download_links, TierMemory
+  tiers = TierMemory.load()
+  if tiers.tier_for(url) == "http":
+      links = fetch_download_links(url, "폐업신고서")
+"""
+
+import os
+import re
+import json
+import threading
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlparse
+
+import requests
+import lxml.html
+
+from form_links import LinkRanker
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TIER_CACHE_PATH = PROJECT_ROOT / ".claude" / "cache" / "acquire-tiers.json"
+
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
+}
+
+TIER_HTTP = 'http'
+TIER_BROWSER = 'browser'
+
+_RANKER = None
+
+# JavaScript로 다운로드하는 버튼 (href="javascript:fn_fileDown(...)", onclick="download(...)")
+JS_DOWNLOAD_RE = re.compile(r'down|file|attach', re.IGNORECASE)
+META_CHARSET_RE = re.compile(rb'<meta[^>]+charset=["\']?([\w-]+)', re.IGNORECASE)
+
+# 본문 텍스트가 짧고 스크립트가 있으면 JS로 그리는 껍데기 페이지로 판단
+MIN_STATIC_TEXT = 200
+
+
+# ============================================================
+# 1단계: HTTP + lxml
+# ============================================================
+def sniff_encoding(response):
+    """응답 인코딩: Content-Type 헤더 → <meta charset> → UTF-8"""
+    if 'charset=' in response.headers.get('Content-Type', '').lower():
+        return response.encoding
+    match = META_CHARSET_RE.search(response.content[:4096])
+    return match.group(1).decode('ascii') if match else 'utf-8'
+
+
+def fetch_html(url, session=None, params=None, timeout=30):
+    """페이지 HTML → lxml 문서 (링크는 절대 URL로 변환)"""
+    http = session or requests
+    response = http.get(url, headers=HEADERS, params=params, timeout=timeout)
+    response.raise_for_status()
+    parser = lxml.html.HTMLParser(encoding=sniff_encoding(response))
+    doc = lxml.html.fromstring(response.content, base_url=response.url, parser=parser)
+    doc.make_links_absolute(response.url, resolve_base_href=True)
+    return doc
+
+
+def anchor_links(doc):
+    """문서의 (href, 텍스트) 목록 - href는 절대 URL"""
+    links = []
+    for anchor in doc.iter('a'):
+        href = anchor.get('href')
+        if href and not href.startswith(('javascript:', '#', 'mailto:')):
+            links.append((href, anchor.text_content().strip()))
+    return links
+
+
+def default_ranker():
+    """공용 링크 순위 엔진 (학습 패턴은 한 번만 로드)"""
+    global _RANKER
+    if _RANKER is None:
+        _RANKER = LinkRanker.load()
+    return _RANKER
+
+
+def extract_download_links(doc, form_name, limit=5, ranker=None):
+    """lxml 문서에서 다운로드 링크 후보 (순위 엔진 점수 높은 순)"""
+    return (ranker or default_ranker()).rank(doc, form_name, limit)
+
+
+def learn_link(link, success, ranker=None):
+    """시도한 링크의 다운로드 결과를 도메인 패턴에 학습"""
+    (ranker or default_ranker()).learn(link, success)
+
+
+def needs_javascript(doc):
+    """정적 HTML만으로는 부족한 페이지인지 (JS 다운로드 버튼 / 내용 없는 껍데기 페이지)"""
+    for element in doc.iter('a', 'button', 'input'):
+        href = element.get('href') or ''
+        script = (href if href.startswith('javascript:') else '') + (element.get('onclick') or '')
+        if script and JS_DOWNLOAD_RE.search(script):
+            return True
+
+    text = ''.join(doc.xpath('//body//text()[not(ancestor::script) and not(ancestor::style)]'))
+    return len(text.strip()) < MIN_STATIC_TEXT and bool(doc.xpath('//script'))
+
+
+def discover(url, form_name, session=None, limit=5):
+    """
+    1단계 링크 탐색
+
+    Returns:
+        (링크 후보 목록, 브라우저 필요 여부)
+        - 페이지를 못 받았거나 JS 의존 페이지면 브라우저 필요
+    """
+    try:
+        doc = fetch_html(url, session=session)
+    except (requests.RequestException, ValueError) as e:
+        print(f"    ⚠️ HTTP 페이지 분석 실패: {e}")
+        return [], True
+    return extract_download_links(doc, form_name, limit), needs_javascript(doc)
+
+
+def fetch_download_links(url, form_name, session=None, limit=5):
+    """페이지를 HTTP로 받아 다운로드 링크 후보 추출 (실패 시 빈 목록)"""
+    links, _ = discover(url, form_name, session, limit)
+    return links
+
+
+# ============================================================
+# 도메인별 단계 기억
+# ============================================================
+def domain_of(url):
+    host = urlparse(url).hostname or ''
+    return host[4:] if host.startswith('www.') else host
+
+
+class TierMemory:
+    """도메인 → 마지막으로 성공한 단계 (스레드 안전)"""
+
+    def __init__(self, path=TIER_CACHE_PATH):
+        self.path = Path(path)
+        self.domains = {}  # 도메인 → {"tier", "successes", "updatedAt"}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path=TIER_CACHE_PATH):
+        memory = cls(path)
+        if memory.path.exists():
+            try:
+                memory.domains = json.loads(memory.path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                memory.domains = {}
+        return memory
+
+    def tier_for(self, url):
+        """이 URL에 먼저 시도할 단계 (기록 없으면 http)"""
+        return self.domains.get(domain_of(url), {}).get('tier', TIER_HTTP)
+
+    def record(self, url, tier):
+        """성공한 단계 기록 + 저장"""
+        domain = domain_of(url)
+        with self.lock:
+            entry = self.domains.setdefault(domain, {'tier': tier, 'successes': {}})
+            entry['tier'] = tier
+            entry['successes'][tier] = entry['successes'].get(tier, 0) + 1
+            entry['updatedAt'] = datetime.now().strftime('%Y-%m-%d %H:%M')
+            self.save()
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(self.domains.items())), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+양식 파일 공용 다운로더
+
+- 임시 파일(<이름>.part)로 스트리밍 저장 → 검증 후 원자적 rename
+  (전송이 끊겨도 최종 경로에 잘린 파일이 남지 않음)
+- .part가 남아 있으면 HTTP Range로 이어받기
+- 크기(Content-Length / Content-Range) + 파일 시그니처 검증
+  (HWP/DOC/XLS: OLE D0CF11E0, PDF: %PDF, DOCX/HWPX/XLSX: ZIP, HWP는 HWPX인 ZIP도 허용)
+- sniff=True면 URL로 추정한 확장자와 내용이 다를 때 시그니처로 확장자 결정
+  (확장자 없는 download.do가 PDF를 주면 <이름>.pdf로 저장)
+- 파일별 SHA-256 + 원본 URL / ETag / Last-Modified를 data/form-checksums.json에 기록
+- conditional=True면 기록된 ETag/Last-Modified로 조건부 요청 → 변경 없으면 304로 전송 생략
+
+사용법:
+  from form_download import download, DownloadError
+  result = download(url, "public/files/forms/폐업신고서.hwp", session=session)
+  # {"path", "ext", "size", "sha256", "resumed", "notModified"}
+
+  # 이미 받은 파일이 있으면 바뀐 경우에만 전송
+  result = download(url, save_path, conditional=True)
+  if result["notModified"]: ...
+"""
+
+import os
+import re
+import json
+import hashlib
+import threading
+from datetime import datetime
+from pathlib import Path
+
+import requests
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CHECKSUMS_PATH = PROJECT_ROOT / "data" / "form-checksums.json"
+
+CHUNK_SIZE = 64 * 1024
+MIN_FILE_SIZE = 500  # 이보다 작으면 오류 페이지로 간주
+
+OLE_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+PDF_MAGIC = b'%PDF'
+ZIP_MAGIC = b'PK\x03\x04'
+
+# 확장자 → 허용 시그니처
+MAGIC_BY_EXT = {
+    'hwp': (OLE_MAGIC, ZIP_MAGIC),  # HWPX(ZIP)를 .hwp 이름으로 배포하는 곳도 있음 (hwp_reader가 둘 다 읽음)
+    'doc': (OLE_MAGIC,),
+    'xls': (OLE_MAGIC,),
+    'pdf': (PDF_MAGIC,),
+    'docx': (ZIP_MAGIC,),
+    'xlsx': (ZIP_MAGIC,),
+    'hwpx': (ZIP_MAGIC,),
+}
+
+_CONTENT_RANGE_RE = re.compile(r'bytes\s+(?:(\d+)-\d+|\*)/(\d+|\*)')
+_checksum_lock = threading.Lock()
+
+
+class DownloadError(Exception):
+    """다운로드/검증 실패"""
+
+
+def file_extension(path):
+    return Path(path).suffix.lower().lstrip('.')
+
+
+def detect_format(head):
+    """파일 앞부분으로 형식 판별 ('ole' / 'pdf' / 'zip' / 'html' / None)"""
+    if head.startswith(OLE_MAGIC):
+        return 'ole'
+    if head.startswith(PDF_MAGIC):
+        return 'pdf'
+    if head.startswith(ZIP_MAGIC):
+        return 'zip'
+    lowered = head.lstrip().lower()
+    if lowered.startswith((b'<!doctype', b'<html', b'<?xml', b'<script')):
+        return 'html'
+    return None
+
+
+def sniffed_extension(head, ext):
+    """
+    내용에 맞는 확장자: 추정한 ext가 맞으면 그대로, 아니면 시그니처로 판별 (판별 불가면 None)
+    ZIP은 DOCX/HWPX/XLSX를 구분할 수 없어 추정 확장자가 ZIP 형식일 때만 인정
+    """
+    if check_magic(head, ext):
+        return ext
+    kind = detect_format(head)
+    if kind == 'pdf':
+        return 'pdf'
+    if kind == 'ole':
+        return 'hwp'
+    return None
+
+
+def check_magic(head, ext):
+    """확장자에 맞는 시그니처인지 확인 (알 수 없는 확장자는 HTML만 거부)"""
+    expected = MAGIC_BY_EXT.get(ext)
+    if expected is None:
+        return detect_format(head) != 'html'
+    return head.startswith(expected)
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _parse_content_range(value):
+    """'bytes 100-199/1000' → (100, 1000), 알 수 없는 값은 None"""
+    match = _CONTENT_RANGE_RE.search(value or '')
+    if not match:
+        return None, None
+    start = int(match.group(1)) if match.group(1) else None
+    total = int(match.group(2)) if match.group(2) != '*' else None
+    return start, total
+
+
+def validator_headers(record):
+    """기록된 검증값 → 조건부 요청 헤더"""
+    headers = {}
+    if record.get('etag'):
+        headers['If-None-Match'] = record['etag']
+    if record.get('lastModified'):
+        headers['If-Modified-Since'] = record['lastModified']
+    return headers
+
+
+def _response_validators(response):
+    return {
+        'etag': response.headers.get('ETag'),
+        'lastModified': response.headers.get('Last-Modified'),
+    }
+
+
+def _load_part_meta(meta_path):
+    try:
+        return json.loads(meta_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def download(url, save_path, session=None, headers=None, timeout=60, min_size=MIN_FILE_SIZE, resume=True,
+             conditional=False, sniff=False):
+    """
+    URL → save_path 다운로드 (이어받기 + 검증 + 원자적 저장)
+
+    Args:
+        conditional: 같은 URL로 받은 기록이 있으면 If-None-Match / If-Modified-Since 전송
+            (호출자가 기존 파일을 가지고 있을 때만 사용)
+        sniff: save_path의 확장자가 추정값일 때 True - 내용이 다른 형식(PDF/OLE)이면
+            그 확장자로 저장 (결과의 path/ext 확인)
+
+    Returns:
+        {"path", "ext", "size", "sha256", "resumed", "notModified"}
+        304 응답이면 notModified=True, path=None, size/sha256은 기록값
+
+    Raises:
+        DownloadError: HTTP 오류, 크기 불일치, 시그니처 불일치
+        (크기가 모자란 경우에만 .part를 남겨 다음 실행에서 이어받음)
+    """
+    http = session or requests
+    save_path = Path(save_path)
+    part_path = save_path.with_name(save_path.name + '.part')
+    save_path.parent.mkdir(parents=True, exist_ok=True)
+
+    meta_path = save_path.with_name(save_path.name + '.part.meta')
+
+    offset = part_path.stat().st_size if resume and part_path.exists() else 0
+    request_headers = dict(headers or {})
+    record = load_checksums().get(save_path.name) or {}
+    if offset:
+        request_headers['Range'] = f'bytes={offset}-'
+        # 서버 파일이 바뀌었으면 Range 대신 전체(200)를 받도록
+        part_meta = _load_part_meta(meta_path)
+        if_range = part_meta.get('etag') or part_meta.get('lastModified')
+        if if_range:
+            request_headers['If-Range'] = if_range
+    elif conditional and record.get('url') == url:
+        request_headers.update(validator_headers(record))
+
+    digest = hashlib.sha256()
+    with http.get(url, headers=request_headers, timeout=timeout, stream=True, allow_redirects=True) as response:
+        validators = _response_validators(response)
+        if response.status_code == 304:
+            record_checksum(save_path, {**record, 'notModified': True}, url, validators=validators)
+            return {
+                'path': None,
+                'ext': file_extension(save_path),
+                'size': record.get('size'),
+                'sha256': record.get('sha256'),
+                'resumed': False,
+                'notModified': True,
+            }
+
+        if response.status_code in (200, 206):
+            # 이어받기 때 If-Range로 쓸 검증값 (전송이 끊겨도 남음)
+            if response.status_code == 200 and (validators['etag'] or validators['lastModified']):
+                meta_path.write_text(json.dumps(validators), encoding='utf-8')
+
+        if response.status_code == 416 and offset:
+            # 이미 끝까지 받은 .part - 서버가 알려준 전체 크기와 같으면 완료로 처리
+            _, total = _parse_content_range(response.headers.get('Content-Range'))
+            if total is None or total != offset:
+                part_path.unlink()
+                raise DownloadError("이어받기 불가 (HTTP 416), 다시 시도 필요")
+            expected = total
+        elif response.status_code == 206 and offset:
+            start, total = _parse_content_range(response.headers.get('Content-Range'))
+            if start != offset:
+                part_path.unlink()
+                raise DownloadError(f"이어받기 위치 불일치 ({start} != {offset})")
+            expected = total
+            _write_body(response, part_path, 'ab', digest)
+        elif response.status_code == 200:
+            # Range 미지원 서버 → 처음부터
+            offset = 0
+            length = response.headers.get('Content-Length')
+            expected = int(length) if length and length.isdigit() else None
+            if 'gzip' in response.headers.get('Content-Encoding', ''):
+                expected = None  # 압축 전송이면 Content-Length와 저장 크기가 다름
+            _write_body(response, part_path, 'wb', digest)
+        else:
+            raise DownloadError(f"HTTP {response.status_code}")
+
+    size = part_path.stat().st_size
+    if expected is not None and size != expected:
+        # 모자라면 .part를 남겨 이어받기, 넘치면 버림
+        if size > expected:
+            part_path.unlink()
+        raise DownloadError(f"크기 불일치 ({size:,} / {expected:,} bytes)")
+
+    if size < min_size:
+        _discard(part_path, meta_path)
+        raise DownloadError(f"파일이 너무 작음 ({size} bytes)")
+
+    with open(part_path, 'rb') as f:
+        head = f.read(16)
+    ext = sniffed_extension(head, file_extension(save_path)) if sniff else file_extension(save_path)
+    if ext and ext != file_extension(save_path):
+        save_path = save_path.with_suffix(f'.{ext}')
+    if not ext or not check_magic(head, ext):
+        _discard(part_path, meta_path)
+        kind = detect_format(head)
+        if kind == 'html':
+            raise DownloadError("HTML 페이지임 (파일 아님)")
+        raise DownloadError(f"유효한 {file_extension(save_path).upper()} 파일이 아님 ({kind or '알 수 없는 형식'})")
+
+    # 이어받은 파일은 앞부분이 이전 실행에서 쓰였으므로 전체를 다시 해시
+    sha256 = sha256_file(part_path) if offset else digest.hexdigest()
+    os.replace(part_path, save_path)
+    if offset:
+        validators = {key: value or _load_part_meta(meta_path).get(key) for key, value in validators.items()}
+    if meta_path.exists():
+        meta_path.unlink()
+
+    result = {
+        'path': str(save_path),
+        'ext': ext,
+        'size': size,
+        'sha256': sha256,
+        'resumed': bool(offset),
+        'notModified': False,
+    }
+    record_checksum(save_path, result, url, validators=validators)
+    return result
+
+
+def _discard(part_path, meta_path):
+    """이어받을 가치가 없는 .part와 검증값 파일 삭제"""
+    part_path.unlink()
+    if meta_path.exists():
+        meta_path.unlink()
+
+
+def _write_body(response, part_path, mode, digest):
+    with open(part_path, mode) as f:
+        for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+            if chunk:
+                f.write(chunk)
+                digest.update(chunk)
+
+
+# ============================================================
+# 체크섬 기록
+# ============================================================
+def load_checksums(path=CHECKSUMS_PATH):
+    path = Path(path)
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def record_checksum(save_path, result, url=None, validators=None, path=CHECKSUMS_PATH):
+    """
+    파일명 → {sha256, size, url, etag, lastModified, downloadedAt, checkedAt} 기록
+    (스레드 안전, 원자적 저장 / 304 응답이면 checkedAt만 갱신)
+    """
+    path = Path(path)
+    now = datetime.now().strftime('%Y-%m-%d %H:%M')
+    validators = validators or {}
+    with _checksum_lock:
+        checksums = load_checksums(path)
+        previous = checksums.get(Path(save_path).name, {})
+        not_modified = result.get('notModified')
+        checksums[Path(save_path).name] = {
+            'sha256': result.get('sha256'),
+            'size': result.get('size'),
+            'url': url,
+            # 304 응답에 검증값이 빠져 있으면 이전 값 유지
+            'etag': validators.get('etag') or (previous.get('etag') if not_modified else None),
+            'lastModified': validators.get('lastModified') or (previous.get('lastModified') if not_modified else None),
+            'downloadedAt': previous.get('downloadedAt') if not_modified else now,
+            'checkedAt': now,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(checksums.items())), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+
+
+def is_complete(save_path, checksums=None):
+    """
+    이미 받은 파일이 온전한지 확인
+    (시그니처 일치 + 기록된 크기가 있으면 크기 일치)
+    """
+    save_path = Path(save_path)
+    if not save_path.exists():
+        return False
+    size = save_path.stat().st_size
+    if size < MIN_FILE_SIZE:
+        return False
+    with open(save_path, 'rb') as f:
+        if not check_magic(f.read(16), file_extension(save_path)):
+            return False
+    record = (checksums if checksums is not None else load_checksums()).get(save_path.name)
+    return record is None or record.get('size') == size
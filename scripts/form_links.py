@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+다운로드 링크 순위 엔진
+
+페이지의 <a> 후보마다 점수를 매겨 맞는 파일 링크를 먼저 시도하게 함
+- 앵커 텍스트: 양식명(띄어쓰기 무시) / 서식·양식·별지 / 뷰어·설치 같은 오답 단어
+- URL 패턴: 확장자(.hwp > .docx > .pdf), 다운로드 경로, 파일 ID 파라미터, 파일명에 양식명
+- 주변 DOM: 같은 행(tr/li/dd)의 텍스트, title 속성, 첨부파일 영역(class/id)
+- 학습: 도메인별로 성공/실패한 URL 모양과 첨부 영역을 .claude/cache/link-patterns.json에 기록
+  ('/file/{n}/get/FILE_{n}/download.do' 가 성공했던 사이트는 같은 모양을 우선)
+
+사용법:
+  from form_links import LinkRanker
+  ranker = LinkRanker.load()
+  links = ranker.rank(doc, "폐업신고서")   # doc: lxml 문서 (절대 URL)
+  ranker.learn(links[0], success=True)
+"""
+
+import os
+import re
+import json
+import threading
+from pathlib import Path
+from urllib.parse import unquote, urlparse, parse_qsl
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PATTERNS_PATH = PROJECT_ROOT / ".claude" / "cache" / "link-patterns.json"
+
+# 다운로드 가능한 파일 확장자 → URL에 드러났을 때 점수 (편집 가능한 형식 우선)
+EXTENSION_SCORES = {'hwp': 20, 'hwpx': 18, 'docx': 12, 'doc': 12, 'pdf': 10, 'xlsx': 5, 'xls': 5}
+DOWNLOAD_EXTENSIONS = ['.' + ext for ext in EXTENSION_SCORES]
+DOWNLOAD_KEYWORDS = ['download', 'filedown', 'ntsfiledown', 'file/1/get', 'fileview', 'atchfile', 'getfile']
+FILE_ID_PARAMS = {'atchfileid', 'filesn', 'file_seq', 'fileid', 'file_id', 'fileno', 'filenm', 'filepath'}
+
+FORM_WORDS = ('서식', '양식', '별지', '신청서', '신고서')
+DOWNLOAD_WORDS = ('다운로드', '내려받기', '첨부')
+NEGATIVE_WORDS = ('뷰어', 'viewer', '설치', '매뉴얼', '가이드', '안내문', '개인정보', '로그인', '회원가입',
+                  '작성예시', '작성 예시', '기재례', '한컴오피스')
+NEGATIVE_URL_RE = re.compile(r'\.(exe|msi|jpg|jpeg|png|gif|css|js)(\?|$)|/login|/member/', re.IGNORECASE)
+ATTACHMENT_RE = re.compile(r'file|attach|down|첨부', re.IGNORECASE)
+CONTEXT_TAGS = {'tr', 'li', 'dd', 'dl', 'td', 'p'}
+MAX_CONTEXT_TEXT = 300
+
+# 학습된 패턴 점수 상한
+LEARNED_BONUS = 40
+LEARNED_PENALTY = 30
+
+_SPACE_RE = re.compile(r'\s+')
+_DIGITS_RE = re.compile(r'\d+')
+_FILE_NAME_RE = re.compile(r'[^/]+\.(hwpx?|pdf|docx?|xlsx?)$', re.IGNORECASE)
+
+
+def compact(text):
+    return _SPACE_RE.sub('', text or '')
+
+
+def guess_extension(href, text):
+    """다운로드 링크면 확장자, 아니면 None"""
+    lowered = href.lower()
+    path = unquote(urlparse(lowered).path)
+    for ext in sorted(EXTENSION_SCORES, key=len, reverse=True):
+        if path.endswith('.' + ext) or f'.{ext}' in lowered:
+            return ext
+
+    if any(kw in lowered for kw in DOWNLOAD_KEYWORDS):
+        text = text.lower()
+        if 'hwp' in lowered or 'hwp' in text or '한글' in text:
+            return 'hwp'
+        elif 'pdf' in lowered or 'pdf' in text:
+            return 'pdf'
+        elif 'doc' in lowered or 'doc' in text or 'word' in text:
+            return 'docx'
+        return 'hwp'  # 기본값
+
+    return None
+
+
+def url_signature(url):
+    """
+    URL 모양 (숫자/파일명 일반화 + 쿼리 키만)
+    '/file/1/get/FILE_000010099/download.do' → '/file/{n}/get/FILE_{n}/download.do'
+    """
+    parsed = urlparse(url)
+    path = _FILE_NAME_RE.sub(lambda m: '*.' + m.group(1).lower(), unquote(parsed.path))
+    path = _DIGITS_RE.sub('{n}', path)
+    keys = sorted({key.lower() for key, _ in parse_qsl(parsed.query, keep_blank_values=True)})
+    return path + ('?' + '&'.join(keys) if keys else '')
+
+
+def domain_of(url):
+    host = urlparse(url).hostname or ''
+    return host[4:] if host.startswith('www.') else host
+
+
+def _context(anchor):
+    """
+    링크 주변 정보
+    Returns: (같은 행 텍스트, 첨부 영역 시그니처 또는 None)
+    """
+    row_text = ''
+    container = None
+    node = anchor.getparent()
+    depth = 0
+    while node is not None and depth < 6:
+        tag = node.tag if isinstance(node.tag, str) else ''
+        if not row_text and tag in CONTEXT_TAGS:
+            row_text = node.text_content()[:MAX_CONTEXT_TEXT]
+        if container is None:
+            marker = f"{node.get('class', '')} {node.get('id', '')}".strip()
+            if marker and ATTACHMENT_RE.search(marker):
+                container = f"{tag}.{marker.split()[0]}"
+        node = node.getparent()
+        depth += 1
+    return row_text, container
+
+
+class LinkRanker:
+    """다운로드 링크 후보 점수화 + 도메인별 패턴 학습 (스레드 안전)"""
+
+    def __init__(self, path=PATTERNS_PATH):
+        self.path = Path(path)
+        # 도메인 → {"url": {시그니처: {"ok", "fail"}}, "context": {시그니처: {"ok", "fail"}}}
+        self.domains = {}
+        self.lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path=PATTERNS_PATH):
+        ranker = cls(path)
+        if ranker.path.exists():
+            try:
+                ranker.domains = json.loads(ranker.path.read_text(encoding='utf-8'))
+            except (OSError, ValueError):
+                ranker.domains = {}
+        return ranker
+
+    def save(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(self.domains.items())), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.path)
+
+    # === 학습 ===
+    def _learned(self, domain, kind, signature):
+        """학습된 패턴 점수 (성공 비율만큼 가점, 실패 비율만큼 감점)"""
+        if not signature:
+            return 0.0
+        stats = self.domains.get(domain, {}).get(kind, {}).get(signature)
+        if not stats:
+            return 0.0
+        ok, fail = stats.get('ok', 0), stats.get('fail', 0)
+        total = ok + fail + 1  # 한 번의 기록으로 과신하지 않도록 +1
+        return LEARNED_BONUS * ok / total - LEARNED_PENALTY * fail / total
+
+    def learn(self, link, success):
+        """다운로드 결과를 도메인 패턴에 반영"""
+        domain = domain_of(link['url'])
+        outcome = 'ok' if success else 'fail'
+        with self.lock:
+            entry = self.domains.setdefault(domain, {'url': {}, 'context': {}})
+            for kind, signature in (('url', link.get('signature')), ('context', link.get('container'))):
+                if signature:
+                    stats = entry[kind].setdefault(signature, {'ok': 0, 'fail': 0})
+                    stats[outcome] += 1
+            self.save()
+
+    # === 점수 ===
+    def score(self, form_name, href, text, title='', row_text='', container=None):
+        """후보 하나의 점수와 확장자 (다운로드 링크가 아니면 확장자 None)"""
+        domain = domain_of(href)
+        signature = url_signature(href)
+        learned = self._learned(domain, 'url', signature) + self._learned(domain, 'context', container) / 2
+
+        ext = guess_extension(href, text)
+        if not ext and learned <= 0:
+            return None, 0.0, signature
+
+        name = compact(form_name)
+        score = 0.0
+
+        # 앵커 텍스트
+        anchor = compact(text)
+        if name and name in anchor:
+            score += 50
+        elif any(word in text for word in FORM_WORDS):
+            score += 10
+        if any(word in text for word in DOWNLOAD_WORDS):
+            score += 5
+        if any(word in text.lower() for word in NEGATIVE_WORDS):
+            score -= 40
+
+        # URL
+        decoded = compact(unquote(href))
+        if name and name in decoded:
+            score += 40
+        path = unquote(urlparse(href).path).lower()
+        explicit = next((ext_ for ext_ in EXTENSION_SCORES if path.endswith('.' + ext_)), None)
+        if explicit:
+            score += EXTENSION_SCORES[explicit]
+        elif any(kw in href.lower() for kw in DOWNLOAD_KEYWORDS):
+            score += 8
+            # 'fileDown.do?fileSn=2' 처럼 URL에 확장자가 없으면 텍스트의 파일명('...hwp')으로 형식 선호
+            if ext and f'.{ext}' in text.lower():
+                score += EXTENSION_SCORES[ext] / 2
+        if {key.lower() for key, _ in parse_qsl(urlparse(href).query)} & FILE_ID_PARAMS:
+            score += 5
+        if NEGATIVE_URL_RE.search(href):
+            score -= 50
+
+        # 주변 DOM
+        if name and name in compact(title):
+            score += 20
+        if name and name not in anchor and name in compact(row_text):
+            score += 25
+        if container:
+            score += 10
+
+        return ext or 'hwp', score + learned, signature
+
+    def rank(self, doc, form_name, limit=5):
+        """
+        lxml 문서의 다운로드 링크 후보 (점수 높은 순)
+
+        Returns:
+            [{"url", "text", "ext", "relevance", "signature", "container"}, ...]
+        """
+        candidates = {}
+        for order, anchor in enumerate(doc.iter('a')):
+            href = anchor.get('href')
+            if not href or href.startswith(('javascript:', '#', 'mailto:')):
+                continue
+            text = anchor.text_content().strip()
+            row_text, container = _context(anchor)
+            ext, score, signature = self.score(
+                form_name, href, text, anchor.get('title', ''), row_text, container
+            )
+            if ext is None:
+                continue
+
+            previous = candidates.get(href)
+            if previous and previous['relevance'] >= score:
+                continue
+            candidates[href] = {
+                'url': href,
+                'text': text[:50] if text else '다운로드',
+                'ext': ext,
+                'relevance': round(score, 1),
+                'signature': signature,
+                'container': container,
+                'order': order,
+            }
+
+        ranked = sorted(candidates.values(), key=lambda c: (-c['relevance'], c['order']))
+        for candidate in ranked:
+            del candidate['order']
+        return ranked[:limit]
@@ -0,0 +1,414 @@
+#!/usr/bin/env python3
+"""
+양식 파일 콘텐츠 주소 저장소 (SHA-256 blob + 이름 → 해시 매니페스트)
+
+- 파일 내용은 public/files/blobs/<해시 앞 2자리>/<해시>.<확장자>에 한 번만 저장
+- 양식 파일명('폐업신고서.hwp') → 해시는 data/form-store.json에 기록
+- 같은 서식을 여러 이름으로 받아도 blob은 하나 (중복 다운로드 즉시 감지)
+- 변환 결과도 (원본 해시, 대상 형식) → {결과 해시, 변환기 버전, 변환 시각}으로 기록
+  → 같은 입력 + 같은 변환기면 재변환하지 않음 (결과 blob 존재/크기 확인 후 재사용)
+- 변환 기록은 data/forms/*.json downloads(pdf/doc)의 원본 데이터 (--sync-downloads)
+- 사용자에게 보이는 파일명은 data/forms/*.json의 downloadNames가 담당
+
+사용법:
+  python form_store.py               # 저장소 현황
+  python form_store.py --migrate     # public/files/forms/* 를 저장소로 옮기고 JSON 경로 갱신
+  python form_store.py --gc          # 어떤 이름도 가리키지 않는 blob 삭제
+  python form_store.py --sync-downloads  # 변환 기록으로 JSON downloads.pdf / downloads.doc 갱신
+
+  from form_store import FormStore
+  store = FormStore.load()
+  sha, duplicate = store.add_file(path, "폐업신고서.hwp")
+  store.url_for("폐업신고서.hwp")   # "/files/blobs/3f/3f2a....hwp"
+"""
+
+import os
+import sys
+import json
+import shutil
+import hashlib
+import argparse
+import threading
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PUBLIC_DIR = PROJECT_ROOT / "public"
+BLOB_DIR = PUBLIC_DIR / "files" / "blobs"
+LEGACY_DIR = PUBLIC_DIR / "files" / "forms"
+DATA_DIR = PROJECT_ROOT / "data" / "forms"
+MANIFEST_PATH = PROJECT_ROOT / "data" / "form-store.json"
+MANIFEST_VERSION = 2
+
+# 변환 결과 형식 → data/forms/*.json downloads 키 (DOCX는 'doc' 키를 씀)
+DOWNLOAD_KEYS = {'pdf': 'pdf', 'docx': 'doc'}
+
+CHUNK_SIZE = 64 * 1024
+
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def split_name(name):
+    """'폐업신고서.hwp' → ('폐업신고서', 'hwp')"""
+    stem, _, ext = name.rpartition('.')
+    return stem, ext.lower()
+
+
+class FormStore:
+    """콘텐츠 주소 양식 저장소 (스레드 안전)"""
+
+    def __init__(self, blob_dir=BLOB_DIR, manifest_path=MANIFEST_PATH):
+        self.blob_dir = Path(blob_dir)
+        self.manifest_path = Path(manifest_path)
+        self.names = {}        # 파일명 → sha256
+        self.blobs = {}        # sha256 → {"ext", "size"}
+        # 원본 sha256 → {대상 형식: {"sha256", "converter", "convertedAt"}}
+        self.conversions = {}
+        self.lock = threading.RLock()
+
+    @classmethod
+    def load(cls, blob_dir=BLOB_DIR, manifest_path=MANIFEST_PATH):
+        store = cls(blob_dir, manifest_path)
+        if store.manifest_path.exists():
+            try:
+                data = json.loads(store.manifest_path.read_text(encoding='utf-8'))
+                if data.get('version') in (1, MANIFEST_VERSION):
+                    store.names = data.get('names', {})
+                    store.blobs = data.get('blobs', {})
+                    store.conversions = {
+                        source: {fmt: _conversion_entry(entry) for fmt, entry in targets.items()}
+                        for source, targets in data.get('conversions', {}).items()
+                    }
+            except (OSError, ValueError):
+                pass
+        return store
+
+    def save(self):
+        """매니페스트 원자적 저장"""
+        with self.lock:
+            self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifest_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': MANIFEST_VERSION,
+                    'names': dict(sorted(self.names.items())),
+                    'blobs': dict(sorted(self.blobs.items())),
+                    'conversions': dict(sorted(self.conversions.items())),
+                }, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.manifest_path)
+
+    # === blob 경로 ===
+    def blob_path(self, sha, ext):
+        return self.blob_dir / sha[:2] / f"{sha}.{ext}"
+
+    def verify_blob(self, sha, ext=None):
+        """blob 파일이 있고 기록된 크기와 같은지"""
+        info = self.blobs.get(sha)
+        if not info or (ext and info['ext'] != ext):
+            return False
+        path = self.blob_path(sha, info['ext'])
+        return path.exists() and path.stat().st_size == info['size']
+
+    def blob_url(self, sha, ext):
+        """public/ 기준 URL"""
+        return '/' + self.blob_path(sha, ext).relative_to(PUBLIC_DIR).as_posix()
+
+    # === 추가/조회 ===
+    def add_file(self, path, name=None, sha=None, move=True, save=True):
+        """
+        파일을 저장소에 넣고 name이 가리키게 함
+
+        Args:
+            path: 넣을 파일
+            name: 양식 파일명 (기본: path 파일명)
+            sha: 이미 계산된 SHA-256 (다운로더 결과 재사용)
+            move: True면 원본 파일 제거 (public/files/forms에 사본을 남기지 않음)
+
+        Returns:
+            (sha256, duplicate) - duplicate는 같은 내용의 blob이 이미 있었는지
+        """
+        path = Path(path)
+        name = name or path.name
+        _, ext = split_name(name)
+        sha = sha or sha256_file(path)
+
+        with self.lock:
+            target = self.blob_path(sha, ext)
+            duplicate = target.exists()
+            if not duplicate:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = target.with_name(target.name + '.tmp')
+                shutil.copyfile(path, tmp_path)
+                os.replace(tmp_path, target)
+            if move and path.resolve() != target.resolve():
+                path.unlink()
+
+            self.blobs[sha] = {'ext': ext, 'size': target.stat().st_size}
+            self.names[name] = sha
+            if save:
+                self.save()
+        return sha, duplicate
+
+    def resolve(self, name):
+        """파일명 → sha256 (blob이 실제로 있을 때만)"""
+        sha = self.names.get(name)
+        if sha and sha in self.blobs and self.blob_path(sha, self.blobs[sha]['ext']).exists():
+            return sha
+        return None
+
+    def has(self, name):
+        return self.resolve(name) is not None
+
+    def path_for(self, name):
+        sha = self.resolve(name)
+        return self.blob_path(sha, self.blobs[sha]['ext']) if sha else None
+
+    def url_for(self, name):
+        sha = self.resolve(name)
+        return self.blob_url(sha, self.blobs[sha]['ext']) if sha else None
+
+    def names_with_ext(self, ext):
+        return sorted(name for name in self.names if split_name(name)[1] == ext and self.has(name))
+
+    # === 변환 캐시 ===
+    def cached_conversion(self, source_sha, target_ext, converter=None):
+        """
+        같은 원본을 이미 변환한 결과 sha256
+        (결과 blob이 온전하고, converter를 주면 기록된 변환기 버전이 같을 때만)
+        """
+        entry = self.conversions.get(source_sha, {}).get(target_ext)
+        if not entry:
+            return None
+        if converter and entry.get('converter') and entry['converter'] != converter:
+            return None
+        if self.verify_blob(entry['sha256'], target_ext):
+            return entry['sha256']
+        return None
+
+    def record_conversion(self, source_sha, target_ext, out_sha, converter=None, save=True):
+        with self.lock:
+            self.conversions.setdefault(source_sha, {})[target_ext] = {
+                'sha256': out_sha,
+                'converter': converter,
+                'convertedAt': datetime.now().strftime('%Y-%m-%d %H:%M'),
+            }
+            if save:
+                self.save()
+
+    def converted_outputs(self, source_sha):
+        """원본의 변환 결과 중 blob이 온전한 것 → {형식: 결과 sha256}"""
+        return {
+            fmt: entry['sha256']
+            for fmt, entry in self.conversions.get(source_sha, {}).items()
+            if self.verify_blob(entry['sha256'], fmt)
+        }
+
+    def link(self, name, sha, save=True):
+        """기존 blob을 새 이름으로 가리키기 (재변환 없이 결과 재사용)"""
+        with self.lock:
+            self.names[name] = sha
+            if save:
+                self.save()
+
+    def repoint(self, old_sha, new_sha, save=True):
+        """
+        old_sha를 가리키던 이름과 변환 기록을 new_sha로 옮김 → 옮긴 파일명 목록
+        (blob은 파일명이 내용 해시라 제자리 수정하지 않고 새 blob을 가리키게 함, 옛 blob은 --gc로 정리)
+        """
+        with self.lock:
+            moved = [name for name, sha in self.names.items() if sha == old_sha]
+            for name in moved:
+                self.names[name] = new_sha
+            for targets in self.conversions.values():
+                for entry in targets.values():
+                    if entry['sha256'] == old_sha:
+                        entry['sha256'] = new_sha
+            if save:
+                self.save()
+        return moved
+
+    # === 정리 ===
+    def unreferenced(self):
+        """어떤 파일명도 가리키지 않는 blob"""
+        referenced = set(self.names.values())
+        return sorted(sha for sha in self.blobs if sha not in referenced)
+
+    def gc(self):
+        removed = []
+        with self.lock:
+            for sha in self.unreferenced():
+                blob = self.blob_path(sha, self.blobs[sha]['ext'])
+                if blob.exists():
+                    blob.unlink()
+                del self.blobs[sha]
+                for targets in self.conversions.values():
+                    for target, entry in list(targets.items()):
+                        if entry['sha256'] == sha:
+                            del targets[target]
+                self.conversions.pop(sha, None)
+                removed.append(sha)
+            self.save()
+        return removed
+
+    def stats(self):
+        logical = sum(self.blobs[sha]['size'] for sha in self.names.values() if sha in self.blobs)
+        physical = sum(info['size'] for info in self.blobs.values())
+        return {'names': len(self.names), 'blobs': len(self.blobs), 'logical': logical, 'physical': physical}
+
+
+def _conversion_entry(entry):
+    """변환 기록 (버전 1 매니페스트는 결과 sha256 문자열만 있음)"""
+    if isinstance(entry, str):
+        return {'sha256': entry, 'converter': None, 'convertedAt': None}
+    return entry
+
+
+# ============================================================
+# data/forms/*.json 경로
+# ============================================================
+def download_url(form_name, ext, store=None):
+    """양식 파일의 공개 URL (저장소에 있으면 blob, 없으면 기존 /files/forms 경로)"""
+    store = store or FormStore.load()
+    return store.url_for(f"{form_name}.{ext}") or f"/files/forms/{form_name}.{ext}"
+
+
+def rewrite_form_json(store, data_dir=DATA_DIR):
+    """JSON의 /files/forms/<이름> 경로를 blob URL로 교체, 바뀐 파일 수 반환"""
+    changed = 0
+    for json_path in sorted(Path(data_dir).glob('*.json')):
+        data = json.loads(json_path.read_text(encoding='utf-8'))
+        downloads = data.get('downloads') or {}
+        updated = False
+        for key, url in downloads.items():
+            if isinstance(url, str) and url.startswith('/files/forms/'):
+                blob_url = store.url_for(url.rsplit('/', 1)[1])
+                if blob_url:
+                    downloads[key] = blob_url
+                    updated = True
+        if updated:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            changed += 1
+    return changed
+
+
+def rewrite_blob_urls(store, replaced, data_dir=DATA_DIR):
+    """JSON downloads의 옛 blob URL → 새 blob URL (replaced: {옛 sha256: 새 sha256}), 바뀐 파일 수 반환"""
+    changed = 0
+    for json_path in sorted(Path(data_dir).glob('*.json')):
+        data = json.loads(json_path.read_text(encoding='utf-8'))
+        downloads = data.get('downloads') or {}
+        updated = False
+        for key, url in downloads.items():
+            if not (isinstance(url, str) and url.startswith('/files/blobs/')):
+                continue
+            new_sha = replaced.get(url.rsplit('/', 1)[1].split('.', 1)[0])
+            if new_sha:
+                downloads[key] = store.blob_url(new_sha, store.blobs[new_sha]['ext'])
+                updated = True
+        if updated:
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            changed += 1
+    return changed
+
+
+def _source_sha(store, url, legacy_dir=LEGACY_DIR):
+    """downloads.hwp URL → 원본 sha256 (blob URL / 저장소 이름 / 아직 옮기지 않은 파일)"""
+    file_name = url.rsplit('/', 1)[-1]
+    if url.startswith('/files/blobs/'):
+        sha = file_name.split('.', 1)[0]
+        return sha if sha in store.blobs else None
+    legacy_path = Path(legacy_dir) / file_name
+    return store.resolve(file_name) or (sha256_file(legacy_path) if legacy_path.is_file() else None)
+
+
+def sync_downloads(store, data_dir=DATA_DIR, legacy_dir=LEGACY_DIR):
+    """
+    변환 기록 → JSON downloads.pdf / downloads.doc
+    (양식 JSON의 HWP 원본을 변환한 결과가 있으면 그 blob URL로 채움, 바뀐 파일 수 반환)
+    """
+    changed = 0
+    for json_path in sorted(Path(data_dir).glob('*.json')):
+        data = json.loads(json_path.read_text(encoding='utf-8'))
+        downloads = data.get('downloads') or {}
+        hwp_url = downloads.get('hwp')
+        if not isinstance(hwp_url, str):
+            continue
+        source_sha = _source_sha(store, hwp_url, legacy_dir)
+        outputs = store.converted_outputs(source_sha) if source_sha else {}
+
+        names = data.get('downloadNames') or {}
+        stem = split_name(names.get('hwp') or hwp_url.rsplit('/', 1)[-1])[0]
+        updated = False
+        for fmt, key in DOWNLOAD_KEYS.items():
+            if fmt not in outputs:
+                continue
+            url = store.blob_url(outputs[fmt], fmt)
+            if downloads.get(key) != url:
+                downloads[key] = url
+                updated = True
+            if key not in names:
+                names[key] = f"{stem}.{fmt}"
+                updated = True
+
+        if updated:
+            data['downloads'] = downloads
+            data['downloadNames'] = names
+            with open(json_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+            changed += 1
+    return changed
+
+
+def migrate(store, legacy_dir=LEGACY_DIR):
+    """public/files/forms의 파일을 저장소로 이동"""
+    moved, duplicates = 0, 0
+    for path in sorted(Path(legacy_dir).glob('*')):
+        # 다운로드 중 파일(.part)과 이어받기 정보(.part.meta), 임시 파일은 제외
+        if not path.is_file() or '.part' in path.name or path.suffix == '.tmp':
+            continue
+        _, duplicate = store.add_file(path, save=False)
+        moved += 1
+        duplicates += duplicate
+    store.save()
+    return moved, duplicates
+
+
+def main():
+    parser = argparse.ArgumentParser(description='양식 파일 콘텐츠 주소 저장소')
+    parser.add_argument('--migrate', action='store_true', help='public/files/forms → 저장소 이동 + JSON 경로 갱신')
+    parser.add_argument('--gc', action='store_true', help='참조 없는 blob 삭제')
+    parser.add_argument('--sync-downloads', action='store_true', help='변환 기록으로 JSON downloads.pdf/doc 갱신')
+    args = parser.parse_args()
+
+    store = FormStore.load()
+
+    if args.migrate:
+        moved, duplicates = migrate(store)
+        changed = rewrite_form_json(store)
+        print(f"📦 {moved}개 파일 이동 (중복 {duplicates}개), JSON {changed}개 갱신")
+
+    if args.gc:
+        removed = store.gc()
+        print(f"🧹 blob {len(removed)}개 삭제")
+
+    if args.sync_downloads:
+        changed = sync_downloads(store)
+        print(f"📝 변환 기록으로 JSON {changed}개 downloads 갱신")
+
+    stats = store.stats()
+    saved = stats['logical'] - stats['physical']
+    print(f"파일명 {stats['names']}개 → blob {stats['blobs']}개")
+    print(f"용량: {stats['physical']:,} bytes (중복 제거로 {saved:,} bytes 절약)")
+    print(f"매니페스트: {store.manifest_path}")
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+양식 템플릿 - 선언형 명세(제목/표/칸) → 문서 블록
+
+- 기본 명세: 사이트 미리보기 데이터(src/components/forms/FormPreview.tsx의 *_DATA)를 그대로 읽음
+  → data/forms/*.json의 previewDataKey로 연결 (없으면 page.tsx의 DEFAULT_PREVIEW_DATA)
+- SPECS: 미리보기 표만으로 부족한 양식은 명세를 직접 작성 (각서, 영수증 - 예전 create-form-hwp.py 내용)
+- 결과 블록은 odf_writer(.fodt → DOCX/PDF)와 hwpx_writer(.hwpx)가 같은 형식으로 받음
+
+명세 형식:
+  {"title": "각    서",
+   "blocks": [
+     {"type": "paragraph", "text": "...", "style": "title" | "heading" | "right" | "center"},
+     {"type": "table", "rows": [[{"label": "성명", "isHeader": True}, {"placeholder": "(성명)", "colspan": 2}], ...]},
+   ]}
+  - 표의 칸은 FormPreview의 FormField와 같은 키 (label / value / placeholder / colspan / rowspan / isHeader)
+
+사용법:
+  from form_templates import load_specs
+  for name, spec in load_specs().items():
+      blocks = spec_blocks(spec)
+"""
+
+import re
+import json
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+FORMS_DATA_DIR = PROJECT_ROOT / "data" / "forms"
+PREVIEW_TSX = PROJECT_ROOT / "src" / "components" / "forms" / "FormPreview.tsx"
+FORM_PAGE_TSX = PROJECT_ROOT / "src" / "app" / "forms" / "[slug]" / "page.tsx"
+
+DEFAULT_PREVIEW_KEY = "DEFAULT_PREVIEW_DATA"
+
+# TS 배열 리터럴: `export const 각서_DATA: FormRow[] = [ ... ];` (닫는 ]는 줄 맨 앞)
+_TS_ARRAY_RE = re.compile(r'^(?:export )?const (\w+)(?:: FormRow\[\])? = (\[.*?^\]);', re.M | re.S)
+# 문자열 / 주석 / 따옴표 없는 키 / 끝 쉼표 - 문자열 안의 '14:00' 같은 내용은 건드리지 않도록 한 번에 훑음
+_TS_TOKEN_RE = re.compile(r'"(?:\\.|[^"\\])*"|//[^\n]*|([{,]\s*)([A-Za-z_]\w*)(\s*:)|,(\s*[}\]])')
+# '(성명)', '(입력란)' 같은 안내용 자리표시는 빈 칸으로 인쇄
+_HINT_RE = re.compile(r'^\([^()]*\)$')
+
+FOOTER_DATE = "년      월      일"
+
+# 미리보기 표만으로 부족한 양식 - 명세 직접 작성
+SPECS = {
+    "각서": {
+        "title": "각    서",
+        "blocks": [
+            {"type": "table", "rows": [
+                [{"label": "작성자", "isHeader": True, "rowspan": 4}, {"label": "성명", "isHeader": True}, {"placeholder": "", "colspan": 2}],
+                [{"label": "주민번호", "isHeader": True}, {"value": "      -", "colspan": 2}],
+                [{"label": "주소", "isHeader": True}, {"placeholder": "", "colspan": 2}],
+                [{"label": "연락처", "isHeader": True}, {"placeholder": "", "colspan": 2}],
+            ]},
+            {"type": "paragraph", "text": ""},
+            {"type": "table", "rows": [
+                [{"label": "상대방", "isHeader": True, "rowspan": 4}, {"label": "성명", "isHeader": True}, {"placeholder": "", "colspan": 2}],
+                [{"label": "주민번호", "isHeader": True}, {"value": "      -", "colspan": 2}],
+                [{"label": "주소", "isHeader": True}, {"placeholder": "", "colspan": 2}],
+                [{"label": "연락처", "isHeader": True}, {"placeholder": "", "colspan": 2}],
+            ]},
+            {"type": "paragraph", "text": ""},
+            {"type": "paragraph", "text": "각서 내용", "style": "heading"},
+            {"type": "paragraph", "text": "본인은 아래 사항을 확인하고 이를 준수할 것을 각서합니다.\n\n1. \n\n2. \n\n3. \n"},
+            {"type": "paragraph", "text": "위 각서 내용을 성실히 이행할 것을 서약하며, 만약 이를 위반할 경우\n"
+                                          "민·형사상의 모든 책임을 질 것을 각서합니다.\n"},
+            {"type": "paragraph", "text": FOOTER_DATE + "\n", "style": "center"},
+            {"type": "paragraph", "text": "작성자 :                       (인)\n\n상대방 :                       (인)", "style": "right"},
+        ],
+    },
+    "영수증": {
+        "title": "영  수  증",
+        "blocks": [
+            {"type": "paragraph", "text": "금액 : 일금                원정 (₩           )", "style": "heading"},
+            {"type": "paragraph", "text": "\n위 금액을 아래와 같이 영수합니다.\n"},
+            {"type": "table", "rows": [
+                [{"label": "내역", "isHeader": True}, {"placeholder": ""}],
+                [{"label": "비고", "isHeader": True}, {"placeholder": ""}],
+                [{"label": "지급일", "isHeader": True}, {"value": "    년    월    일"}],
+            ]},
+            {"type": "paragraph", "text": "\n" + FOOTER_DATE + "\n", "style": "center"},
+            {"type": "paragraph", "text": "수령인", "style": "heading"},
+            {"type": "paragraph", "text": "성명 :                         (인)\n주소 :\n연락처 :"},
+        ],
+    },
+}
+
+
+def parse_ts_rows(source):
+    """TS 소스의 FormRow[] 상수 → {상수 이름: [[칸, ...], ...]}"""
+    def to_json(match):
+        if match.group(2):
+            return f'{match.group(1)}"{match.group(2)}"{match.group(3)}'
+        if match.group(4) is not None:
+            return match.group(4)
+        text = match.group(0)
+        return '' if text.startswith('//') else text
+
+    arrays = {}
+    for name, literal in _TS_ARRAY_RE.findall(source):
+        rows = json.loads(_TS_TOKEN_RE.sub(to_json, literal))
+        arrays[name] = [row['fields'] for row in rows]
+    return arrays
+
+
+def load_preview_rows(preview_path=PREVIEW_TSX, page_path=FORM_PAGE_TSX):
+    """미리보기 데이터 전체 (FormPreview.tsx + page.tsx의 기본값)"""
+    arrays = {}
+    for path in (preview_path, page_path):
+        if Path(path).exists():
+            arrays.update(parse_ts_rows(Path(path).read_text(encoding='utf-8')))
+    return arrays
+
+
+def field_text(field, example=False):
+    """칸 하나의 인쇄 텍스트 (example=True면 작성 예시 값)"""
+    if field.get('isHeader'):
+        return field.get('label', '')
+    if example and field.get('exampleValue'):
+        return field['exampleValue']
+    if field.get('value'):
+        return field['value']
+    placeholder = field.get('placeholder', '')
+    return '' if _HINT_RE.match(placeholder.strip()) else placeholder
+
+
+def table_block(rows, example=False):
+    """
+    FormPreview 행 목록(HTML 표처럼 rowspan으로 가려진 칸은 생략) → 격자 표 블록
+    Returns: {"type": "table", "rows", "spans": [[행, 열, 행병합, 열병합]], "header_cells": [[행, 열]]}
+    """
+    occupied = set()
+    cells = []  # (행, 열, 행병합, 열병합, 텍스트, 머리글)
+    for r, fields in enumerate(rows):
+        c = 0
+        for field in fields:
+            while (r, c) in occupied:
+                c += 1
+            rs, cs = max(1, field.get('rowspan', 1)), max(1, field.get('colspan', 1))
+            occupied.update((r + dr, c + dc) for dr in range(rs) for dc in range(cs))
+            cells.append((r, c, rs, cs, field_text(field, example), bool(field.get('isHeader'))))
+            c += cs
+
+    height = max((r + rs for r, _, rs, _, _, _ in cells), default=0)
+    width = max((c + cs for _, c, _, cs, _, _ in cells), default=0)
+    grid = [[''] * width for _ in range(height)]
+    for r, c, _, _, text, _ in cells:
+        grid[r][c] = text
+
+    return {
+        'type': 'table',
+        'rows': grid,
+        'spans': [[r, c, rs, cs] for r, c, rs, cs, _, _ in cells if rs > 1 or cs > 1],
+        'header_cells': [[r, c] for r, c, _, _, _, header in cells if header],
+    }
+
+
+def spec_blocks(spec, example=False):
+    """명세 → 문서 블록 (제목 문단 + 본문)"""
+    blocks = [{'type': 'paragraph', 'text': spec['title'], 'style': 'title'}]
+    for block in spec['blocks']:
+        if block['type'] == 'table':
+            blocks.append(table_block(block['rows'], example))
+        else:
+            blocks.append(block)
+    return blocks
+
+
+def preview_spec(form, preview_rows):
+    """양식 JSON + 미리보기 데이터 → 명세 (제목 + 미리보기 표 + 작성일/서명란)"""
+    rows = preview_rows.get(form.get('previewDataKey')) or preview_rows.get(DEFAULT_PREVIEW_KEY) or []
+    blocks = [{'type': 'table', 'rows': rows}] if rows else []
+    # 미리보기 표에 서명 칸이 없으면 하단에 작성일/서명란 추가
+    texts = [field.get(key, '') for fields in rows for field in fields for key in ('label', 'placeholder', 'value')]
+    if not any('(인)' in text or '서명' in text for text in texts):
+        blocks += [
+            {'type': 'paragraph', 'text': ''},
+            {'type': 'paragraph', 'text': FOOTER_DATE, 'style': 'center'},
+            {'type': 'paragraph', 'text': '작성자 :                       (인)', 'style': 'right'},
+        ]
+    return {'title': form.get('shortTitle') or form['slug'], 'blocks': blocks}
+
+
+def load_specs(names=None, forms_dir=FORMS_DATA_DIR):
+    """
+    data/forms/*.json 전체(또는 names)의 명세 → {양식 이름: 명세}
+    SPECS에 직접 작성한 양식은 그 명세 우선
+    """
+    preview_rows = load_preview_rows()
+    specs = {}
+    for json_path in sorted(Path(forms_dir).glob('*.json')):
+        name = json_path.stem
+        if names and name not in names:
+            continue
+        if name in SPECS:
+            specs[name] = SPECS[name]
+            continue
+        form = json.loads(json_path.read_text(encoding='utf-8'))
+        specs[name] = preview_spec(form, preview_rows)
+    return specs
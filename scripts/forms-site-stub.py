@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+강남구청/네이버/정부 사이트 로컬 스텁 (download-forms-playwright.py --site-base 시험용)
+
+fixtures/playwright-forms/의 HTML을 그대로 제공 ({{base}}, {{js_base}}는 스텁 주소로 치환):
+- /gangnam/board/B_000060/list.do   민원서식 목록 (각서, 사직서)
+- /gangnam/board/B_000060/view.do   상세 - 각서: 정적 첨부 / 사직서: 뷰어 설치 링크 + 깨진 첨부 + 정상 첨부
+- /naver/search.naver?query=        검색어 첫 단어별 결과 (위임장 → 정적 정부 페이지, 차용증 → JS 다운로드 페이지)
+- /gov/minwon/<양식>.html           정적 정부 페이지 (HTTP 단계로 끝나야 함)
+- 127.0.0.2의 /www.moj.go.kr/...   JS 다운로드 버튼만 있는 페이지 (브라우저 단계 필요, 도메인이 달라 단계 기억도 따로)
+- /files/<양식>.<형식>, /common/download.do?name=  가짜 양식 파일 / /broken/...  파일 대신 오류 페이지
+
+사용법:
+    python forms-site-stub.py --port 8000
+    python download-forms-playwright.py 각서 --site-base http://127.0.0.1:8000
+    python forms-site-stub.py --check    # 임시 프로젝트에서 워커 풀 + HTTP/브라우저 단계 점검
+"""
+
+import re
+import sys
+import argparse
+from pathlib import Path
+
+from fixture_server import CheckReport, FixtureHandler, Sandbox, serve, start_server
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "playwright-forms"
+JS_HOST = "127.0.0.2"   # JS 다운로드 페이지 전용 호스트 (단계 기억이 도메인별이라 분리)
+DEFAULT_LATENCY = 0.2
+
+# 점검 대상 양식 → 기대 결과 (차용증은 Chromium이 있을 때만 성공)
+FORMS = ["각서", "사직서", "위임장", "차용증", "없는양식"]
+HTTP_FORMS = ["각서", "사직서", "위임장"]
+BROWSER_FORMS = ["차용증"]
+
+BROKEN_PAGE = "<html><body><h1>요청하신 파일을 찾을 수 없습니다</h1>" + "<p>삭제되었거나 이동된 파일입니다.</p>" * 20 + "</body></html>"
+
+
+class FormsSiteHandler(FixtureHandler):
+    bases = {"base": "", "js_base": ""}
+    ROUTES = (
+        ("/gangnam/board/B_000060/list.do", "gangnam_list"),
+        ("/gangnam/board/B_000060/view.do", "gangnam_view"),
+        ("/naver/search.naver", "naver"),
+        ("/gov/minwon/", "gov_page"),
+        ("/www.moj.go.kr/board/", "gov_page"),
+        ("/files/", "files"),
+        ("/common/download.do", "common_download"),
+        ("/broken/", "broken"),
+    )
+
+    def fixture(self, name):
+        path = FIXTURE_DIR / name
+        if not path.exists():
+            return self.not_found()
+        html = path.read_text(encoding="utf-8")
+        for key, value in self.bases.items():
+            html = html.replace("{{" + key + "}}", value)
+        self.page(html)
+
+    def gangnam_list(self, path, query):
+        self.fixture("gangnam-list.html")
+
+    def gangnam_view(self, path, query):
+        self.fixture(f"gangnam-view-{query.get('id', '')}.html")
+
+    def naver(self, path, query):
+        word = (query.get("query") or "").split(" ")[0]
+        self.fixture(f"naver-{word}.html" if (FIXTURE_DIR / f"naver-{word}.html").exists() else "naver-empty.html")
+
+    def gov_page(self, path, query):
+        self.fixture(f"gov-{Path(path).stem}.html")
+
+    def files(self, path, query):
+        name, _, ext = Path(path).name.rpartition(".")
+        if ext not in ("hwp", "pdf", "docx"):
+            return self.not_found()
+        self.file(name, ext)
+
+    def common_download(self, path, query):
+        self.file(query.get("name", ""), "hwp")
+
+    def broken(self, path, query):
+        self.page(BROKEN_PAGE)
+
+
+def start_sites(port=0, latency=0.0):
+    """본 사이트(127.0.0.1) + JS 사이트(127.0.0.2) → (서버 목록, 기본 주소)"""
+    server, base = start_server(FormsSiteHandler, port=port, latency=latency)
+    js_server, js_base = start_server(FormsSiteHandler, host=JS_HOST, port=port, latency=latency)
+    FormsSiteHandler.bases = {"base": base, "js_base": js_base}
+    return [server, js_server], base
+
+
+# ============================================================
+# 점검 (--check)
+# ============================================================
+def has_chromium():
+    """Playwright Chromium 설치 여부 (없으면 브라우저 단계 다운로드는 점검에서 제외)"""
+    try:
+        from playwright.sync_api import sync_playwright
+        with sync_playwright() as p:
+            return Path(p.chromium.executable_path).exists()
+    except Exception:
+        return False
+
+
+def run_downloader(sandbox, base, workers):
+    code, output, elapsed = sandbox.run(
+        "download-forms-playwright.py", "--all", "--workers", str(workers), "--delay", "0", "--site-base", base
+    )
+    match = re.search(r"성공 (\d+)개, 실패 (\d+)개", output)
+    counts = (int(match.group(1)), int(match.group(2))) if match else (0, 0)
+    return counts, output, elapsed, code
+
+
+def check(latency):
+    """임시 프로젝트에서 download-forms-playwright.py --all을 워커 1개/3개로 돌려 결과와 단계 기억 확인"""
+    servers, base = start_sites(latency=latency)
+    state = FormsSiteHandler.state
+    report = CheckReport()
+    chromium = has_chromium()
+    expected = HTTP_FORMS + (BROWSER_FORMS if chromium else [])
+    print(f"🧪 양식 사이트 스텁 {base} + {FormsSiteHandler.bases['js_base']} (지연 {latency}초)")
+    if not chromium:
+        print("- Chromium 없음: 브라우저 단계 다운로드(차용증)는 실패로 예상 (설치: playwright install chromium)")
+
+    try:
+        print("\n1) 워커 1개")
+        with Sandbox(FORMS) as sandbox:
+            (success, _), output, sequential, code = run_downloader(sandbox, base, 1)
+            report.check(code == 0 and success == len(expected), f"성공 {success}/{len(expected)}개 ({sequential:.1f}초)")
+            if success != len(expected):
+                print(output)
+
+        state.reset()
+        print("\n2) 워커 3개")
+        with Sandbox(FORMS) as sandbox:
+            (success, fail), output, elapsed, code = run_downloader(sandbox, base, 3)
+            stats = state.snapshot()
+            report.check(code == 0 and success == len(expected) and fail == len(FORMS) - len(expected),
+                         f"성공 {success}개 / 실패 {fail}개 ({elapsed:.1f}초, 워커 1개 대비 {sequential / elapsed:.1f}배)")
+            report.check(stats["maxConcurrent"] > 1, f"최대 동시 요청 {stats['maxConcurrent']}개 (워커 풀 병렬)")
+
+            downloaded = [name for name in FORMS if sandbox.form_json(name)["downloads"]]
+            report.check(sorted(downloaded) == sorted(expected), f"양식 JSON downloads: {', '.join(downloaded) or '없음'}")
+            report.check(sandbox.form_json("위임장")["downloads"].get("hwp") is not None,
+                         "위임장: HWP/PDF 중 HWP 링크 우선")
+
+            # 사직서: 깨진 첨부(오류 페이지)는 실패로, 다음 후보(download.do)는 성공으로 학습
+            patterns = sandbox.read_json(".claude/cache/link-patterns.json").get("127.0.0.1", {}).get("url", {})
+            report.check(any(s.get("fail") for s in patterns.values()) and any(s.get("ok") for s in patterns.values()),
+                         f"링크 패턴 학습 (성공/실패 기록 {len(patterns)}개)")
+            report.check(stats["paths"].get("/files/HwpViewer.exe", 0) == 0, "뷰어 설치 링크는 시도하지 않음")
+
+            tiers = sandbox.read_json(".claude/cache/acquire-tiers.json")
+            report.check(tiers.get("127.0.0.1", {}).get("tier") == "http", "정적 사이트는 HTTP 단계로 기억")
+            report.check("브라우저로 재시도" in output, "JS 다운로드 페이지는 브라우저 단계로 넘김")
+            if chromium:
+                report.check(tiers.get(JS_HOST, {}).get("tier") == "browser", "JS 사이트는 브라우저 단계로 기억")
+            else:
+                report.check(JS_HOST not in tiers, "브라우저 없이 실패한 JS 사이트는 단계 기억 없음")
+            if success != len(expected):
+                print(output)
+
+        print("\n3) 정적 페이지만 (각서)")
+        with Sandbox(["각서"]) as sandbox:
+            code, output, elapsed = sandbox.run("download-forms-playwright.py", "각서", "--site-base", base)
+            report.check(code == 0 and bool(sandbox.form_json("각서")["downloads"]), f"각서 다운로드 ({elapsed:.1f}초)")
+            report.check("Chromium 실행" not in output, "HTTP 단계로 끝나면 Chromium을 실행하지 않음")
+    finally:
+        for server in servers:
+            server.shutdown()
+
+    print(f"\n{'✅ 점검 통과' if not report.failures else f'❌ 실패 {report.failures}건'}")
+    return report.failures == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="강남구청/네이버/정부 사이트 로컬 스텁")
+    parser.add_argument("--port", type=int, default=8000, help="포트 (127.0.0.1과 127.0.0.2에 같은 포트)")
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY,
+                        help=f"요청마다 지연 초 (기본: {DEFAULT_LATENCY})")
+    parser.add_argument("--check", action="store_true", help="임시 프로젝트에서 download-forms-playwright.py 점검")
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(0 if check(args.latency) else 1)
+
+    _, js_base = start_server(FormsSiteHandler, host=JS_HOST, port=args.port, latency=args.latency)
+    FormsSiteHandler.bases = {"base": f"http://127.0.0.1:{args.port}", "js_base": js_base}
+    serve(FormsSiteHandler, "양식 사이트 스텁", "127.0.0.1", args.port, args.latency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+양식 템플릿으로 HWPX / DOCX / PDF 일괄 생성 (Linux, 한글 프로그램 불필요)
+
+create-form-hwp.py(한글 COM으로 칸마다 입력)를 대체:
+- 명세: form_templates (FormPreview 미리보기 데이터 + 직접 작성한 SPECS)
+- HWPX: hwpx_writer가 직접 작성 (변환 없음)
+- DOCX/PDF: odf_writer로 .fodt 작성 → LibreOffice 상주 서버로 한 번 열어 모든 형식 내보내기
+- 명세가 그대로면 다시 만들지 않음 (.claude/cache/generated-forms.json에 명세 해시 기록)
+
+사용법:
+    python generate-forms.py                    # data/forms/*.json 전체 (107개)
+    python generate-forms.py 각서 영수증          # 일부만
+    python generate-forms.py --formats hwpx     # LibreOffice 없이 HWPX만
+    python generate-forms.py --example -j 4     # 작성 예시 값으로, LibreOffice 4개 병렬
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import hashlib
+import argparse
+import tempfile
+import threading
+from pathlib import Path
+
+from form_templates import load_specs, spec_blocks
+from hwpx_writer import write_hwpx
+from odf_writer import render_fodt
+from office_server import open_office, find_soffice, HAS_UNO
+
+PROJECT_ROOT = Path(__file__).parent.parent
+OUTPUT_DIR = PROJECT_ROOT / "public" / "files" / "templates"
+CACHE_PATH = PROJECT_ROOT / ".claude" / "cache" / "generated-forms.json"
+
+FORMATS = ("hwpx", "docx", "pdf")
+OFFICE_FORMATS = ("docx", "pdf")  # LibreOffice로 내보내는 형식
+DEFAULT_TIMEOUT = 120
+
+
+def load_cache():
+    if CACHE_PATH.exists():
+        try:
+            return json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+    return {}
+
+
+def save_cache(cache):
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = CACHE_PATH.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(cache.items())), f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, CACHE_PATH)
+
+
+def spec_hash(blocks, generator):
+    """블록 내용 + 생성기 해시 - 둘 중 하나라도 바뀌면 다시 생성 (형식마다 자기 생성기로 계산)"""
+    payload = json.dumps([blocks, generator], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def generate_forms(specs, output_dir, formats, office=None, jobs=1, example=False, force=False):
+    """
+    명세 → output_dir/<이름>.<형식>
+
+    HWPX는 바로 작성, DOCX/PDF는 .fodt를 만든 뒤 office로 변환 (jobs개 스레드)
+    Returns: {이름: {형식: 경로 또는 None}}
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    office_formats = [fmt for fmt in formats if fmt in OFFICE_FORMATS]
+    # HWPX는 직접 작성("native"), DOCX/PDF는 LibreOffice 버전 → LibreOffice 유무와 무관하게 HWPX 해시는 그대로
+    office_version = office.version if office and office_formats else None   # 'LibreOffice 7.6.4.1'
+    generators = {fmt: office_version if fmt in office_formats else "native" for fmt in formats}
+
+    cache = load_cache()
+    results = {}
+    pending = queue.Queue()
+    started = time.monotonic()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # 1. 명세 → 블록 → HWPX / .fodt (문서당 수 ms)
+        for name, spec in specs.items():
+            blocks = spec_blocks(spec, example)
+            digests = {fmt: spec_hash(blocks, generators[fmt]) for fmt in formats}
+            targets = {fmt: output_dir / f"{name}.{fmt}" for fmt in formats}
+
+            entry = cache.get(name, {})
+            stale = [
+                fmt for fmt, path in targets.items()
+                if force or entry.get(fmt) != digests[fmt] or not path.exists()
+            ]
+            if not stale:
+                results[name] = {**targets, "reused": True}
+                continue
+
+            # 바뀐 형식만 다시 생성 (나머지는 기존 파일 유지)
+            results[name] = {fmt: (None if fmt in stale else path) for fmt, path in targets.items()}
+            if "hwpx" in stale:
+                results[name]["hwpx"] = write_hwpx(blocks, targets["hwpx"], title=spec["title"])
+            stale_office = [fmt for fmt in office_formats if fmt in stale]
+            if stale_office:
+                fodt_path = Path(temp_dir) / f"{name}.fodt"
+                fodt_path.write_text(render_fodt(blocks, spec["title"]), encoding="utf-8")
+                pending.put((name, fodt_path, stale_office))
+            cache.setdefault(name, {}).update({fmt: digests[fmt] for fmt in stale})
+
+        written = time.monotonic() - started
+        print(f"📝 명세 {len(specs)}개 → 문서 작성 {written:.2f}초 (LibreOffice 변환 대기 {pending.qsize()}개)")
+
+        # 2. .fodt → DOCX/PDF (문서를 한 번 열어 모든 형식으로)
+        def worker():
+            while True:
+                try:
+                    name, fodt_path, target_formats = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    converted = office.convert_all(fodt_path, output_dir, target_formats)
+                except Exception as e:
+                    print(f"  ✗ {name} 변환 오류: {e}")
+                    converted = {}
+                for fmt in target_formats:
+                    results[name][fmt] = converted.get(fmt)
+                print(f"  {'✓' if all(converted.get(fmt) for fmt in target_formats) else '✗'} {name}")
+
+        if not pending.empty():
+            threads = [threading.Thread(target=worker, daemon=True) for _ in range(max(1, jobs))]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+    # 실패한 형식은 다음 실행에서 다시 생성
+    for name, result in results.items():
+        for fmt in formats:
+            if not result.get(fmt):
+                cache[name].pop(fmt, None)
+    save_cache(cache)
+
+    reused = sum(1 for result in results.values() if result.get("reused"))
+    failed = [name for name, result in results.items() if not all(result.get(fmt) for fmt in formats)]
+    print(f"\n♻️ 재사용 {reused}개 / 생성 {len(results) - reused}개 ⏱️ {time.monotonic() - started:.1f}초")
+    if failed:
+        print(f"⚠️ 실패 {len(failed)}개: {', '.join(sorted(failed))}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="양식 템플릿으로 HWPX/DOCX/PDF 일괄 생성")
+    parser.add_argument("names", nargs="*", help="생성할 양식 이름 (기본: data/forms/*.json 전체)")
+    parser.add_argument("--output-dir", "-o", default=str(OUTPUT_DIR),
+                        help="출력 디렉토리 (기본: public/files/templates/)")
+    parser.add_argument("--formats", default=",".join(FORMATS),
+                        help=f"생성할 형식 (쉼표 구분, 기본: {','.join(FORMATS)})")
+    parser.add_argument("--example", action="store_true",
+                        help="빈 양식 대신 작성 예시 값으로 채움")
+    parser.add_argument("--no-server", action="store_true",
+                        help="상주 LibreOffice 서버 대신 변환마다 soffice 실행")
+    parser.add_argument("--jobs", "-j", type=int, default=1,
+                        help="DOCX/PDF 병렬 변환 수 (LibreOffice 인스턴스 수, 기본: 1)")
+    parser.add_argument("--force", action="store_true",
+                        help="생성 기록을 무시하고 다시 생성")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT,
+                        help=f"LibreOffice 변환 1회 제한 시간 (초, 기본: {DEFAULT_TIMEOUT})")
+    args = parser.parse_args()
+
+    formats = tuple(fmt.strip().lower() for fmt in args.formats.split(",") if fmt.strip())
+    unknown = [fmt for fmt in formats if fmt not in FORMATS]
+    if unknown:
+        print(f"❌ 지원하지 않는 형식: {', '.join(unknown)} (가능: {', '.join(FORMATS)})")
+        sys.exit(1)
+
+    specs = load_specs(set(args.names) or None)
+    missing = set(args.names) - set(specs)
+    if missing:
+        print(f"⚠️ data/forms에 없는 양식: {', '.join(sorted(missing))}")
+    if not specs:
+        print("❌ 생성할 양식이 없습니다.")
+        sys.exit(1)
+
+    print("=" * 50)
+    print(f"🧾 양식 생성: {len(specs)}개 → {', '.join(formats).upper()}")
+    print("=" * 50)
+
+    output_dir = Path(args.output_dir)
+    if not any(fmt in OFFICE_FORMATS for fmt in formats):
+        generate_forms(specs, output_dir, formats, force=args.force, example=args.example)
+        return
+
+    soffice_path = find_soffice()
+    if not soffice_path:
+        print("❌ LibreOffice가 설치되지 않았습니다. (HWPX만 만들려면 --formats hwpx)")
+        sys.exit(1)
+    if not HAS_UNO:
+        print("- uno 모듈 없음 (변환마다 soffice 실행, 설치: apt install python3-uno)")
+
+    jobs = max(1, args.jobs)
+    with open_office(soffice_path, instances=jobs, server=not args.no_server, timeout=args.timeout) as office:
+        generate_forms(specs, output_dir, formats, office, jobs, args.example, args.force)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+양식 PDF → WebP 미리보기 이미지 (변환 다음 단계)
+
+- data/forms/*.json의 downloads.pdf를 앞쪽 N쪽만 래스터화해 여러 너비의 WebP로 저장
+  (페이지당 가장 큰 너비로 한 번만 렌더링하고 작은 너비는 축소)
+- 출력: public/files/previews/<PDF 해시 앞 2자리>/<PDF 해시>-p<쪽>-<너비>.webp
+  → 파일명이 원본 해시라 같은 PDF는 다시 만들지 않고, 여러 양식이 같은 PDF면 이미지도 공유
+- 결과를 각 JSON의 previewImages에 기록 → 양식 페이지는 표 마크업 대신 이미지(srcset)를 표시
+- PDF마다 별도 프로세스에서 렌더링 (--jobs)
+
+사용법:
+    python generate-previews.py                 # 전체
+    python generate-previews.py 사직서 위임장     # 일부만
+    python generate-previews.py --pages 2 -j 4  # 앞 2쪽, 4개 동시
+    python generate-previews.py --force         # 기존 이미지 무시하고 다시 생성
+
+필요 패키지:
+    pip install pillow pymupdf   (pymupdf가 없으면 poppler의 pdftoppm 사용)
+"""
+
+import io
+import os
+import re
+import sys
+import json
+import time
+import shutil
+import argparse
+import tempfile
+import subprocess
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from form_store import FormStore, sha256_file, split_name
+
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+try:
+    import pymupdf
+    HAS_PYMUPDF = True
+except ImportError:
+    HAS_PYMUPDF = False
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PUBLIC_DIR = PROJECT_ROOT / "public"
+DATA_DIR = PROJECT_ROOT / "data" / "forms"
+PREVIEW_DIR = PUBLIC_DIR / "files" / "previews"
+
+WIDTHS = (320, 640, 1280)   # srcset 너비 (px)
+PAGES = 1                   # 앞쪽 몇 쪽까지
+QUALITY = 75                # WebP 품질
+WEBP_METHOD = 6             # 인코딩 노력 (0 빠름 ~ 6 작음)
+RENDER_TIMEOUT = 60         # pdftoppm 1회 제한 (초)
+
+
+def preview_path(sha, page, width):
+    return PREVIEW_DIR / sha[:2] / f"{sha}-p{page}-{width}.webp"
+
+
+def preview_url(path):
+    return "/" + path.relative_to(PUBLIC_DIR).as_posix()
+
+
+def _render_pymupdf(pdf_path, pages, width):
+    """PyMuPDF: 쪽마다 너비 width로 렌더링 → PIL 이미지 목록"""
+    images = []
+    with pymupdf.open(pdf_path) as doc:
+        for page in list(doc)[:pages]:
+            zoom = width / page.rect.width
+            pixmap = page.get_pixmap(matrix=pymupdf.Matrix(zoom, zoom), alpha=False)
+            images.append(Image.frombytes("RGB", (pixmap.width, pixmap.height), pixmap.samples))
+    return images
+
+
+def _render_pdftoppm(pdf_path, pages, width):
+    """poppler pdftoppm: 앞 pages쪽을 너비 width PNG로 → PIL 이미지 목록"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        prefix = Path(temp_dir) / "page"
+        subprocess.run(
+            ["pdftoppm", "-png", "-f", "1", "-l", str(pages), "-scale-to-x", str(width), "-scale-to-y", "-1",
+             str(pdf_path), str(prefix)],
+            check=True, capture_output=True, timeout=RENDER_TIMEOUT,
+        )
+        images = []
+        for png in sorted(Path(temp_dir).glob("page-*.png"), key=lambda p: int(p.stem.rsplit("-", 1)[1])):
+            with Image.open(png) as image:
+                images.append(image.convert("RGB"))
+        return images
+
+
+def page_count(pdf_path):
+    """PDF 쪽수 (PyMuPDF, 없으면 poppler pdfinfo)"""
+    if HAS_PYMUPDF:
+        with pymupdf.open(pdf_path) as doc:
+            return doc.page_count
+    output = subprocess.run(
+        ["pdfinfo", str(pdf_path)], check=True, capture_output=True, text=True, timeout=RENDER_TIMEOUT,
+    ).stdout
+    match = re.search(r"^Pages:\s*(\d+)", output, re.MULTILINE)
+    return int(match.group(1)) if match else 0
+
+
+def render_previews(pdf_path, sha, pages=PAGES, widths=WIDTHS, quality=QUALITY):
+    """
+    PDF 앞 pages쪽 → 너비별 WebP (프로세스 풀 작업 단위)
+
+    Returns: [{"page", "width", "height", "srcset": {너비: URL}}, ...]
+    """
+    largest = max(widths)
+    render = _render_pymupdf if HAS_PYMUPDF else _render_pdftoppm
+    entries = []
+    for page_no, image in enumerate(render(pdf_path, pages, largest), start=1):
+        srcset = {}
+        for width in sorted(widths, reverse=True):
+            scaled = image if width == image.width else image.resize(
+                (width, round(image.height * width / image.width)), Image.LANCZOS
+            )
+            path = preview_path(sha, page_no, width)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            buffer = io.BytesIO()
+            scaled.save(buffer, "WEBP", quality=quality, method=WEBP_METHOD)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_bytes(buffer.getvalue())
+            os.replace(tmp_path, path)
+            srcset[str(width)] = preview_url(path)
+        entries.append({
+            "page": page_no,
+            "width": image.width,
+            "height": image.height,
+            "srcset": dict(sorted(srcset.items(), key=lambda item: int(item[0]))),
+        })
+    return entries
+
+
+def existing_previews(entries, sha, pages, widths):
+    """
+    JSON에 기록된 미리보기가 이 PDF/설정으로 만든 것이고 파일도 있으면 그대로 반환
+    (pages: 있어야 할 쪽수 = min(--pages, PDF 쪽수) → --pages를 늘리면 다시 렌더링)
+    """
+    if not entries or len(entries) != pages:
+        return None
+    for entry in entries:
+        urls = entry.get("srcset") or {}
+        if set(urls) != {str(width) for width in widths}:
+            return None
+        for width in widths:
+            path = preview_path(sha, entry["page"], width)
+            if urls[str(width)] != preview_url(path) or not path.exists():
+                return None
+    return entries
+
+
+def collect_sources(names=None, data_dir=DATA_DIR):
+    """양식 JSON 중 PDF가 있는 것 → {이름: (JSON 경로, PDF 경로)}"""
+    sources = {}
+    for json_path in sorted(Path(data_dir).glob("*.json")):
+        if names and json_path.stem not in names:
+            continue
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+        pdf_url = (data.get("downloads") or {}).get("pdf")
+        if not isinstance(pdf_url, str) or not pdf_url.startswith("/"):
+            continue
+        pdf_path = PUBLIC_DIR / pdf_url.lstrip("/")
+        if pdf_path.exists():
+            sources[json_path.stem] = (json_path, pdf_path)
+        else:
+            print(f"  ⚠️ {json_path.stem}: PDF 없음 ({pdf_url})")
+    return sources
+
+
+def pdf_labels(forms, store=None):
+    """
+    PDF 해시 → 로그에 쓸 양식 이름 (blob 파일명은 해시라 알아보기 어려움)
+    저장소 이름(이름 → 해시)을 우선 쓰고, 저장소에 없는 PDF는 양식 JSON 이름으로
+    """
+    store = store or FormStore.load()
+    names = {}
+    for name, sha in store.names.items():
+        stem, ext = split_name(name)
+        if ext == "pdf":
+            names.setdefault(sha, set()).add(stem)
+    fallback = {}
+    for name, (_, _, sha) in forms.items():
+        if sha not in names:
+            fallback.setdefault(sha, set()).add(name)
+    names.update(fallback)
+
+    labels = {}
+    for sha, stems in names.items():
+        stems = sorted(stems)
+        labels[sha] = ", ".join(stems[:3]) + (f" 외 {len(stems) - 3}개" if len(stems) > 3 else "")
+    return labels
+
+
+def generate_previews(sources, pages=PAGES, widths=WIDTHS, quality=QUALITY, jobs=1, force=False, store=None):
+    """
+    PDF별 미리보기 생성 + JSON previewImages 기록 (바뀐 JSON 수 반환)
+    같은 PDF를 쓰는 양식은 한 번만 렌더링
+    """
+    started = time.monotonic()
+    forms = {}   # 이름 → (JSON 경로, JSON 데이터, PDF 해시)
+    todo = {}    # PDF 해시 → PDF 경로
+    results = {}
+    for name, (json_path, pdf_path) in sources.items():
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+        sha = sha256_file(pdf_path)
+        forms[name] = (json_path, data, sha)
+        cached = None
+        if not force and data.get("previewImages"):
+            try:
+                expected = min(pages, page_count(pdf_path))
+            except Exception:
+                expected = pages  # 쪽수를 못 읽으면 렌더링 단계에서 오류 보고
+            cached = existing_previews(data["previewImages"], sha, expected, widths)
+        if cached:
+            results[sha] = cached
+        elif sha not in results:
+            todo[sha] = pdf_path
+
+    labels = pdf_labels(forms, store)
+    print(f"🖼️ PDF {len(set(sha for _, _, sha in forms.values()))}개 중 {len(todo)}개 렌더링"
+          + (f" (동시 {jobs}개)" if jobs > 1 and len(todo) > 1 else ""))
+
+    with ProcessPoolExecutor(max_workers=max(1, min(jobs, len(todo) or 1))) as pool:
+        futures = {
+            pool.submit(render_previews, pdf_path, sha, pages, widths, quality): sha
+            for sha, pdf_path in todo.items()
+        }
+        for future in as_completed(futures):
+            sha = futures[future]
+            try:
+                results[sha] = future.result()
+                print(f"  ✓ {labels[sha]} ({len(results[sha])}쪽)")
+            except Exception as e:
+                # 한 PDF의 오류로 나머지가 멈추지 않도록
+                print(f"  ✗ {labels[sha]}: {e}")
+
+    changed = 0
+    for name, (json_path, data, sha) in sorted(forms.items()):
+        entries = results.get(sha)
+        if not entries or data.get("previewImages") == entries:
+            continue
+        data["previewImages"] = entries
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        changed += 1
+
+    reused = sum(1 for _, _, sha in forms.values() if sha not in todo)
+    rendered = sum(1 for sha in todo if sha in results)
+    print(f"\n♻️ 재사용 {reused}개 / 생성 {rendered}개 ⏱️ {time.monotonic() - started:.1f}초")
+    if changed:
+        print(f"📝 JSON {changed}개 previewImages 갱신")
+    return changed
+
+
+def remove_unused(data_dir=DATA_DIR):
+    """어떤 JSON도 가리키지 않는 미리보기 이미지 삭제 (삭제 수 반환)"""
+    used = set()
+    for json_path in Path(data_dir).glob("*.json"):
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+        for entry in data.get("previewImages") or []:
+            used.update(PUBLIC_DIR / url.lstrip("/") for url in entry.get("srcset", {}).values())
+    removed = 0
+    for path in PREVIEW_DIR.glob("*/*.webp"):
+        if path not in used:
+            path.unlink()
+            removed += 1
+    return removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="양식 PDF → WebP 미리보기 이미지")
+    parser.add_argument("names", nargs="*", help="양식 이름 (기본: data/forms/*.json 전체)")
+    parser.add_argument("--pages", type=int, default=PAGES, help=f"앞쪽 몇 쪽까지 (기본: {PAGES})")
+    parser.add_argument("--widths", default=",".join(map(str, WIDTHS)),
+                        help=f"이미지 너비 px, 쉼표 구분 (기본: {','.join(map(str, WIDTHS))})")
+    parser.add_argument("--quality", type=int, default=QUALITY, help=f"WebP 품질 (기본: {QUALITY})")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="동시에 렌더링할 PDF 수 (기본: CPU 수)")
+    parser.add_argument("--force", action="store_true", help="기존 이미지 무시하고 다시 생성")
+    args = parser.parse_args()
+
+    if not HAS_PIL:
+        print("❌ Pillow가 설치되지 않았습니다. 설치: pip install pillow")
+        sys.exit(1)
+    if not HAS_PYMUPDF and not shutil.which("pdftoppm"):
+        print("❌ PDF 렌더러가 없습니다. 설치: pip install pymupdf (또는 poppler-utils)")
+        sys.exit(1)
+
+    widths = tuple(sorted({int(width) for width in args.widths.split(",") if width.strip()}))
+    sources = collect_sources(set(args.names) or None)
+    if not sources:
+        print("⚠️ PDF가 있는 양식이 없습니다. (먼저 convert-hwp.py --all)")
+        return
+
+    generate_previews(sources, max(1, args.pages), widths, args.quality, args.jobs, args.force)
+
+    # 전체 실행일 때만 정리 (일부만 돌리면 나머지 양식 이미지가 지워지므로)
+    if not args.names:
+        removed = remove_unused()
+        if removed:
+            print(f"🗑️ 쓰이지 않는 미리보기 {removed}개 삭제")
+
+
+if __name__ == "__main__":
+    main()
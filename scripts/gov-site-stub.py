@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+정부 서식 사이트 로컬 스텁 (download-gov-forms.py --site-base 시험용)
+
+download-gov-forms.py의 크롤러가 보는 페이지만 흉내 냄 (FORM_SOURCES 13개 양식):
+- /law/법령/<법령명>       별지 서식 링크 (주민등록법 시행규칙은 링크 없음 → /law/법령서식/ 대체 경로)
+- /nts/.../cntntsView.do   국세청 서식 목록
+- /moel/.../list.do        고용노동부 검색 결과 (searchText)
+- /scourt/.../ECF302.jsp   대법원 서식 목록 (항고장은 PDF)
+- 파일: 양식별 가짜 HWP/PDF, ETag/Last-Modified → 조건부 요청이면 304
+- 요청마다 --latency초 지연, /stats로 요청/파일/304 횟수와 최대 동시 요청 수 확인
+
+사용법:
+    python gov-site-stub.py --port 8000 --latency 0.3
+    python download-gov-forms.py --all --site-base http://127.0.0.1:8000
+    python gov-site-stub.py --check      # 임시 프로젝트에서 순차/병렬/재실행(304) 점검
+"""
+
+import re
+import sys
+import argparse
+from urllib.parse import quote
+
+from fixture_server import CheckReport, FixtureHandler, Sandbox, serve, start_server
+
+LAW_FORMS = {
+    "가족관계의 등록 등에 관한 규칙": ["혼인신고서", "출생신고서", "사망신고서", "이혼신고서"],
+    "주민등록법 시행규칙": ["전입신고서"],
+}
+NTS_FORMS = ["폐업신고서", "사업자등록신청서", "휴업신고서"]
+MOEL_FORMS = ["해고예고통지서", "해고통지서"]
+SCOURT_FORMS = [("소장(민사)", "소장-민사", "hwp"), ("지급명령신청서", "지급명령신청서", "hwp"), ("항고장", "항고장", "pdf")]
+
+FORM_COUNT = sum(len(forms) for forms in LAW_FORMS.values()) + len(NTS_FORMS) + len(MOEL_FORMS) + len(SCOURT_FORMS)
+DEFAULT_LATENCY = 0.3
+
+
+def html(title, links):
+    items = "\n".join(f'<li><a href="{href}">{text}</a></li>' for href, text in links)
+    return f'<html><head><title>{title}</title></head><body><h1>{title}</h1><ul>\n{items}\n</ul></body></html>'
+
+
+class GovSiteHandler(FixtureHandler):
+    ROUTES = (
+        ("/law/법령서식/", "law_form_page"),
+        ("/law/법령/", "law_page"),
+        ("/nts/nts/cm/cntnts/cntntsView.do", "nts_page"),
+        ("/moel/policy/policydata/list.do", "moel_page"),
+        ("/scourt/ecf/ecf300/ECF302.jsp", "scourt_page"),
+        ("/download/", "download"),
+    )
+
+    def law_page(self, path, query):
+        law_name = path.split("/", 3)[3]
+        if law_name not in LAW_FORMS:
+            return self.not_found()
+        # 주민등록법 시행규칙은 본문에 별지 링크가 없어 서식 페이지로 넘어가야 함
+        links = [] if law_name == "주민등록법 시행규칙" else [
+            (f"/law/LSW/flDownload.do?bylClsCd=별지&file={quote(name)}.hwp&route=/download/{quote(name)}.hwp",
+             f"[별지] {name}")
+            for name in LAW_FORMS[law_name]
+        ]
+        self.page(html(law_name, links))
+
+    def law_form_page(self, path, query):
+        law_name = path.split("/", 3)[3]
+        self.page(html(f"{law_name} 서식", [
+            (f"/download/{quote(name)}.hwp", f"{name}.hwp") for name in LAW_FORMS.get(law_name, [])
+        ]))
+
+    def nts_page(self, path, query):
+        self.page(html("국세청 서식", [(f"/download/{quote(name)}.hwp", name) for name in NTS_FORMS]))
+
+    def moel_page(self, path, query):
+        keyword = query.get("searchText", "")
+        self.page(html("정책자료실", [
+            (f"/download/{quote(name)}.hwp", name) for name in MOEL_FORMS if name == keyword
+        ]))
+
+    def scourt_page(self, path, query):
+        self.page(html("전자소송 서식", [
+            (f"/download/{quote(name)}.{ext}", text) for text, name, ext in SCOURT_FORMS
+        ]))
+
+    def download(self, path, query):
+        name, _, ext = path[len("/download/"):].rpartition(".")
+        self.file(name, ext)
+
+    def do_GET(self):
+        # 법제처 별지 링크(flDownload.do)는 route 파라미터의 파일로 연결
+        if self.path.startswith("/law/LSW/flDownload.do"):
+            match = re.search(r"route=([^&]+)", self.path)
+            self.path = match.group(1) if match else "/missing"
+        super().do_GET()
+
+
+# ============================================================
+# 점검 (--check)
+# ============================================================
+def run_downloader(sandbox, base, *args):
+    code, output, elapsed = sandbox.run("download-gov-forms.py", "--all", "--site-base", base, "--interval", "0", *args)
+    match = re.search(r"성공 (\d+)개", output)
+    return (int(match.group(1)) if match else 0), output, elapsed, code
+
+
+def check(latency):
+    """임시 프로젝트에서 download-gov-forms.py --all을 순차/병렬/재실행으로 돌려 비교"""
+    server, base = start_server(GovSiteHandler, latency=latency)
+    state = GovSiteHandler.state
+    report = CheckReport()
+    names = [name for forms in LAW_FORMS.values() for name in forms] + NTS_FORMS + MOEL_FORMS \
+        + [name for _, name, _ in SCOURT_FORMS]
+    print(f"🧪 정부 사이트 스텁 {base} (지연 {latency}초, 양식 {FORM_COUNT}개)")
+
+    try:
+        print("\n1) 순차 (--jobs 1 --per-host 1)")
+        with Sandbox(names) as sandbox:
+            success, output, sequential, code = run_downloader(sandbox, base, "--jobs", "1", "--per-host", "1")
+            report.check(code == 0 and success == FORM_COUNT, f"성공 {success}/{FORM_COUNT}개 ({sequential:.1f}초)")
+            if success != FORM_COUNT:
+                print(output)
+
+        for per_host in (2, 8):
+            state.reset()
+            print(f"\n2) 병렬 (--jobs 8 --per-host {per_host})")
+            with Sandbox(names) as sandbox:
+                success, output, elapsed, code = run_downloader(sandbox, base, "--jobs", "8", "--per-host", str(per_host))
+                stats = state.snapshot()
+                report.check(code == 0 and success == FORM_COUNT, f"성공 {success}/{FORM_COUNT}개 ({elapsed:.1f}초, "
+                             f"순차 대비 {sequential / elapsed:.1f}배)")
+                report.check(stats["maxConcurrent"] <= per_host,
+                             f"최대 동시 요청 {stats['maxConcurrent']}개 ≤ 호스트별 제한 {per_host}")
+                report.check(stats["files"] == FORM_COUNT, f"파일 전송 {stats['files']}회")
+                missing = [name for name in names if not sandbox.form_json(name)["downloads"]]
+                report.check(not missing, "양식 JSON downloads 기록" + (f" (누락: {', '.join(missing)})" if missing else ""))
+                if success != FORM_COUNT:
+                    print(output)
+
+                # 같은 프로젝트에서 다시 실행 → 모두 조건부 요청(304), 파일 재전송 없음
+                if per_host == 2:
+                    state.reset()
+                    print("\n3) 재실행 (조건부 요청)")
+                    success, output, elapsed, code = run_downloader(sandbox, base, "--jobs", "8", "--per-host", "2")
+                    stats = state.snapshot()
+                    report.check(code == 0 and success == FORM_COUNT, f"성공 {success}/{FORM_COUNT}개 ({elapsed:.1f}초)")
+                    report.check(stats["notModified"] == FORM_COUNT and stats["files"] == 0,
+                                 f"304 {stats['notModified']}회 / 파일 재전송 {stats['files']}회")
+    finally:
+        server.shutdown()
+
+    print(f"\n{'✅ 점검 통과' if not report.failures else f'❌ 실패 {report.failures}건'}")
+    return report.failures == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="정부 서식 사이트 로컬 스텁")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=DEFAULT_LATENCY,
+                        help=f"요청마다 지연 초 (기본: {DEFAULT_LATENCY})")
+    parser.add_argument("--check", action="store_true", help="임시 프로젝트에서 download-gov-forms.py 점검")
+    args = parser.parse_args()
+
+    if args.check:
+        sys.exit(0 if check(args.latency) else 1)
+
+    serve(GovSiteHandler, "정부 사이트 스텁", args.host, args.port, args.latency)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,602 @@
+#!/usr/bin/env python3
+"""
+HWP5 / HWPX 문서 텍스트/구조 추출기 (순수 Python, 한글 프로그램 불필요)
+
+HWP5 (.hwp, 바이너리)
+- OLE 복합 문서(Compound File)를 직접 읽음 (FAT / 미니 스트림 / 디렉토리)
+- BodyText/Section<n> 스트림을 zlib(raw deflate)로 풀어 레코드 단위로 해석
+- 문단과 표를 순서대로 스트리밍 (표는 행/열 격자, 셀 안의 문단/중첩 표는 텍스트로 합침)
+- 글상자/머리말 등 다른 컨트롤 안의 문단도 본문 순서대로 추출
+- 암호 문서 / 배포용 문서(ViewText 암호화)는 HwpError
+
+HWPX (.hwpx, OWPML zip - 확장자가 .hwp여도 내용으로 판별)
+- Contents/section<n>.xml을 iterparse로 스트리밍 (최상위 문단 하나씩만 메모리에 둠)
+- hp:p / hp:tbl(hp:cellAddr, hp:cellSpan) / hp:subList → HWP5와 같은 블록 형식
+
+사용법:
+  python hwp_reader.py public/files/forms/표준근로계약서.hwp     # 본문 텍스트 출력
+  python hwp_reader.py --all                                     # 양식 저장소 + public/files/forms의 HWP/HWPX 색인
+
+  from hwp_reader import iter_blocks, extract_text
+  for block in iter_blocks(path):
+      block["type"]   # "paragraph" → block["text"]
+                      # "table" → block["rows"] (2차원 문자열 목록), block["spans"] ([행, 열, 행 병합, 열 병합])
+  text = extract_text(path)
+
+참고:
+  - 한글 문서 파일 형식 5.0 (한글과컴퓨터 공개 문서)
+"""
+
+import re
+import sys
+import json
+import time
+import zlib
+import struct
+import hashlib
+import zipfile
+import argparse
+from pathlib import Path
+from xml.etree import ElementTree
+
+from form_store import FormStore
+
+PROJECT_ROOT = Path(__file__).parent.parent
+FORMS_DIR = PROJECT_ROOT / "public" / "files" / "forms"
+INDEX_PATH = PROJECT_ROOT / ".claude" / "cache" / "form-text.json"
+INDEX_VERSION = 2
+
+OLE_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'
+ZIP_MAGIC = b'PK\x03\x04'
+HWP_SIGNATURE = b'HWP Document File'
+
+# OLE 섹터 번호 특수값 (이보다 크면 체인 끝/빈 섹터)
+MAX_REGULAR_SECT = 0xFFFFFFFA
+NO_STREAM = 0xFFFFFFFF
+
+# 디렉토리 항목 종류
+STGTY_STORAGE = 1
+STGTY_STREAM = 2
+
+# HWP 레코드 태그 (HWPTAG_BEGIN = 0x10)
+TAG_PARA_HEADER = 0x42
+TAG_PARA_TEXT = 0x43
+TAG_CTRL_HEADER = 0x47
+TAG_LIST_HEADER = 0x48
+TAG_TABLE = 0x4D
+
+# 문단 텍스트의 제어 문자: 확장/인라인 컨트롤은 8 WCHAR(16바이트), 나머지 문자 컨트롤은 1 WCHAR
+WIDE_CONTROLS = {1, 2, 3, 4, 5, 6, 7, 8, 9, 11, 12, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23}
+CHAR_REPLACEMENTS = {9: '\t', 10: '\n', 24: '-', 30: ' ', 31: ' '}
+
+_SECTION_RE = re.compile(r'^BodyText/Section(\d+)$')
+_HWPX_SECTION_RE = re.compile(r'^Contents/section(\d+)\.xml$')
+
+# HWPX 문자 요소 → 텍스트
+HWPX_CHARS = {'tab': '\t', 'lineBreak': '\n', 'fwSpace': ' ', 'nbSpace': ' ', 'hyphen': '-'}
+
+
+class HwpError(Exception):
+    """HWP 파일을 읽을 수 없음 (형식 오류 / 암호 / 배포용 문서)"""
+
+
+# ============================================================
+# OLE 복합 문서
+# ============================================================
+class OleFile:
+    """읽기 전용 OLE 복합 문서 (스트림 경로 → 바이트)"""
+
+    def __init__(self, data):
+        if data.startswith(ZIP_MAGIC):
+            raise HwpError("HWPX(zip) 형식 문서 - HWP5 아님")
+        if not data.startswith(OLE_MAGIC):
+            raise HwpError("OLE 복합 문서가 아님")
+        self.data = data
+        (self.sector_shift, self.mini_sector_shift) = struct.unpack_from('<HH', data, 0x1E)
+        self.sector_size = 1 << self.sector_shift
+        self.mini_sector_size = 1 << self.mini_sector_shift
+        (num_fat, first_dir, _, self.mini_cutoff,
+         first_minifat, num_minifat, first_difat, num_difat) = struct.unpack_from('<IIIIIIII', data, 0x2C)
+
+        self.fat = self._load_fat(num_fat, first_difat, num_difat)
+        self.entries = self._load_directory(first_dir)
+        root = self.entries[0]
+        self.mini_stream = self._read_chain(root['start'], root['size']) if root['start'] < MAX_REGULAR_SECT else b''
+        self.minifat = []
+        if num_minifat and first_minifat < MAX_REGULAR_SECT:
+            raw = self._read_chain(first_minifat)
+            self.minifat = list(struct.unpack(f'<{len(raw) // 4}I', raw))
+        self.paths = {}
+        self._walk(root['child'], '')
+
+    @classmethod
+    def open(cls, path):
+        return cls(Path(path).read_bytes())
+
+    def _sector(self, sid):
+        offset = (sid + 1) * self.sector_size
+        return self.data[offset:offset + self.sector_size]
+
+    def _load_fat(self, num_fat, first_difat, num_difat):
+        fat_sectors = list(struct.unpack_from('<109I', self.data, 0x4C))
+        sid, per_sector = first_difat, self.sector_size // 4 - 1
+        for _ in range(num_difat):
+            if sid >= MAX_REGULAR_SECT:
+                break
+            values = struct.unpack(f'<{per_sector + 1}I', self._sector(sid))
+            fat_sectors.extend(values[:per_sector])
+            sid = values[per_sector]
+        fat = []
+        for sid in fat_sectors[:num_fat]:
+            if sid < MAX_REGULAR_SECT:
+                fat.extend(struct.unpack(f'<{self.sector_size // 4}I', self._sector(sid)))
+        return fat
+
+    def _chain(self, start, table):
+        sid, seen = start, set()
+        while sid < MAX_REGULAR_SECT:
+            if sid in seen or sid >= len(table):
+                raise HwpError("OLE 섹터 체인 손상")
+            seen.add(sid)
+            yield sid
+            sid = table[sid]
+
+    def _read_chain(self, start, size=None):
+        data = b''.join(self._sector(sid) for sid in self._chain(start, self.fat))
+        return data if size is None else data[:size]
+
+    def _read_mini(self, start, size):
+        size_per = self.mini_sector_size
+        data = b''.join(self.mini_stream[sid * size_per:(sid + 1) * size_per] for sid in self._chain(start, self.minifat))
+        return data[:size]
+
+    def _load_directory(self, first_dir):
+        raw = self._read_chain(first_dir)
+        entries = []
+        for offset in range(0, len(raw) - 127, 128):
+            name_len, kind = struct.unpack_from('<HB', raw, offset + 64)
+            left, right, child = struct.unpack_from('<III', raw, offset + 68)
+            start, size = struct.unpack_from('<II', raw, offset + 116)
+            name = raw[offset:offset + max(name_len - 2, 0)].decode('utf-16-le', errors='replace')
+            entries.append({'name': name, 'type': kind, 'left': left, 'right': right,
+                            'child': child, 'start': start, 'size': size})
+        return entries
+
+    def _walk(self, sid, prefix):
+        """디렉토리 트리(형제는 레드블랙 트리) → 경로 목록"""
+        stack, seen = [sid], set()
+        while stack:
+            sid = stack.pop()
+            if sid == NO_STREAM or sid >= len(self.entries) or sid in seen:
+                continue
+            seen.add(sid)
+            entry = self.entries[sid]
+            stack.extend((entry['left'], entry['right']))
+            path = prefix + entry['name']
+            if entry['type'] == STGTY_STREAM:
+                self.paths[path] = entry
+            elif entry['type'] == STGTY_STORAGE:
+                self._walk(entry['child'], path + '/')
+
+    def exists(self, path):
+        return path in self.paths
+
+    def read(self, path):
+        entry = self.paths.get(path)
+        if entry is None:
+            raise HwpError(f"스트림 없음: {path}")
+        if entry['size'] < self.mini_cutoff:
+            return self._read_mini(entry['start'], entry['size'])
+        return self._read_chain(entry['start'], entry['size'])
+
+
+# ============================================================
+# HWP5 레코드
+# ============================================================
+def read_file_header(ole):
+    """FileHeader → {"version", "compressed", "encrypted", "distribution"}"""
+    header = ole.read('FileHeader')
+    if not header.startswith(HWP_SIGNATURE):
+        raise HwpError("HWP 문서가 아님 (FileHeader 서명 불일치)")
+    version, flags = struct.unpack_from('<II', header, 32)
+    return {
+        'version': '.'.join(str(version >> shift & 0xFF) for shift in (24, 16, 8, 0)),
+        'compressed': bool(flags & 0x1),
+        'encrypted': bool(flags & 0x2),
+        'distribution': bool(flags & 0x4),
+    }
+
+
+def iter_records(data):
+    """레코드 스트림 → (태그, 레벨, 데이터)"""
+    offset, end = 0, len(data)
+    while offset + 4 <= end:
+        (header,) = struct.unpack_from('<I', data, offset)
+        offset += 4
+        tag, level, size = header & 0x3FF, (header >> 10) & 0x3FF, header >> 20
+        if size == 0xFFF:
+            (size,) = struct.unpack_from('<I', data, offset)
+            offset += 4
+        yield tag, level, data[offset:offset + size]
+        offset += size
+
+
+def para_text(payload):
+    """PARA_TEXT(UTF-16LE + 제어 문자) → 문자열"""
+    chars = []
+    i, end = 0, len(payload) - 1
+    while i < end:
+        (code,) = struct.unpack_from('<H', payload, i)
+        if code >= 32:
+            chars.append(chr(code))
+            i += 2
+        elif code in WIDE_CONTROLS:
+            if code in CHAR_REPLACEMENTS:
+                chars.append(CHAR_REPLACEMENTS[code])
+            i += 16
+        else:
+            if code in CHAR_REPLACEMENTS:
+                chars.append(CHAR_REPLACEMENTS[code])
+            i += 2
+    # 서로게이트 쌍(한자 확장 등) 복원
+    return ''.join(chars).encode('utf-16-le', 'surrogatepass').decode('utf-16-le', 'replace').strip()
+
+
+def _build_tree(records):
+    """레벨로 부모/자식 관계 구성 → [[태그, 데이터, 자식들], ...]"""
+    roots, stack = [], []
+    for tag, level, payload in records:
+        node = [tag, payload, []]
+        while stack and stack[-1][0] >= level:
+            stack.pop()
+        (stack[-1][1][2] if stack else roots).append(node)
+        stack.append((level, node))
+    return roots
+
+
+def _ctrl_id(payload):
+    """CTRL_HEADER 컨트롤 ID ('tbl ', 'gso ', 'head' ...)"""
+    return payload[:4][::-1].decode('latin-1') if len(payload) >= 4 else ''
+
+
+def _paragraph_blocks(node):
+    """PARA_HEADER 노드 → 문단 + 안에 든 표/글상자 블록"""
+    text = ''.join(para_text(child[1]) for child in node[2] if child[0] == TAG_PARA_TEXT)
+    if text:
+        yield {'type': 'paragraph', 'text': text}
+    for child in node[2]:
+        if child[0] != TAG_CTRL_HEADER:
+            continue
+        if _ctrl_id(child[1]) == 'tbl ':
+            table = _table_block(child)
+            if table:
+                yield table
+        else:
+            yield from _list_blocks(child[2])
+
+
+def _list_blocks(nodes):
+    for node in nodes:
+        if node[0] == TAG_PARA_HEADER:
+            yield from _paragraph_blocks(node)
+        elif node[0] in (TAG_CTRL_HEADER, TAG_LIST_HEADER):
+            yield from _list_blocks(node[2])
+
+
+def _block_text(block):
+    if block['type'] == 'paragraph':
+        return block['text']
+    return '\n'.join('\t'.join(row) for row in block['rows'])
+
+
+def _table_block(ctrl):
+    """표 컨트롤 → {"type": "table", "rows", "spans"} (병합 셀은 왼쪽 위 칸에만 텍스트)"""
+    rows = cols = 0
+    cells, current = [], None
+    for child in ctrl[2]:
+        tag, payload = child[0], child[1]
+        if tag == TAG_TABLE and len(payload) >= 8:
+            rows, cols = struct.unpack_from('<HH', payload, 4)
+        elif tag == TAG_LIST_HEADER:
+            # 문단 수(2) + 알 수 없음(2) + 속성(4) 다음에 열/행 주소, 열/행 병합 수
+            if len(payload) >= 16:
+                col, row, colspan, rowspan = struct.unpack_from('<HHHH', payload, 8)
+            else:
+                col, row, colspan, rowspan = 0, len(cells), 1, 1
+            current = {'row': row, 'col': col, 'rowspan': rowspan, 'colspan': colspan, 'texts': []}
+            cells.append(current)
+        elif tag == TAG_PARA_HEADER and current is not None:
+            current['texts'].extend(_block_text(block) for block in _paragraph_blocks(child))
+
+    return _grid_block(cells, rows, cols)
+
+
+def _grid_block(cells, rows, cols):
+    """셀 목록({"row", "col", "rowspan", "colspan", "texts"}) → 표 블록"""
+    if not cells:
+        return None
+    rows = max(rows, max(cell['row'] for cell in cells) + 1)
+    cols = max(cols, max(cell['col'] for cell in cells) + 1)
+    grid = [[''] * cols for _ in range(rows)]
+    spans = []
+    for cell in cells:
+        grid[cell['row']][cell['col']] = '\n'.join(text for text in cell['texts'] if text)
+        if cell['rowspan'] > 1 or cell['colspan'] > 1:
+            spans.append([cell['row'], cell['col'], cell['rowspan'], cell['colspan']])
+    return {'type': 'table', 'rows': grid, 'spans': spans}
+
+
+def section_paths(ole):
+    return sorted(
+        (path for path in ole.paths if _SECTION_RE.match(path)),
+        key=lambda path: int(_SECTION_RE.match(path).group(1)),
+    )
+
+
+def iter_hwp5_blocks(path):
+    """HWP5 본문 블록을 구역(Section) 순서대로 스트리밍 (잘리거나 손상된 파일도 HwpError로)"""
+    try:
+        yield from _iter_hwp5_blocks(path)
+    except (struct.error, IndexError) as e:
+        raise HwpError(f"HWP5 구조 손상: {e}") from e
+
+
+def _iter_hwp5_blocks(path):
+    ole = OleFile.open(path)
+    header = read_file_header(ole)
+    if header['encrypted']:
+        raise HwpError("암호가 걸린 문서")
+    if header['distribution']:
+        raise HwpError("배포용 문서 (본문 암호화)")
+
+    for section in section_paths(ole):
+        data = ole.read(section)
+        if header['compressed']:
+            try:
+                data = zlib.decompress(data, -15)
+            except zlib.error as e:
+                raise HwpError(f"{section} 압축 해제 실패: {e}") from e
+        yield from _list_blocks(_build_tree(iter_records(data)))
+
+
+# ============================================================
+# HWPX (OWPML)
+# ============================================================
+def _local(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def _hwpx_t_text(element):
+    """hp:t → 문자열 (탭/줄바꿈/공백 요소 포함)"""
+    parts = [element.text or '']
+    for child in element:
+        parts.append(HWPX_CHARS.get(_local(child.tag), ''))
+        parts.append(child.tail or '')
+    return ''.join(parts)
+
+
+def _hwpx_sublists(element):
+    """element 아래의 가장 바깥 hp:subList (글상자 등)"""
+    for child in element:
+        if _local(child.tag) == 'subList':
+            yield child
+        else:
+            yield from _hwpx_sublists(child)
+
+
+def _hwpx_paragraph_blocks(paragraph):
+    """hp:p → 문단 + 안에 든 표/글상자 블록"""
+    runs = [child for child in paragraph if _local(child.tag) == 'run']
+    text = ''.join(
+        _hwpx_t_text(item) for run in runs for item in run if _local(item.tag) == 't'
+    ).strip()
+    if text:
+        yield {'type': 'paragraph', 'text': text}
+    for run in runs:
+        for item in run:
+            name = _local(item.tag)
+            if name == 'tbl':
+                table = _hwpx_table_block(item)
+                if table:
+                    yield table
+            elif name != 't':
+                for sublist in _hwpx_sublists(item):
+                    for child in sublist:
+                        if _local(child.tag) == 'p':
+                            yield from _hwpx_paragraph_blocks(child)
+
+
+def _hwpx_table_block(table):
+    cells = []
+    for row in table:
+        if _local(row.tag) != 'tr':
+            continue
+        for cell in row:
+            if _local(cell.tag) != 'tc':
+                continue
+            info = {'row': len(cells), 'col': 0, 'rowspan': 1, 'colspan': 1, 'texts': []}
+            for child in cell:
+                name = _local(child.tag)
+                if name == 'cellAddr':
+                    info['row'] = int(child.get('rowAddr', 0))
+                    info['col'] = int(child.get('colAddr', 0))
+                elif name == 'cellSpan':
+                    info['rowspan'] = int(child.get('rowSpan', 1))
+                    info['colspan'] = int(child.get('colSpan', 1))
+                elif name == 'subList':
+                    info['texts'].extend(
+                        _block_text(block)
+                        for p in child if _local(p.tag) == 'p'
+                        for block in _hwpx_paragraph_blocks(p)
+                    )
+            cells.append(info)
+    return _grid_block(cells, int(table.get('rowCnt', 0)), int(table.get('colCnt', 0)))
+
+
+def hwpx_section_names(archive):
+    return sorted(
+        (name for name in archive.namelist() if _HWPX_SECTION_RE.match(name)),
+        key=lambda name: int(_HWPX_SECTION_RE.match(name).group(1)),
+    )
+
+
+def iter_hwpx_blocks(path):
+    """HWPX 본문 블록 스트리밍 (구역 XML을 iterparse - 최상위 문단 단위로 처리 후 해제)"""
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile as e:
+        raise HwpError(f"HWPX zip 손상: {e}") from e
+    with archive:
+        sections = hwpx_section_names(archive)
+        if not sections:
+            raise HwpError("HWPX 본문(Contents/section*.xml) 없음")
+        for name in sections:
+            with archive.open(name) as stream:
+                depth = 0
+                root = None
+                try:
+                    for event, element in ElementTree.iterparse(stream, events=('start', 'end')):
+                        if event == 'start':
+                            depth += 1
+                            if root is None:
+                                root = element
+                            continue
+                        depth -= 1
+                        # 깊이 1 = hs:sec 바로 아래 최상위 문단
+                        if depth == 1 and _local(element.tag) == 'p':
+                            yield from _hwpx_paragraph_blocks(element)
+                            root.clear()
+                except ElementTree.ParseError as e:
+                    raise HwpError(f"{name} XML 오류: {e}") from e
+
+
+def detect_kind(path):
+    """파일 내용으로 'hwp5' / 'hwpx' 판별 (확장자 무관)"""
+    with open(path, 'rb') as f:
+        head = f.read(8)
+    if head.startswith(OLE_MAGIC):
+        return 'hwp5'
+    if head.startswith(ZIP_MAGIC):
+        return 'hwpx'
+    raise HwpError("HWP/HWPX 파일이 아님")
+
+
+def iter_blocks(path):
+    """HWP5 / HWPX 본문 블록 스트리밍 (형식은 내용으로 판별)"""
+    if detect_kind(path) == 'hwpx':
+        return iter_hwpx_blocks(path)
+    return iter_hwp5_blocks(path)
+
+
+def extract_text(path):
+    """본문 전체 텍스트 (표는 행마다 탭 구분)"""
+    return '\n'.join(_block_text(block) for block in iter_blocks(path))
+
+
+# ============================================================
+# 양식 색인
+# ============================================================
+def load_index(path=INDEX_PATH):
+    try:
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+        if data.get('version') == INDEX_VERSION:
+            return data.get('files', {})
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def index_sources(forms_dir=FORMS_DIR, store=None):
+    """
+    색인할 HWP/HWPX → {양식 파일명: 경로}
+    양식 저장소(form_store)의 이름 + 아직 저장소로 옮기지 않은 forms_dir/*.hwp, *.hwpx (같은 이름이면 저장소 우선)
+    """
+    store = store or FormStore.load()
+    sources = {}
+    for ext in ('hwp', 'hwpx'):
+        for name in store.names_with_ext(ext):
+            sources[name] = store.path_for(name)
+        for legacy_path in Path(forms_dir).glob(f'*.{ext}'):
+            sources.setdefault(legacy_path.name, legacy_path)
+    return sources
+
+
+def build_index(forms_dir=FORMS_DIR, path=INDEX_PATH, store=None):
+    """
+    저장소 + forms_dir의 HWP/HWPX 텍스트 색인 (내용 해시가 같으면 다시 파싱하지 않음)
+    찾은 파일이 하나도 없으면 기존 색인을 빈 색인으로 덮어쓰지 않음
+    Returns: (색인, 새로 파싱한 수, 실패 목록)
+    """
+    previous = load_index(path)
+    index, parsed, failed = {}, 0, []
+    for name, hwp_path in sorted(index_sources(forms_dir, store).items()):
+        data = hwp_path.read_bytes()
+        sha = hashlib.sha256(data).hexdigest()
+        if previous.get(name, {}).get('sha256') == sha:
+            index[name] = previous[name]
+            continue
+        try:
+            blocks = list(iter_blocks(hwp_path))
+        except (HwpError, zipfile.BadZipFile) as e:
+            failed.append((name, str(e)))
+            continue
+        parsed += 1
+        index[name] = {
+            'sha256': sha,
+            'format': detect_kind(hwp_path),
+            'paragraphs': sum(1 for block in blocks if block['type'] == 'paragraph'),
+            'tables': sum(1 for block in blocks if block['type'] == 'table'),
+            'text': '\n'.join(_block_text(block) for block in blocks),
+        }
+
+    if not index and previous:
+        return index, parsed, failed
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'version': INDEX_VERSION, 'files': index}, f, ensure_ascii=False, indent=2)
+    return index, parsed, failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='HWP5/HWPX 텍스트/구조 추출 (한글 프로그램 불필요)')
+    parser.add_argument('input', nargs='?', help='HWP/HWPX 파일 경로')
+    parser.add_argument('--all', action='store_true', help='양식 저장소 + public/files/forms의 HWP/HWPX 텍스트 색인')
+    parser.add_argument('--tables', action='store_true', help='표를 격자로 출력')
+    args = parser.parse_args()
+
+    if args.all:
+        started = time.monotonic()
+        index, parsed, failed = build_index()
+        if not index:
+            print("⚠️ 색인할 HWP/HWPX가 없습니다 (저장소/public/files/forms 모두 비어 있음, 기존 색인 유지)")
+            return
+        print(f"📚 HWP {len(index)}개 색인 (새로 파싱 {parsed}개) - {time.monotonic() - started:.2f}초")
+        for name, error in failed:
+            print(f"  ✗ {name}: {error}")
+        print(f"💾 {INDEX_PATH}")
+        return
+
+    if not args.input:
+        parser.print_help()
+        return
+
+    try:
+        for block in iter_blocks(args.input):
+            if block['type'] == 'paragraph':
+                print(block['text'])
+            elif args.tables:
+                print('┌ 표 ' + '─' * 20)
+                for row in block['rows']:
+                    print('│ ' + ' | '.join(cell.replace('\n', ' ') for cell in row))
+                print('└' + '─' * 24)
+            else:
+                print(_block_text(block))
+    except HwpError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
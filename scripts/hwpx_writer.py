@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+문서 블록 → HWPX(OWPML zip) 작성기 (한글 프로그램/COM 불필요)
+
+- odf_writer와 같은 블록 형식({"type": "paragraph" / "table"})을 받음
+- 표 병합(spans)은 hp:cellSpan, 머리글 칸(header_rows / header_cells)은 회색 배경 테두리
+- 글꼴/문단 모양은 header.xml에 고정 목록으로 정의 (제목/소제목/본문/가운데/오른쪽)
+- 결과는 hwp_reader.iter_hwpx_blocks로 다시 읽을 수 있음
+
+사용법:
+  from hwpx_writer import write_hwpx
+  write_hwpx(blocks, "각서.hwpx", title="각서")
+"""
+
+import zipfile
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+NAMESPACES = {
+    'ha': 'http://www.hancom.co.kr/hwpml/2011/app',
+    'hp': 'http://www.hancom.co.kr/hwpml/2011/paragraph',
+    'hs': 'http://www.hancom.co.kr/hwpml/2011/section',
+    'hc': 'http://www.hancom.co.kr/hwpml/2011/core',
+    'hh': 'http://www.hancom.co.kr/hwpml/2011/head',
+    'hpf': 'http://www.hancom.co.kr/schema/2011/hpf',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+    'opf': 'http://www.idpf.org/2007/opf/',
+}
+XMLNS = ' '.join(f'xmlns:{prefix}="{uri}"' for prefix, uri in NAMESPACES.items())
+XML_DECL = '<?xml version="1.0" encoding="UTF-8" standalone="yes" ?>'
+
+FONT_FACE = '맑은 고딕'
+FONT_LANGS = ('HANGUL', 'LATIN', 'HANJA', 'JAPANESE', 'OTHER', 'SYMBOL', 'USER')
+
+# HWPUNIT (1pt = 100, 1mm ≈ 283.5) - A4, 여백 20mm
+PAGE_WIDTH = 59528
+PAGE_HEIGHT = 84186
+PAGE_MARGIN = 5669
+TEXT_WIDTH = PAGE_WIDTH - 2 * PAGE_MARGIN
+CELL_MARGIN = 141
+ROW_HEIGHT = 1800  # 줄 하나 기준 (한글이 열 때 내용에 맞춰 다시 계산)
+
+# 글자 모양 id → (크기, 굵게)
+CHAR_PROPERTIES = [(1000, False), (1800, True), (1200, True)]
+# 문단 모양 id → 정렬
+PARA_PROPERTIES = ['JUSTIFY', 'CENTER', 'RIGHT']
+# 테두리/배경 id: 1 쪽, 2 글자, 3 표 칸, 4 머리글 칸
+BORDER_NONE, BORDER_CHAR, BORDER_CELL, BORDER_HEADER = 1, 2, 3, 4
+
+# 블록 style 값 → (문단 모양, 글자 모양)
+PARAGRAPH_STYLES = {'title': (1, 1), 'heading': (0, 2), 'right': (2, 0), 'center': (1, 0)}
+
+
+def _border_fill(fill_id, border, face_color='none'):
+    sides = ''.join(
+        f'<hh:{side}Border type="{border}" width="0.12 mm" color="#000000"/>'
+        for side in ('left', 'right', 'top', 'bottom')
+    )
+    return (
+        f'<hh:borderFill id="{fill_id}" threeD="0" shadow="0" centerLine="NONE" breakCellSeparateLine="0">'
+        '<hh:slash type="NONE" Crooked="0" isCounter="0"/><hh:backSlash type="NONE" Crooked="0" isCounter="0"/>'
+        f'{sides}<hh:diagonal type="SOLID" width="0.1 mm" color="#000000"/>'
+        f'<hc:fillBrush><hc:winBrush faceColor="{face_color}" hatchColor="#999999" alpha="0"/></hc:fillBrush>'
+        '</hh:borderFill>'
+    )
+
+
+def _char_pr(char_id, height, bold):
+    langs = ('hangul', 'latin', 'hanja', 'japanese', 'other', 'symbol', 'user')
+
+    def each(value):
+        return ' '.join(f'{lang}="{value}"' for lang in langs)
+
+    return (
+        f'<hh:charPr id="{char_id}" height="{height}" textColor="#000000" shadeColor="none" '
+        f'useFontSpace="0" useKerning="0" symMark="NONE" borderFillIDRef="{BORDER_CHAR}">'
+        f'<hh:fontRef {each(0)}/><hh:ratio {each(100)}/><hh:spacing {each(0)}/>'
+        f'<hh:relSz {each(100)}/><hh:offset {each(0)}/>'
+        + ('<hh:bold/>' if bold else '') +
+        '<hh:underline type="NONE" shape="SOLID" color="#000000"/><hh:strikeout shape="NONE" color="#000000"/>'
+        '<hh:outline type="NONE"/><hh:shadow type="NONE" color="#C0C0C0" offsetX="10" offsetY="10"/>'
+        '</hh:charPr>'
+    )
+
+
+def _para_pr(para_id, align):
+    margins = ''.join(f'<hc:{name} value="0" unit="HWPUNIT"/>' for name in ('intent', 'left', 'right', 'prev', 'next'))
+    return (
+        f'<hh:paraPr id="{para_id}" tabPrIDRef="0" condense="0" fontLineHeight="0" snapToGrid="1" '
+        'suppressLineNumbers="0" checked="0">'
+        f'<hh:align horizontal="{align}" vertical="BASELINE"/><hh:heading type="NONE" idRef="0" level="0"/>'
+        '<hh:breakSetting breakLatinWord="KEEP_WORD" breakNonLatinWord="KEEP_WORD" widowOrphan="0" '
+        'keepWithNext="0" keepLines="0" pageBreakBefore="0" lineWrap="BREAK"/>'
+        '<hh:autoSpacing eAsianEng="0" eAsianNum="0"/>'
+        f'<hh:margin>{margins}</hh:margin><hh:lineSpacing type="PERCENT" value="160" unit="HWPUNIT"/>'
+        f'<hh:border borderFillIDRef="{BORDER_CHAR}" offsetLeft="0" offsetRight="0" offsetTop="0" '
+        'offsetBottom="0" connect="0" ignoreMargin="0"/></hh:paraPr>'
+    )
+
+
+def render_header():
+    fonts = ''.join(
+        f'<hh:fontface lang="{lang}" fontCnt="1"><hh:font id="0" face="{FONT_FACE}" type="TTF" isEmbedded="0"/></hh:fontface>'
+        for lang in FONT_LANGS
+    )
+    border_fills = ''.join([
+        _border_fill(BORDER_NONE, 'NONE'),
+        _border_fill(BORDER_CHAR, 'NONE'),
+        _border_fill(BORDER_CELL, 'SOLID'),
+        _border_fill(BORDER_HEADER, 'SOLID', '#EEEEEE'),
+    ])
+    chars = ''.join(_char_pr(i, height, bold) for i, (height, bold) in enumerate(CHAR_PROPERTIES))
+    paras = ''.join(_para_pr(i, align) for i, align in enumerate(PARA_PROPERTIES))
+    return (
+        f'{XML_DECL}<hh:head {XMLNS} version="1.4" secCnt="1">'
+        '<hh:beginNum page="1" footnote="1" endnote="1" pic="1" tbl="1" equation="1"/>'
+        '<hh:refList>'
+        f'<hh:fontfaces itemCnt="{len(FONT_LANGS)}">{fonts}</hh:fontfaces>'
+        f'<hh:borderFills itemCnt="4">{border_fills}</hh:borderFills>'
+        f'<hh:charProperties itemCnt="{len(CHAR_PROPERTIES)}">{chars}</hh:charProperties>'
+        '<hh:tabProperties itemCnt="1"><hh:tabPr id="0" autoTabLeft="0" autoTabRight="0"/></hh:tabProperties>'
+        f'<hh:paraProperties itemCnt="{len(PARA_PROPERTIES)}">{paras}</hh:paraProperties>'
+        '<hh:styles itemCnt="1"><hh:style id="0" type="PARA" name="바탕글" engName="Normal" paraPrIDRef="0" '
+        'charPrIDRef="0" nextStyleIDRef="0" langID="1042" lockForm="0"/></hh:styles>'
+        '</hh:refList>'
+        '<hh:compatibleDocument targetProgram="HWP201X"><hh:layoutCompatibility/></hh:compatibleDocument>'
+        '<hh:docOption><hh:linkinfo path="" pageInherit="0" footnoteInherit="0"/></hh:docOption>'
+        '</hh:head>'
+    )
+
+
+SECTION_PROPERTIES = (
+    '<hp:secPr id="" textDirection="HORIZONTAL" spaceColumns="1134" tabStop="8000" tabStopVal="4000" '
+    'tabStopUnit="HWPUNIT" outlineShapeIDRef="0" memoShapeIDRef="0" textVerticalWidthHead="0" masterPageCnt="0">'
+    '<hp:grid lineGrid="0" charGrid="0" wonggojiFormat="0"/>'
+    '<hp:startNum pageStartsOn="BOTH" page="0" pic="0" tbl="0" equation="0"/>'
+    '<hp:visibility hideFirstHeader="0" hideFirstFooter="0" hideFirstMasterPage="0" border="SHOW_ALL" '
+    'fill="SHOW_ALL" hideFirstPageNum="0" hideFirstEmptyLine="0" showLineNumber="0"/>'
+    '<hp:lineNumberShape restartType="0" countBy="0" distance="0" startNumber="0"/>'
+    f'<hp:pagePr landscape="WIDELY" width="{PAGE_WIDTH}" height="{PAGE_HEIGHT}" gutterType="LEFT_ONLY">'
+    f'<hp:margin header="0" footer="0" gutter="0" left="{PAGE_MARGIN}" right="{PAGE_MARGIN}" '
+    f'top="{PAGE_MARGIN}" bottom="{PAGE_MARGIN}"/></hp:pagePr>'
+    + ''.join(
+        f'<hp:pageBorderFill type="{kind}" borderFillIDRef="{BORDER_NONE}" textBorder="PAPER" headerInside="0" '
+        'footerInside="0" fillArea="PAPER"><hp:offset left="1417" right="1417" top="1417" bottom="1417"/>'
+        '</hp:pageBorderFill>'
+        for kind in ('BOTH', 'EVEN', 'ODD')
+    )
+    + '</hp:secPr>'
+    '<hp:ctrl><hp:colPr id="" type="NEWSPAPER" layout="LEFT" colCount="1" sameSz="1" sameGap="0"/></hp:ctrl>'
+)
+
+
+def _text(line):
+    """한 줄 → hp:t (탭은 hp:tab)"""
+    chunks = line.split('\t')
+    return '<hp:t>' + '<hp:tab/>'.join(escape(chunk) for chunk in chunks) + '</hp:t>'
+
+
+def _paragraph(line, para_id=0, char_id=0, inner=''):
+    return (
+        f'<hp:p id="0" paraPrIDRef="{para_id}" styleIDRef="0" pageBreak="0" columnBreak="0" merged="0">'
+        f'<hp:run charPrIDRef="{char_id}">{inner}{_text(line)}</hp:run></hp:p>'
+    )
+
+
+def _paragraphs(text, para_id=0, char_id=0):
+    lines = text.split('\n') if text else ['']
+    return ''.join(_paragraph(line, para_id, char_id) for line in lines)
+
+
+def _table(block, index):
+    rows = block['rows']
+    cols = max((len(row) for row in rows), default=0)
+    header_rows = block.get('header_rows', 0)
+    header_cells = {tuple(cell) for cell in block.get('header_cells') or []}
+    origins = {(r, c): (rs, cs) for r, c, rs, cs in block.get('spans') or []}
+    covered = {
+        (r + dr, c + dc)
+        for (r, c), (rs, cs) in origins.items()
+        for dr in range(rs) for dc in range(cs) if dr or dc
+    }
+
+    # 열 너비는 균등 분배 (나머지는 마지막 열)
+    widths = [TEXT_WIDTH // cols] * cols
+    widths[-1] += TEXT_WIDTH - sum(widths)
+
+    out = [
+        f'<hp:tbl id="{index}" zOrder="{index}" numberingType="TABLE" textWrap="TOP_AND_BOTTOM" textFlow="BOTH_SIDES" '
+        f'lock="0" dropcapstyle="None" pageBreak="CELL" repeatHeader="1" rowCnt="{len(rows)}" colCnt="{cols}" '
+        f'cellSpacing="0" borderFillIDRef="{BORDER_CELL}" noAdjust="0">'
+        f'<hp:sz width="{TEXT_WIDTH}" widthRelTo="ABSOLUTE" height="{ROW_HEIGHT * len(rows)}" heightRelTo="ABSOLUTE" protect="0"/>'
+        '<hp:pos treatAsChar="1" affectLSpacing="0" flowWithText="1" allowOverlap="0" holdAnchorAndSO="0" '
+        'vertRelTo="PARA" horzRelTo="PARA" vertAlign="TOP" horzAlign="LEFT" vertOffset="0" horzOffset="0"/>'
+        '<hp:outMargin left="0" right="0" top="0" bottom="0"/>'
+        f'<hp:inMargin left="{CELL_MARGIN}" right="{CELL_MARGIN}" top="{CELL_MARGIN}" bottom="{CELL_MARGIN}"/>'
+    ]
+    for r, row in enumerate(rows):
+        out.append('<hp:tr>')
+        for c in range(cols):
+            if (r, c) in covered:
+                continue
+            rs, cs = origins.get((r, c), (1, 1))
+            header = r < header_rows or (r, c) in header_cells
+            text = row[c] if c < len(row) else ''
+            height = ROW_HEIGHT * max(rs, text.count('\n') + 1)
+            out.append(
+                f'<hp:tc name="" header="{int(r < header_rows)}" hasMargin="0" protect="0" editable="0" dirty="0" '
+                f'borderFillIDRef="{BORDER_HEADER if header else BORDER_CELL}">'
+                '<hp:subList id="" textDirection="HORIZONTAL" lineWrap="BREAK" vertAlign="CENTER" linkListIDRef="0" '
+                'linkListNextIDRef="0" textWidth="0" textHeight="0" hasTextRef="0" hasNumRef="0">'
+                f'{_paragraphs(text)}</hp:subList>'
+                f'<hp:cellAddr colAddr="{c}" rowAddr="{r}"/><hp:cellSpan colSpan="{cs}" rowSpan="{rs}"/>'
+                f'<hp:cellSz width="{sum(widths[c:c + cs])}" height="{height}"/>'
+                f'<hp:cellMargin left="{CELL_MARGIN}" right="{CELL_MARGIN}" top="{CELL_MARGIN}" bottom="{CELL_MARGIN}"/>'
+                '</hp:tc>'
+            )
+        out.append('</hp:tr>')
+    out.append('</hp:tbl>')
+    # 표는 글자처럼 취급되는 개체 → 빈 문단의 run 안에 둠
+    return _paragraph('', inner=''.join(out))
+
+
+def render_section(blocks):
+    """블록 목록 → Contents/section0.xml 문자열"""
+    # 첫 문단에 구역 정의(용지/여백)
+    body = [_paragraph('', inner=SECTION_PROPERTIES)]
+    tables = 0
+    for block in blocks:
+        if block['type'] == 'paragraph':
+            body.append(_paragraphs(block['text'], *PARAGRAPH_STYLES.get(block.get('style'), (0, 0))))
+        elif block['type'] == 'table' and block['rows']:
+            tables += 1
+            body.append(_table(block, tables))
+    return f'{XML_DECL}<hs:sec {XMLNS}>{"".join(body)}</hs:sec>'
+
+
+def _preview_text(blocks):
+    lines = []
+    for block in blocks:
+        if block['type'] == 'paragraph':
+            lines.append(block['text'])
+        elif block['type'] == 'table':
+            lines.extend(''.join(f'<{cell}>' for cell in row) for row in block['rows'])
+    return '\r\n'.join(lines)
+
+
+def _package(title):
+    return (
+        f'{XML_DECL}<opf:package {XMLNS} version="" unique-identifier="" id="">'
+        f'<opf:metadata><opf:title>{escape(title or "")}</opf:title><opf:language>ko</opf:language></opf:metadata>'
+        '<opf:manifest>'
+        '<opf:item id="header" href="Contents/header.xml" media-type="application/xml"/>'
+        '<opf:item id="section0" href="Contents/section0.xml" media-type="application/xml"/>'
+        '</opf:manifest>'
+        '<opf:spine><opf:itemref idref="header" linear="no"/><opf:itemref idref="section0" linear="yes"/></opf:spine>'
+        '</opf:package>'
+    )
+
+
+VERSION_XML = (
+    f'{XML_DECL}<hv:HCFVersion xmlns:hv="http://www.hancom.co.kr/hwpml/2011/version" tagetApplication="WORDPROCESSOR" '
+    'major="5" minor="1" micro="0" buildNumber="1" os="1" xmlVersion="1.4" application="Hancom Office Hangul" '
+    'appVersion="11, 0, 0, 0"/>'
+)
+CONTAINER_XML = (
+    f'{XML_DECL}<ocf:container xmlns:ocf="urn:oasis:names:tc:opendocument:xmlns:container" '
+    'xmlns:hpf="http://www.hancom.co.kr/schema/2011/hpf"><ocf:rootfiles>'
+    '<ocf:rootfile full-path="Contents/content.hpf" media-type="application/hwpml-package+xml"/>'
+    '<ocf:rootfile full-path="Preview/PrvText.txt" media-type="text/plain"/>'
+    '</ocf:rootfiles></ocf:container>'
+)
+MANIFEST_XML = f'{XML_DECL}<odf:manifest xmlns:odf="urn:oasis:names:tc:opendocument:xmlns:manifest:1.0"/>'
+
+
+def write_hwpx(blocks, path, title=None):
+    """블록 목록 → .hwpx (mimetype은 압축 없이 맨 앞에)"""
+    blocks = list(blocks)
+    path = Path(path)
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(zipfile.ZipInfo('mimetype'), 'application/hwp+zip', compress_type=zipfile.ZIP_STORED)
+        archive.writestr('version.xml', VERSION_XML)
+        archive.writestr('META-INF/container.xml', CONTAINER_XML)
+        archive.writestr('META-INF/manifest.xml', MANIFEST_XML)
+        archive.writestr('Contents/content.hpf', _package(title))
+        archive.writestr('Contents/header.xml', render_header())
+        archive.writestr('Contents/section0.xml', render_section(blocks))
+        archive.writestr('Preview/PrvText.txt', _preview_text(blocks))
+    return path
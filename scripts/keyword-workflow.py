@@ -2,7 +2,7 @@
 """
 머니위키 키워드 워크플로우 도구
 - Google 연관검색어 추출 (기본 + 확장)
-- 기존 wiki 파일 중복 체크
+- 기존 wiki 파일 중복 체크 (키워드 인덱스: 정확/정규화/유사 일치)
 - 신규 키워드만 필터링
 
 사용법:
@@ -14,12 +14,13 @@
 
 import requests
 import os
-import re
 import sys
 import glob
 from urllib.parse import quote
 from pathlib import Path
 
+from keyword_index import KeywordIndex
+
 WIKI_DIR = Path(__file__).parent.parent / "content" / "wiki"
 
 def get_google_suggestions(keyword: str, lang: str = "ko") -> list:
@@ -50,39 +51,15 @@ def expand_keywords(base_keyword: str, lang: str = "ko") -> list:
     all_keywords.discard(base_keyword)
     return sorted(all_keywords)
 
-def get_existing_keywords() -> set:
-    """기존 wiki 파일에서 모든 키워드 추출"""
-    existing = set()
-
-    for md_file in WIKI_DIR.glob("*.md"):
-        try:
-            content = md_file.read_text(encoding="utf-8")
-            match = re.search(r"keywords:\s*\n((?:\s+-.*\n)+)", content)
-            if match:
-                keywords_block = match.group(1)
-                for line in keywords_block.split("\n"):
-                    line = line.strip()
-                    if line.startswith("-"):
-                        kw = line[1:].strip().strip("'\"")
-                        existing.add(kw.lower())
-
-            title_match = re.search(r"title:\s*['\"]?(.+?)['\"]?\s*\n", content)
-            if title_match:
-                existing.add(title_match.group(1).lower())
-
-        except Exception as e:
-            pass
-
-    return existing
-
-def filter_new_keywords(suggestions: list, existing: set) -> tuple:
-    """신규 키워드와 중복 키워드 분리"""
+def filter_new_keywords(suggestions: list, index: KeywordIndex, fuzzy: bool = True) -> tuple:
+    """신규 키워드와 중복 키워드 분리 (정확 → 정규화 → 유사 일치 순)"""
     new_keywords = []
     duplicate_keywords = []
 
     for kw in suggestions:
-        if kw.lower() in existing:
-            duplicate_keywords.append(kw)
+        match = index.lookup(kw, fuzzy=fuzzy)
+        if match:
+            duplicate_keywords.append((kw, match))
         else:
             new_keywords.append(kw)
 
@@ -120,15 +97,15 @@ def main():
     # 2. 중복 체크
     if check_mode:
         print("Step 2: 기존 wiki 파일 중복 체크...")
-        existing = get_existing_keywords()
-        print(f"   -> 기존 키워드 {len(existing)}개 로드\n")
+        index = KeywordIndex.load(WIKI_DIR)
+        print(f"   -> 기존 키워드 {len(index.exact)}개 로드 (문서 {len(index.files)}개)\n")
 
-        new_kw, dup_kw = filter_new_keywords(suggestions, existing)
+        new_kw, dup_kw = filter_new_keywords(suggestions, index)
 
         if dup_kw:
             print(f"[중복] {len(dup_kw)}개:")
-            for kw in dup_kw[:10]:
-                print(f"   x {kw}")
+            for kw, match in dup_kw[:10]:
+                print(f"   x {kw}  ({match['type']}: {match['keyword']} → {match['slugs'][0]})")
             if len(dup_kw) > 10:
                 print(f"   ... 외 {len(dup_kw)-10}개")
             print()
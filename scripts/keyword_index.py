@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""
+기존 wiki 키워드 인덱스 (keyword → 슬러그)
+
+- frontmatter의 keywords / title로 인덱스 구성
+- .claude/cache/keyword-index.json에 저장 (다른 wiki 디렉토리는 keyword-index-<경로 해시>.json), 파일 mtime이 바뀐 문서만 다시 파싱
+- 조회: 정확 일치 → 정규화 일치(띄어쓰기/조사) → n-gram 유사 일치
+
+사용법:
+  python keyword_index.py                  # 인덱스 갱신 + 통계
+  python keyword_index.py "퇴직금 계산"     # 이미 다루는 문서 조회
+
+  from keyword_index import KeywordIndex
+  index = KeywordIndex.load()
+  match = index.lookup("퇴직금계산")   # {"type": "normalized", "keyword": ..., "slugs": [...]}
+"""
+
+import os
+import re
+import sys
+import json
+import hashlib
+from pathlib import Path
+
+from keyword_normalize import compact_key, char_ngrams, jaccard
+
+ROOT_DIR = Path(__file__).parent.parent
+WIKI_DIR = ROOT_DIR / "content" / "wiki"
+INDEX_PATH = ROOT_DIR / ".claude" / "cache" / "keyword-index.json"
+INDEX_VERSION = 1
+
+FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---", re.DOTALL)
+TITLE_RE = re.compile(r"^title:\s*['\"]?(.+?)['\"]?\s*$", re.MULTILINE)
+KEYWORDS_BLOCK_RE = re.compile(r"^keywords:\s*\n((?:[ \t]+-.*\n?)+)", re.MULTILINE)
+KEYWORDS_INLINE_RE = re.compile(r"^keywords:\s*\[(.*?)\]\s*$", re.MULTILINE)
+
+# 유사 일치 기본 임계값 (문자 bigram Jaccard)
+FUZZY_THRESHOLD = 0.75
+
+
+def index_path_for(wiki_dir):
+    """
+    wiki 디렉토리별 캐시 경로
+    (기본 디렉토리 외에는 경로 해시를 붙여 기본 캐시를 덮어쓰지 않음)
+    """
+    wiki_dir = Path(wiki_dir).resolve()
+    if wiki_dir == WIKI_DIR.resolve():
+        return INDEX_PATH
+    digest = hashlib.sha1(str(wiki_dir).encode("utf-8")).hexdigest()[:12]
+    return INDEX_PATH.with_name(f"keyword-index-{digest}.json")
+
+
+def parse_frontmatter_keywords(content):
+    """frontmatter에서 (title, keywords) 추출 - 블록/인라인 리스트 모두 지원"""
+    match = FRONTMATTER_RE.match(content)
+    if not match:
+        return None, []
+    frontmatter = match.group(1) + "\n"
+
+    title_match = TITLE_RE.search(frontmatter)
+    title = title_match.group(1).strip() if title_match else None
+
+    keywords = []
+    block = KEYWORDS_BLOCK_RE.search(frontmatter)
+    if block:
+        for line in block.group(1).splitlines():
+            line = line.strip()
+            if line.startswith("-"):
+                keywords.append(line[1:].strip().strip("'\""))
+    else:
+        inline = KEYWORDS_INLINE_RE.search(frontmatter)
+        if inline:
+            keywords = [kw.strip().strip("'\"") for kw in inline.group(1).split(",")]
+
+    return title, [kw for kw in keywords if kw]
+
+
+class KeywordIndex:
+    """기존 wiki 키워드 인덱스"""
+
+    def __init__(self, wiki_dir=WIKI_DIR, index_path=None):
+        self.wiki_dir = Path(wiki_dir)
+        self.index_path = Path(index_path) if index_path else index_path_for(wiki_dir)
+        self.files = {}      # slug → {"mtime", "title", "keywords"}
+        self.exact = {}      # 소문자 키워드 → {slug}
+        self.normalized = {} # compact 키 → {slug}
+        self.key_labels = {} # compact 키 → 원본 키워드 (출력용)
+        self.grams = {}      # compact 키 → n-gram 집합
+        self.gram_index = {} # n-gram → {compact 키}
+
+    # === 저장/갱신 ===
+    @classmethod
+    def load(cls, wiki_dir=WIKI_DIR, index_path=None):
+        """캐시를 읽고 변경된 문서만 반영해 인덱스 반환"""
+        index = cls(wiki_dir, index_path)
+        if index.index_path.exists():
+            try:
+                data = json.loads(index.index_path.read_text(encoding="utf-8"))
+                if data.get("version") == INDEX_VERSION:
+                    index.files = data.get("files", {})
+            except (OSError, ValueError):
+                index.files = {}
+
+        changed = index.refresh()
+        if changed or not index.index_path.exists():
+            index.save()
+        index._build_lookup()
+        return index
+
+    def refresh(self):
+        """mtime 기준 증분 갱신, 변경된 문서 수 반환"""
+        current = {}
+        for entry in os.scandir(self.wiki_dir):
+            if entry.is_file() and entry.name.endswith(".md"):
+                current[entry.name[:-3]] = (entry.path, entry.stat().st_mtime)
+
+        changed = 0
+        for slug in list(self.files):
+            if slug not in current:
+                del self.files[slug]
+                changed += 1
+
+        for slug, (path, mtime) in current.items():
+            cached = self.files.get(slug)
+            if cached and cached.get("mtime") == mtime:
+                continue
+            try:
+                content = Path(path).read_text(encoding="utf-8")
+            except OSError:
+                continue
+            title, keywords = parse_frontmatter_keywords(content)
+            self.files[slug] = {"mtime": mtime, "title": title, "keywords": keywords}
+            changed += 1
+
+        return changed
+
+    def save(self):
+        """인덱스를 JSON으로 저장"""
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": INDEX_VERSION, "files": self.files}, f, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+    def _build_lookup(self):
+        """정확/정규화/n-gram 조회 테이블 구성"""
+        self.exact.clear()
+        self.normalized.clear()
+        self.key_labels.clear()
+        self.grams.clear()
+        self.gram_index.clear()
+
+        for slug, info in self.files.items():
+            terms = list(info.get("keywords") or [])
+            if info.get("title"):
+                terms.append(info["title"])
+            for term in terms:
+                self.exact.setdefault(term.lower(), set()).add(slug)
+                key = compact_key(term)
+                if not key:
+                    continue
+                self.normalized.setdefault(key, set()).add(slug)
+                if key not in self.grams:
+                    self.key_labels[key] = term
+                    grams = self.grams[key] = char_ngrams(key)
+                    for gram in grams:
+                        self.gram_index.setdefault(gram, set()).add(key)
+
+    # === 조회 ===
+    def keywords(self):
+        """소문자 키워드 전체 집합 (기존 get_existing_keywords 호환)"""
+        return set(self.exact)
+
+    def slugs_for(self, keyword):
+        """정확/정규화 일치 슬러그 (유사 일치 제외)"""
+        return self.exact.get(keyword.lower()) or self.normalized.get(compact_key(keyword), set())
+
+    def fuzzy_matches(self, keyword, threshold=FUZZY_THRESHOLD, limit=5):
+        """n-gram 역색인으로 후보를 좁힌 뒤 Jaccard 유사도 순으로 반환"""
+        key = compact_key(keyword)
+        grams = char_ngrams(key)
+        if not grams:
+            return []
+
+        # 공유 n-gram 수 집계 → Jaccard 상한으로 후보 가지치기
+        shared = {}
+        for gram in grams:
+            for other in self.gram_index.get(gram, ()):
+                shared[other] = shared.get(other, 0) + 1
+
+        results = []
+        for other, count in shared.items():
+            # |A∩B| / |A∪B| ≤ count / max(|A|, |B|)
+            if count / max(len(grams), len(self.grams[other])) < threshold:
+                continue
+            score = jaccard(grams, self.grams[other])
+            if score >= threshold:
+                results.append((score, other))
+
+        results.sort(key=lambda r: (-r[0], r[1]))
+        return [
+            {"keyword": self.key_labels[other], "score": round(score, 3),
+             "slugs": sorted(self.normalized[other])}
+            for score, other in results[:limit]
+        ]
+
+    def lookup(self, keyword, fuzzy=True, threshold=FUZZY_THRESHOLD):
+        """
+        이미 다루는 키워드인지 조회
+
+        Returns:
+            {"type": "exact" | "normalized" | "fuzzy", "keyword", "slugs"} 또는 None
+        """
+        slugs = self.exact.get(keyword.lower())
+        if slugs:
+            return {"type": "exact", "keyword": keyword, "slugs": sorted(slugs)}
+
+        key = compact_key(keyword)
+        slugs = self.normalized.get(key)
+        if slugs:
+            return {"type": "normalized", "keyword": self.key_labels[key], "slugs": sorted(slugs)}
+
+        if fuzzy:
+            matches = self.fuzzy_matches(keyword, threshold=threshold, limit=1)
+            if matches:
+                return {"type": "fuzzy", **matches[0]}
+
+        return None
+
+
+def main():
+    index = KeywordIndex.load()
+    print(f"문서 {len(index.files)}개 | 키워드 {len(index.exact)}개 | 정규화 키 {len(index.normalized)}개")
+    print(f"인덱스: {index.index_path}")
+
+    for keyword in sys.argv[1:]:
+        match = index.lookup(keyword)
+        if match:
+            print(f"  [{match['type']}] {keyword} → {match['keyword']} ({', '.join(match['slugs'])})")
+        else:
+            print(f"  [신규] {keyword}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+"""
+한국어 키워드 정규화 + 유사 키워드 클러스터링
+
+- 정규화: 유니코드(NFC, 자모 결합) / 전각 문자 / 공백 / 조사 제거
+- 비교 키: 공백을 없앤 compact 키 ('퇴직금 계산' == '퇴직금계산')
+- 클러스터링: 문자 n-gram MinHash + LSH 밴딩으로 후보쌍만 비교 (O(n²) 없음)
+
+사용법:
+  from keyword_normalize import normalize_keyword, cluster_keywords
+  clusters = cluster_keywords(["퇴직금 계산", "퇴직금계산", "퇴직금 계산법"])
+"""
+
+import re
+import zlib
+import unicodedata
+from functools import lru_cache
+
+# 단어 끝에서 떼어낼 조사 (긴 것부터 검사)
+# '가/이/도/로' 처럼 명사 끝글자와 겹치기 쉬운 한 글자 조사는 제외 (휴가, 경기도, 차이)
+PARTICLES = sorted([
+    "에서는", "으로는", "에게서", "까지는",
+    "에서", "으로", "에게", "한테", "부터", "까지", "처럼", "보다",
+    "은", "는", "을", "를", "의", "에",
+], key=len, reverse=True)
+
+# 조사를 떼어도 남아야 하는 최소 어간 길이
+MIN_STEM = 2
+
+_SPACE_RE = re.compile(r"\s+")
+_PUNCT_RE = re.compile(r"[^\w가-힣ㄱ-ㅎㅏ-ㅣ\s]")
+
+# 전각 ASCII(！～) → 반각
+_FULLWIDTH = {code: code - 0xFEE0 for code in range(0xFF01, 0xFF5F)}
+_FULLWIDTH[0x3000] = 0x20  # 전각 공백
+
+
+_PARTICLE_SUFFIXES = tuple(PARTICLES)
+
+
+def strip_particle(token):
+    """토큰 끝의 조사 제거 ('퇴직금은' → '퇴직금', '계산' → '계산')"""
+    if not token.endswith(_PARTICLE_SUFFIXES):
+        return token
+    for particle in PARTICLES:
+        if token.endswith(particle) and len(token) - len(particle) >= MIN_STEM:
+            return token[:-len(particle)]
+    return token
+
+
+def normalize_keyword(keyword, strip_particles=True):
+    """
+    키워드 정규화
+
+    - NFC 정규화 (macOS 등에서 분해된 자모를 완성형으로 결합)
+    - 전각 → 반각, 소문자화
+    - 특수문자 제거, 연속 공백 정리
+    - 토큰별 조사 제거
+    """
+    text = unicodedata.normalize("NFC", keyword).translate(_FULLWIDTH).lower()
+    text = _PUNCT_RE.sub(" ", text)
+    tokens = _SPACE_RE.split(text.strip())
+    if strip_particles:
+        tokens = [strip_particle(t) for t in tokens]
+    return " ".join(t for t in tokens if t)
+
+
+@lru_cache(maxsize=65536)
+def compact_key(keyword):
+    """공백 무시 비교 키 ('퇴직금 계산' / '퇴직금계산' 동일 취급)"""
+    return normalize_keyword(keyword).replace(" ", "")
+
+
+def to_slug(keyword):
+    """키워드를 파일명/URL 슬러그로 변환 ('퇴직금 IRP 이체' → '퇴직금-IRP-이체')"""
+    slug = unicodedata.normalize("NFC", keyword).strip()
+    # 공백 → 하이픈
+    slug = _SPACE_RE.sub("-", slug)
+    # 특수문자 제거, 연속 하이픈 정리
+    slug = re.sub(r"[^\w가-힣-]", "", slug)
+    return re.sub(r"-{2,}", "-", slug).strip("-")
+
+
+def char_ngrams(text, n=2):
+    """문자 n-gram 집합 (텍스트가 n보다 짧으면 텍스트 자체)"""
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[i:i + n] for i in range(len(text) - n + 1)}
+
+
+def jaccard(a, b):
+    """두 집합의 Jaccard 유사도"""
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+# === MinHash / LSH ===
+_PRIME = (1 << 31) - 1
+_MAX_HASH = _PRIME
+
+
+def _make_permutations(num_perm, seed=42):
+    """MinHash용 (a, b) 계수 - 결정적 생성 (실행마다 동일한 결과)"""
+    perms = []
+    state = seed
+    for _ in range(num_perm):
+        state = (state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        a = (state >> 33) % _PRIME or 1
+        state = (state * 6364136223846793005 + 1442695040888963407) % (1 << 64)
+        b = (state >> 33) % _PRIME
+        perms.append((a, b))
+    return perms
+
+
+class MinHashLSH:
+    """
+    문자 n-gram MinHash + LSH 밴딩
+
+    bands × rows = num_perm. 임계값은 대략 (1/bands)^(1/rows)
+    (기본 8 × 4 → 약 0.59).
+    """
+
+    def __init__(self, num_perm=32, bands=8):
+        if num_perm % bands:
+            raise ValueError("num_perm은 bands의 배수여야 합니다")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.perms = _make_permutations(num_perm)
+        self.buckets = [{} for _ in range(bands)]
+        self._vector_cache = {}
+
+    def _shingle_vector(self, shingle):
+        """n-gram 하나의 순열별 해시값 (키워드 간 공유되는 n-gram이 많아 캐시)"""
+        vec = self._vector_cache.get(shingle)
+        if vec is None:
+            h = zlib.crc32(shingle.encode("utf-8")) % _PRIME
+            vec = self._vector_cache[shingle] = tuple((a * h + b) % _PRIME for a, b in self.perms)
+        return vec
+
+    def signature(self, shingles):
+        """n-gram 집합의 MinHash 시그니처"""
+        vectors = [self._shingle_vector(s) for s in shingles]
+        if not vectors:
+            return tuple([_MAX_HASH] * self.num_perm)
+        return tuple(map(min, zip(*vectors)))
+
+    def _bands(self, shingles):
+        sig = self.signature(shingles)
+        for band in range(self.bands):
+            yield band, sig[band * self.rows:(band + 1) * self.rows]
+
+    def insert(self, key, shingles):
+        """키 삽입"""
+        for band, chunk in self._bands(shingles):
+            self.buckets[band].setdefault(chunk, []).append(key)
+
+    def query(self, shingles):
+        """같은 버킷을 공유하는 후보 키 집합"""
+        candidates = set()
+        for band, chunk in self._bands(shingles):
+            candidates.update(self.buckets[band].get(chunk, ()))
+        return candidates
+
+
+def default_rank(keyword):
+    """대표 키워드 우선순위: 짧은 키워드, 같은 길이면 띄어쓰기된 자연스러운 형태"""
+    return (len(compact_key(keyword)), -keyword.count(" "), keyword)
+
+
+def cluster_keywords(keywords, threshold=0.6, ngram=2, rank=None):
+    """
+    유사 키워드 클러스터링
+
+    1) compact 키가 같은 키워드는 무조건 같은 클러스터
+    2) 짧은 compact 키가 리더가 되고, 나머지는 MinHash LSH로 찾은
+       후보 리더 중 n-gram Jaccard가 가장 높은 리더에 합류
+
+    Args:
+        keywords: 키워드 목록
+        threshold: 같은 클러스터로 묶을 최소 Jaccard 유사도
+        ngram: 문자 n-gram 크기
+        rank: 대표 키워드 선택용 정렬 키 함수 (기본: 짧은 순 → 띄어쓰기 있는 쪽 → 가나다순)
+
+    Returns:
+        [{"대표": str, "변형": [str, ...]}, ...] (대표 키워드 가나다순)
+    """
+    rank = rank or default_rank
+
+    # 1) compact 키 단위로 묶기
+    by_key = {}
+    for kw in dict.fromkeys(keywords):
+        key = compact_key(kw)
+        if key:
+            by_key.setdefault(key, []).append(kw)
+
+    # 2) 짧은 키부터 리더로 삼고, 이후 키는 LSH 후보 리더 중 가장 비슷한 곳에 합류
+    #    (리더와 직접 비교하므로 A~B~C 식의 연쇄 병합이 일어나지 않음)
+    lsh = MinHashLSH()
+    leader_grams = {}
+    groups = {}
+    for key in sorted(by_key, key=lambda k: (len(k), k)):
+        grams = char_ngrams(key, ngram)
+        best, best_score = None, threshold
+        for leader in lsh.query(grams):
+            score = jaccard(grams, leader_grams[leader])
+            if score > best_score or (score == best_score and (best is None or leader < best)):
+                best, best_score = leader, score
+        if best is None:
+            lsh.insert(key, grams)
+            leader_grams[key] = grams
+            groups[key] = list(by_key[key])
+        else:
+            groups[best].extend(by_key[key])
+
+    clusters = []
+    for members in groups.values():
+        members = sorted(members, key=rank)
+        clusters.append({"대표": members[0], "변형": members[1:]})
+
+    clusters.sort(key=lambda c: c["대표"])
+    return clusters
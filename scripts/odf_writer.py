@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+문서 블록 → 단일 파일 ODT(.fodt) 작성기
+
+- hwp_reader의 블록 형식({"type": "paragraph" / "table"})을 그대로 받음
+- 표 병합(spans)은 table:number-rows/columns-spanned + covered-table-cell로 표현
+- 머리글 칸: header_rows(앞쪽 행 전체) 또는 header_cells([[행, 열], ...]) → 회색 배경
+- 결과 .fodt는 LibreOffice 변환 백엔드(office_server)로 PDF/DOCX/PNG 내보내기
+  (HWPX처럼 LibreOffice가 직접 열지 못하는 형식의 변환 경로)
+
+사용법:
+  from hwp_reader import iter_blocks
+  from odf_writer import write_fodt
+  write_fodt(iter_blocks("확인서.hwpx"), "확인서.fodt", title="확인서")
+"""
+
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+
+NAMESPACES = {
+    'office': 'urn:oasis:names:tc:opendocument:xmlns:office:1.0',
+    'style': 'urn:oasis:names:tc:opendocument:xmlns:style:1.0',
+    'text': 'urn:oasis:names:tc:opendocument:xmlns:text:1.0',
+    'table': 'urn:oasis:names:tc:opendocument:xmlns:table:1.0',
+    'fo': 'urn:oasis:names:tc:opendocument:xmlns:xsl-fo-compatible:1.0',
+    'svg': 'urn:oasis:names:tc:opendocument:xmlns:svg-compatible:1.0',
+    'dc': 'http://purl.org/dc/elements/1.1/',
+}
+
+FONT_FAMILY = 'Noto Sans CJK KR'  # 없으면 LibreOffice가 대체 글꼴 사용
+
+STYLES = f'''<office:font-face-decls>
+  <style:font-face style:name="{FONT_FAMILY}" svg:font-family="&apos;{FONT_FAMILY}&apos;"/>
+ </office:font-face-decls>
+ <office:styles>
+  <style:default-style style:family="paragraph">
+   <style:paragraph-properties fo:margin-top="0cm" fo:margin-bottom="0.1cm"/>
+   <style:text-properties style:font-name="{FONT_FAMILY}" style:font-name-asian="{FONT_FAMILY}" fo:font-size="10pt" style:font-size-asian="10pt" fo:language="ko" fo:country="KR"/>
+  </style:default-style>
+  <style:style style:name="Standard" style:family="paragraph"/>
+  <style:style style:name="Title" style:family="paragraph">
+   <style:paragraph-properties fo:text-align="center" fo:margin-bottom="0.4cm"/>
+   <style:text-properties fo:font-size="18pt" style:font-size-asian="18pt" fo:font-weight="bold" style:font-weight-asian="bold"/>
+  </style:style>
+  <style:style style:name="Heading" style:family="paragraph">
+   <style:paragraph-properties fo:margin-top="0.3cm" fo:margin-bottom="0.15cm"/>
+   <style:text-properties fo:font-size="12pt" style:font-size-asian="12pt" fo:font-weight="bold" style:font-weight-asian="bold"/>
+  </style:style>
+  <style:style style:name="Right" style:family="paragraph">
+   <style:paragraph-properties fo:text-align="end"/>
+  </style:style>
+  <style:style style:name="Center" style:family="paragraph">
+   <style:paragraph-properties fo:text-align="center"/>
+  </style:style>
+ </office:styles>
+ <office:automatic-styles>
+  <style:page-layout style:name="A4">
+   <style:page-layout-properties fo:page-width="21cm" fo:page-height="29.7cm" fo:margin-top="2cm" fo:margin-bottom="2cm" fo:margin-left="2cm" fo:margin-right="2cm"/>
+  </style:page-layout>
+  <style:style style:name="Table" style:family="table">
+   <style:table-properties style:width="17cm" table:align="center"/>
+  </style:style>
+  <style:style style:name="Cell" style:family="table-cell">
+   <style:table-cell-properties fo:padding="0.1cm" fo:border="0.5pt solid #000000" style:vertical-align="middle"/>
+  </style:style>
+  <style:style style:name="HeaderCell" style:family="table-cell">
+   <style:table-cell-properties fo:padding="0.1cm" fo:border="0.5pt solid #000000" fo:background-color="#eeeeee" style:vertical-align="middle"/>
+  </style:style>
+ </office:automatic-styles>
+ <office:master-styles>
+  <style:master-page style:name="Standard" style:page-layout-name="A4"/>
+ </office:master-styles>'''
+
+# 블록 style 값 → 문단 스타일
+PARAGRAPH_STYLES = {'title': 'Title', 'heading': 'Heading', 'right': 'Right', 'center': 'Center'}
+
+
+def _inline(text):
+    """한 줄 텍스트 → ODF 인라인 (탭/연속 공백 보존)"""
+    parts = []
+    for i, chunk in enumerate(text.split('\t')):
+        if i:
+            parts.append('<text:tab/>')
+        # 연속 공백은 text:s로 (ODF는 공백을 하나로 합침)
+        out, spaces = [], 0
+        for char in chunk:
+            if char == ' ':
+                spaces += 1
+                continue
+            if spaces:
+                out.append(' ' if spaces == 1 else f' <text:s text:c="{spaces - 1}"/>')
+                spaces = 0
+            out.append(escape(char))
+        if spaces:
+            out.append(' ' if spaces == 1 else f' <text:s text:c="{spaces - 1}"/>')
+        parts.append(''.join(out))
+    return ''.join(parts)
+
+
+def _paragraphs(text, style='Standard'):
+    lines = text.split('\n') if text else ['']
+    return ''.join(f'<text:p text:style-name="{style}">{_inline(line)}</text:p>' for line in lines)
+
+
+def _table(block, index):
+    rows = block['rows']
+    cols = max((len(row) for row in rows), default=0)
+    header_rows = block.get('header_rows', 0)
+    header_cells = {tuple(cell) for cell in block.get('header_cells') or []}
+    origins = {(r, c): (rs, cs) for r, c, rs, cs in block.get('spans') or []}
+    covered = {
+        (r + dr, c + dc)
+        for (r, c), (rs, cs) in origins.items()
+        for dr in range(rs) for dc in range(cs) if dr or dc
+    }
+
+    out = [f'<table:table table:name="표{index}" table:style-name="Table">',
+           f'<table:table-column table:number-columns-repeated="{cols}"/>']
+    for r, row in enumerate(rows):
+        out.append('<table:table-row>')
+        for c in range(cols):
+            if (r, c) in covered:
+                out.append('<table:covered-table-cell/>')
+                continue
+            style = 'HeaderCell' if r < header_rows or (r, c) in header_cells else 'Cell'
+            attrs = f' table:style-name="{style}" office:value-type="string"'
+            if (r, c) in origins:
+                rs, cs = origins[(r, c)]
+                attrs += f' table:number-rows-spanned="{rs}" table:number-columns-spanned="{cs}"'
+            text = row[c] if c < len(row) else ''
+            out.append(f'<table:table-cell{attrs}>{_paragraphs(text)}</table:table-cell>')
+        out.append('</table:table-row>')
+    out.append('</table:table>')
+    return ''.join(out)
+
+
+def render_fodt(blocks, title=None):
+    """블록 목록 → .fodt XML 문자열"""
+    body = []
+    tables = 0
+    for block in blocks:
+        if block['type'] == 'paragraph':
+            body.append(_paragraphs(block['text'], PARAGRAPH_STYLES.get(block.get('style'), 'Standard')))
+        elif block['type'] == 'table' and block['rows']:
+            tables += 1
+            body.append(_table(block, tables))
+
+    xmlns = ' '.join(f'xmlns:{prefix}="{uri}"' for prefix, uri in NAMESPACES.items())
+    meta = f'<office:meta><dc:title>{escape(title)}</dc:title></office:meta>' if title else ''
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        f'<office:document {xmlns} office:version="1.3" '
+        f'office:mimetype={quoteattr("application/vnd.oasis.opendocument.text")}>\n'
+        f' {meta}\n {STYLES}\n'
+        f' <office:body><office:text>{"".join(body)}</office:text></office:body>\n'
+        '</office:document>\n'
+    )
+
+
+def write_fodt(blocks, path, title=None):
+    path = Path(path)
+    path.write_text(render_fodt(blocks, title), encoding='utf-8')
+    return path
@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+LibreOffice 상주 변환 서버 (UNO 소켓)
+
+- soffice --headless를 한 번만 띄워 두고 변환 요청을 UNO로 전달
+  (파일/형식마다 soffice를 새로 실행하면 매번 수 초씩 기동 비용이 듦)
+- 인스턴스마다 별도 사용자 프로필(-env:UserInstallation) → 여러 개를 동시에 띄워도 충돌 없음
+- 서버가 죽거나 연결이 끊기면 재시작 후 한 번 더 시도
+- 문서는 한 번만 열고 요청한 모든 형식(PDF/DOCX/PNG 썸네일)으로 연달아 내보냄
+- 변환 1회 제한 시간을 넘기면 해당 서버를 강제 종료 (다음 요청에서 재기동)
+- 이 Python에서 uno 모듈을 쓸 수 없으면 기존처럼 soffice --convert-to 1회 실행으로 대체
+
+사용법:
+  from office_server import open_office
+  with open_office(soffice_path) as office:
+      pdf_path = office.convert(odt_path, output_dir, "pdf")   # 실패 시 None
+      paths = office.convert_all(odt_path, output_dir, ("pdf", "docx", "png"))  # {형식: 경로 또는 None}
+
+  # 병렬 변환: 인스턴스마다 별도 프로필, 스레드 N개가 동시에 convert 호출
+  with open_office(soffice_path, instances=4, timeout=90) as office: ...
+
+필요 패키지:
+  uno (Linux: apt install python3-uno / Windows·macOS: LibreOffice 내장 Python으로 실행)
+"""
+
+import re
+import time
+import queue
+import shutil
+import socket
+import tempfile
+import threading
+import subprocess
+from pathlib import Path
+
+try:
+    import uno
+    from com.sun.star.beans import PropertyValue
+    from com.sun.star.connection import NoConnectException
+    HAS_UNO = True
+except ImportError:
+    HAS_UNO = False
+
+# 출력 형식 → LibreOffice 내보내기 필터 (Writer 문서 기준)
+FILTERS = {
+    'pdf': 'writer_pdf_Export',
+    'docx': 'MS Word 2007 XML',
+    'odt': 'writer8',
+    'png': 'writer_png_Export',  # 첫 페이지만 (썸네일)
+}
+
+THUMBNAIL_WIDTH = 800  # PNG 썸네일 가로 픽셀 (세로는 A4 비율)
+
+STARTUP_TIMEOUT = 60     # 서버 기동 대기 (초)
+CONVERT_TIMEOUT = 120    # 변환 1회 제한 (초)
+CONNECT_INTERVAL = 0.25
+
+
+class OfficeError(Exception):
+    """LibreOffice 서버 기동/변환 실패"""
+
+
+_VERSION_RE = re.compile(r'LibreOffice\s+([\d.]+)')
+_versions = {}
+
+
+def office_version(soffice_path):
+    """'LibreOffice 7.6.4.1' (변환 기록용, 실행 파일별로 한 번만 확인)"""
+    if soffice_path not in _versions:
+        try:
+            output = subprocess.run(
+                [soffice_path, "--headless", "--version"], capture_output=True, text=True, timeout=30
+            ).stdout
+        except (OSError, subprocess.TimeoutExpired):
+            output = ''
+        match = _VERSION_RE.search(output)
+        _versions[soffice_path] = f"LibreOffice {match.group(1)}" if match else "LibreOffice (버전 미상)"
+    return _versions[soffice_path]
+
+
+# LibreOffice 설치 위치 후보 (없으면 PATH에서 soffice / libreoffice)
+SOFFICE_PATHS = [
+    r"C:\Program Files\LibreOffice\program\soffice.exe",
+    r"C:\Program Files (x86)\LibreOffice\program\soffice.exe",
+    "/usr/bin/soffice",
+    "/usr/bin/libreoffice",
+    "/Applications/LibreOffice.app/Contents/MacOS/soffice",
+]
+
+
+def find_soffice():
+    """soffice 실행 파일 경로 (없으면 None)"""
+    for path in SOFFICE_PATHS:
+        if Path(path).exists():
+            return path
+    return shutil.which("soffice") or shutil.which("libreoffice")
+
+
+def free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _props(**values):
+    props = []
+    for name, value in values.items():
+        prop = PropertyValue()
+        prop.Name = name
+        prop.Value = value
+        props.append(prop)
+    return tuple(props)
+
+
+def _store_props(fmt):
+    if fmt == 'png':
+        filter_data = _props(PixelWidth=THUMBNAIL_WIDTH, PixelHeight=round(THUMBNAIL_WIDTH * 297 / 210))
+        return _props(
+            FilterName=FILTERS[fmt],
+            Overwrite=True,
+            FilterData=uno.Any("[]com.sun.star.beans.PropertyValue", filter_data),
+        )
+    return _props(FilterName=FILTERS[fmt], Overwrite=True)
+
+
+class OfficeServer:
+    """상주 soffice 인스턴스 하나 (동시에 문서 하나씩 변환)"""
+
+    def __init__(self, soffice_path, port=None, profile_dir=None):
+        self.soffice_path = soffice_path
+        self.port = port or free_port()
+        self.own_profile = profile_dir is None
+        self.profile_dir = Path(profile_dir or tempfile.mkdtemp(prefix='lo-profile-'))
+        self.process = None
+        self.desktop = None
+        self.conversions = 0
+        self.timed_out = False
+        self.lock = threading.Lock()
+
+    @property
+    def alive(self):
+        return self.process is not None and self.process.poll() is None and self.desktop is not None
+
+    def start(self, timeout=STARTUP_TIMEOUT):
+        """soffice 실행 + UNO 연결 (이미 떠 있으면 그대로)"""
+        if self.alive:
+            return
+        self.stop(remove_profile=False)
+
+        connection = f"socket,host=127.0.0.1,port={self.port};urp;StarOffice.ComponentContext"
+        self.process = subprocess.Popen(
+            [
+                self.soffice_path,
+                "--headless", "--invisible", "--nologo", "--nodefault", "--norestore", "--nolockcheck",
+                f"-env:UserInstallation={self.profile_dir.resolve().as_uri()}",
+                f"--accept={connection}",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        local = uno.getComponentContext()
+        resolver = local.ServiceManager.createInstanceWithContext('com.sun.star.bridge.UnoUrlResolver', local)
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                context = resolver.resolve(f"uno:{connection}")
+                break
+            except NoConnectException:
+                if self.process.poll() is not None:
+                    raise OfficeError(f"soffice 종료됨 (코드 {self.process.returncode})")
+                if time.monotonic() > deadline:
+                    self.stop(remove_profile=False)
+                    raise OfficeError(f"soffice 기동 시간 초과 ({timeout}초)")
+                time.sleep(CONNECT_INTERVAL)
+
+        self.desktop = context.ServiceManager.createInstanceWithContext('com.sun.star.frame.Desktop', context)
+
+    def _export(self, source, targets):
+        """문서를 한 번 열어 targets({형식: 경로})로 차례로 저장"""
+        doc = self.desktop.loadComponentFromURL(
+            uno.systemPathToFileUrl(str(Path(source).resolve())), '_blank', 0,
+            _props(Hidden=True, ReadOnly=True),
+        )
+        if doc is None:
+            raise OfficeError(f"문서를 열 수 없음: {Path(source).name}")
+        results = {}
+        try:
+            for fmt, target in targets.items():
+                try:
+                    doc.storeToURL(uno.systemPathToFileUrl(str(Path(target).resolve())), _store_props(fmt))
+                    results[fmt] = Path(target)
+                except Exception as e:
+                    if self.process.poll() is not None:
+                        raise  # 서버가 죽음 → convert에서 재시작
+                    print(f"    ✗ {fmt.upper()} 내보내기 실패: {e}")
+                    results[fmt] = None
+        finally:
+            try:
+                doc.close(True)
+            except Exception:
+                pass  # 서버가 죽어 이미 닫힌 문서
+        return results
+
+    def _kill(self):
+        """제한 시간 초과 - 멈춘 변환을 끊기 위해 프로세스 종료"""
+        self.timed_out = True
+        if self.process is not None:
+            self.process.kill()
+
+    def export(self, source, targets, timeout=CONVERT_TIMEOUT):
+        """
+        source → targets({형식: 경로}) 한 세션에서 변환, 서버 오류 시 재시작 후 1회 재시도
+        Returns: {형식: 경로 또는 None}
+        """
+        with self.lock:
+            for attempt in (1, 2):
+                self.start()
+                self.timed_out = False
+                watchdog = threading.Timer(timeout, self._kill)
+                watchdog.start()
+                try:
+                    results = self._export(source, targets)
+                    self.conversions += 1
+                    return results
+                except OfficeError:
+                    raise
+                except Exception as e:
+                    if self.timed_out:
+                        self.desktop = None
+                        raise OfficeError(f"변환 시간 초과 ({timeout}초)") from e
+                    # DisposedException 등 - 서버가 죽었으면 다시 띄움
+                    if attempt == 2 or self.process.poll() is None:
+                        raise OfficeError(f"변환 실패: {e}") from e
+                    self.desktop = None
+                finally:
+                    watchdog.cancel()
+
+    def stop(self, remove_profile=True):
+        if self.desktop is not None:
+            try:
+                self.desktop.terminate()
+            except Exception:
+                pass  # 이미 끊긴 연결
+            self.desktop = None
+        elif self.process is not None:
+            self.process.terminate()
+        if self.process is not None:
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+        if remove_profile and self.own_profile:
+            shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+class OfficePool:
+    """상주 서버 여러 개 - 변환 요청마다 쉬는 서버 하나를 빌려 씀 (서버는 처음 쓸 때 기동)"""
+
+    def __init__(self, soffice_path, size=1, timeout=CONVERT_TIMEOUT):
+        self.soffice_path = soffice_path
+        self.servers = [OfficeServer(soffice_path) for _ in range(max(1, size))]
+        self.timeout = timeout
+        self.idle = queue.Queue()
+        for server in self.servers:
+            self.idle.put(server)
+
+    @property
+    def version(self):
+        return office_version(self.soffice_path)
+
+    def convert_all(self, source, output_dir, formats):
+        """source를 한 번 열어 output_dir/<이름>.<형식>으로 모두 변환 → {형식: 경로 또는 None}"""
+        targets = {fmt: Path(output_dir) / f"{Path(source).stem}.{fmt}" for fmt in formats}
+        server = self.idle.get()
+        try:
+            results = server.export(source, targets, self.timeout)
+        except OfficeError as e:
+            print(f"    ✗ {e}")
+            results = {}
+        finally:
+            self.idle.put(server)
+        return {fmt: path if results.get(fmt) and path.exists() else None for fmt, path in targets.items()}
+
+    def convert(self, source, output_dir, fmt):
+        """source → output_dir/<이름>.<fmt>, 실패 시 None"""
+        return self.convert_all(source, output_dir, (fmt,))[fmt]
+
+    def close(self):
+        for server in self.servers:
+            server.stop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class OneShotOffice:
+    """
+    uno를 쓸 수 없을 때: 변환마다 soffice --convert-to 실행 (이전 방식)
+    동시 실행 수만큼 프로필을 따로 두어 병렬 실행 시 프로필 잠금 충돌 방지
+    """
+
+    def __init__(self, soffice_path, instances=1, timeout=CONVERT_TIMEOUT):
+        self.soffice_path = soffice_path
+        self.timeout = timeout
+        self.profiles = [Path(tempfile.mkdtemp(prefix='lo-profile-')) for _ in range(max(1, instances))]
+        self.idle = queue.Queue()
+        for profile in self.profiles:
+            self.idle.put(profile)
+
+    @property
+    def version(self):
+        return office_version(self.soffice_path)
+
+    def convert(self, source, output_dir, fmt):
+        target = Path(output_dir) / f"{Path(source).stem}.{fmt}"
+        profile = self.idle.get()
+        try:
+            result = subprocess.run(
+                [
+                    self.soffice_path, "--headless", f"-env:UserInstallation={profile.as_uri()}",
+                    "--convert-to", fmt, "--outdir", str(output_dir), str(source),
+                ],
+                capture_output=True,
+                text=True,
+                timeout=self.timeout,
+            )
+        except subprocess.TimeoutExpired:
+            print(f"    ✗ {fmt.upper()} 변환 시간 초과 ({self.timeout}초)")
+            return None
+        finally:
+            self.idle.put(profile)
+        if target.exists():
+            return target
+        print(f"    ✗ {fmt.upper()} 생성 실패: {result.stderr.strip()}")
+        return None
+
+    def convert_all(self, source, output_dir, formats):
+        """--convert-to는 형식 하나씩만 받으므로 형식마다 실행"""
+        return {fmt: self.convert(source, output_dir, fmt) for fmt in formats}
+
+    def close(self):
+        for profile in self.profiles:
+            shutil.rmtree(profile, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_office(soffice_path, instances=1, server=True, timeout=CONVERT_TIMEOUT):
+    """
+    변환 백엔드 (uno 있으면 상주 서버, 없거나 server=False면 1회 실행)
+    instances: 동시에 변환할 수 있는 LibreOffice 수 (각자 별도 프로필)
+    """
+    if server and HAS_UNO:
+        return OfficePool(soffice_path, instances, timeout)
+    if server:
+        print("ℹ️ uno 모듈 없음 → 변환마다 soffice 실행 (apt install python3-uno 로 상주 서버 사용)")
+    return OneShotOffice(soffice_path, instances, timeout)
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+변환된 양식 PDF 용량 최적화 (다운로드 트래픽 절감)
+
+- 글꼴 서브셋: 문서에 실제로 쓰인 글자만 남김 (PyMuPDF, 한글 글꼴 전체 임베딩이 용량 대부분)
+- 스트림 압축 + 안 쓰는 객체 정리 + 객체 스트림
+- 선형화(linearize, "Fast Web View"): 다운로드가 끝나기 전에 첫 쪽부터 표시 (pikepdf/qpdf)
+- 결과가 원본보다 작을 때만 교체 (선형화만 적용한 쪽이 더 작으면 그것 사용)
+  --allow-growth: 선형화가 안 된 원본은 용량이 늘어도 선형화 결과로 교체 (첫 쪽 표시 속도 우선)
+- PDF마다 별도 프로세스 (--jobs), 양식별 전후 용량 보고
+- 처리한 blob 해시를 .claude/cache/pdf-optimize.json에 기록 → 다시 실행해도 같은 blob은 건너뜀
+
+대상은 실제로 제공되는 양식 저장소(form_store)의 PDF blob (이름이 가리키는 public/files/blobs/**/*.pdf)
+- blob은 파일명이 내용 해시라 제자리 수정하지 않음: 최적화 결과를 새 blob으로 넣고
+  이름/변환 기록을 새 blob으로 옮긴 뒤 JSON downloads를 갱신 (옛 blob은 python form_store.py --gc로 정리)
+- public/files/forms에 남은 PDF는 대상이 아님 (먼저 python form_store.py --migrate)
+
+사용법:
+    python optimize-pdfs.py                  # 전체
+    python optimize-pdfs.py 임대차계약서.pdf   # 일부만 (저장소 파일명)
+    python optimize-pdfs.py --dry-run        # 용량 비교만 (파일은 그대로)
+    python optimize-pdfs.py --force -j 4     # 기록 무시, 4개 동시
+    python optimize-pdfs.py --allow-growth   # 용량이 늘어도 선형화
+
+필요 패키지:
+    pip install pikepdf pymupdf   (pymupdf가 없으면 서브셋 없이 압축/선형화만)
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from form_store import FormStore, LEGACY_DIR, rewrite_blob_urls, sync_downloads
+
+try:
+    import pikepdf
+    HAS_PIKEPDF = True
+except ImportError:
+    HAS_PIKEPDF = False
+
+try:
+    import pymupdf
+    HAS_PYMUPDF = True
+except ImportError:
+    HAS_PYMUPDF = False
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CACHE_PATH = PROJECT_ROOT / ".claude" / "cache" / "pdf-optimize.json"
+
+
+def optimizer_version():
+    parts = [f"pikepdf {pikepdf.__version__}" if HAS_PIKEPDF else "pikepdf -"]
+    if HAS_PYMUPDF:
+        parts.append(f"pymupdf {pymupdf.VersionBind}")
+    return " + ".join(parts)
+
+
+def _subset_fonts(data):
+    """PyMuPDF: 글꼴 서브셋 + 압축 + 안 쓰는 객체 제거 → 바이트"""
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        doc.subset_fonts()
+        return doc.tobytes(garbage=3, deflate=True, deflate_fonts=True, deflate_images=True)
+
+
+def _linearize(data):
+    """pikepdf: 스트림 압축 + 객체 스트림 + 선형화 → 바이트"""
+    output = io.BytesIO()
+    with pikepdf.open(io.BytesIO(data)) as pdf:
+        pdf.remove_unreferenced_resources()
+        pdf.save(
+            output,
+            linearize=True,
+            compress_streams=True,
+            object_stream_mode=pikepdf.ObjectStreamMode.generate,
+        )
+    return output.getvalue()
+
+
+def _is_linearized(data):
+    with pikepdf.open(io.BytesIO(data)) as pdf:
+        return pdf.is_linearized
+
+
+def optimize_pdf(pdf_path, output_path, name, dry_run=False, allow_growth=False):
+    """
+    PDF 하나 최적화 (프로세스 풀 작업 단위)
+    원본(blob)은 그대로 두고, 더 작아지면 결과를 output_path에 씀
+    (allow_growth면 선형화 안 된 원본은 커지더라도 선형화 결과를 씀)
+
+    Returns: {"name", "before", "after", "subset", "linearized", "replaced"}
+    """
+    original = Path(pdf_path).read_bytes()
+
+    candidates = []
+    subset = False
+    if HAS_PYMUPDF:
+        try:
+            candidates.append(_linearize(_subset_fonts(original)))
+            subset = True
+        except Exception as e:
+            # 서브셋 실패(손상된 글꼴 등)는 선형화만으로 진행
+            print(f"  ⚠️ {name}: 글꼴 서브셋 실패 ({e})")
+    candidates.append(_linearize(original))
+    best = min(candidates, key=len)
+    if best is not candidates[0]:
+        subset = False
+
+    # 더 작아지지 않으면 원본 유지 (--allow-growth면 선형화 안 된 원본만 예외)
+    linearized = _is_linearized(original)
+    keep = len(best) >= len(original) and (linearized or not allow_growth)
+    result = {
+        "name": name,
+        "before": len(original),
+        "after": len(original) if keep else len(best),
+        "subset": subset and not keep,
+        "linearized": linearized or not keep,
+        "replaced": False,
+    }
+    if keep or dry_run:
+        return result
+
+    Path(output_path).write_bytes(best)
+    result["replaced"] = True
+    return result
+
+
+def load_cache():
+    if CACHE_PATH.exists():
+        try:
+            return json.loads(CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            pass
+    return {}
+
+
+def save_cache(cache):
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = CACHE_PATH.with_suffix(".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(dict(sorted(cache.items())), f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, CACHE_PATH)
+
+
+def format_size(size):
+    return f"{size / 1024:,.0f}KB" if size < 1024 * 1024 else f"{size / 1024 / 1024:,.2f}MB"
+
+
+def store_pdfs(store, names=None):
+    """저장소 PDF blob → {sha256: [파일명, ...]} (같은 blob을 가리키는 이름은 한 번만 처리)"""
+    targets = {}
+    for name in names or store.names_with_ext("pdf"):
+        targets.setdefault(store.resolve(name), []).append(name)
+    return targets
+
+
+def optimize_all(store, targets, jobs=1, dry_run=False, force=False, allow_growth=False):
+    """
+    저장소 PDF blob 최적화 + 용량 보고 (절감한 바이트 수 반환)
+    작아진 결과는 새 blob으로 넣고 이름/변환 기록/JSON downloads를 새 blob으로 옮김
+    """
+    started = time.monotonic()
+    cache = load_cache()
+    version = optimizer_version() + (" (allow-growth)" if allow_growth else "")
+
+    # 이미 이 최적화기로 처리한 blob(원본 유지 또는 최적화 결과)은 건너뜀
+    todo = {
+        sha: names for sha, names in targets.items()
+        if force or cache.get(sha, {}).get("optimizer") != version
+    }
+
+    skipped = len(targets) - len(todo)
+    print(f"🗜️ PDF {len(targets)}개 중 {len(todo)}개 최적화"
+          + (f" (동시 {jobs}개)" if jobs > 1 and len(todo) > 1 else "")
+          + (" - 미리보기(--dry-run)" if dry_run else ""))
+
+    results = []
+    replaced = {}  # 옛 sha256 → 새 sha256
+    with tempfile.TemporaryDirectory() as temp_dir, \
+            ProcessPoolExecutor(max_workers=max(1, min(jobs, len(todo) or 1))) as pool:
+        futures = {
+            pool.submit(optimize_pdf, store.blob_path(sha, "pdf"), Path(temp_dir) / f"{sha}.pdf", names[0], dry_run, allow_growth): sha
+            for sha, names in todo.items()
+        }
+        for future in as_completed(futures):
+            sha = futures[future]
+            names = todo[sha]
+            try:
+                result = future.result()
+            except Exception as e:
+                # 한 PDF의 오류로 나머지가 멈추지 않도록
+                print(f"  ✗ {names[0]}: {e}")
+                continue
+            results.append(result)
+            if dry_run:
+                continue
+            if result["replaced"]:
+                new_sha, _ = store.add_file(Path(temp_dir) / f"{sha}.pdf", names[0], save=False)
+                store.repoint(sha, new_sha, save=False)
+                replaced[sha] = new_sha
+                cache[new_sha] = {"optimizer": version, "names": names, "from": sha}
+            else:
+                cache[sha] = {"optimizer": version, "names": names}
+
+    if not dry_run:
+        save_cache(cache)
+        if replaced:
+            store.save()
+            changed = rewrite_blob_urls(store, replaced) + sync_downloads(store)
+            print(f"📦 새 blob {len(replaced)}개로 교체, JSON downloads {changed}건 갱신 "
+                  f"(옛 blob 정리: python form_store.py --gc)")
+
+    # 양식별 전후 용량
+    if results:
+        print("\n" + "=" * 60)
+        print("📊 PDF 용량 (전 → 후)")
+        print("=" * 60)
+    before = after = 0
+    for result in sorted(results, key=lambda r: r["before"] - r["after"], reverse=True):
+        before += result["before"]
+        after += result["after"]
+        saved = result["before"] - result["after"]
+        change = (result["after"] - result["before"]) / result["before"] * 100 if result["before"] else 0
+        notes = "서브셋+선형화" if result["subset"] else ("선형화" if saved > 0 or result["replaced"] else "원본 유지")
+        print(f"  {result['name']}: {format_size(result['before'])} → {format_size(result['after'])} "
+              f"({change:+.1f}%, {notes})")
+
+    saved = before - after
+    if before:
+        print(f"\n💾 합계 {format_size(before)} → {format_size(after)} (절감 {format_size(saved)}, {(after - before) / before * 100:+.1f}%)")
+    print(f"♻️ 건너뜀 {skipped}개 / 처리 {len(results)}개 ⏱️ {time.monotonic() - started:.1f}초")
+    return saved
+
+
+def main():
+    parser = argparse.ArgumentParser(description="양식 PDF 글꼴 서브셋 + 압축 + 선형화")
+    parser.add_argument("files", nargs="*", help="저장소 PDF 파일명 (기본: 저장소의 모든 PDF)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="동시에 처리할 PDF 수 (기본: CPU 수)")
+    parser.add_argument("--dry-run", action="store_true", help="용량 비교만 (파일은 그대로)")
+    parser.add_argument("--force", action="store_true", help="최적화 기록 무시하고 다시 처리")
+    parser.add_argument("--allow-growth", action="store_true",
+                        help="선형화 안 된 PDF는 용량이 늘어도 선형화 결과로 교체 (기본: 작아질 때만 교체)")
+    args = parser.parse_args()
+
+    if not HAS_PIKEPDF:
+        print("❌ pikepdf가 설치되지 않았습니다. 설치: pip install pikepdf")
+        sys.exit(1)
+    if not HAS_PYMUPDF:
+        print("- pymupdf 없음 (글꼴 서브셋 생략, 설치: pip install pymupdf)")
+
+    store = FormStore.load()
+    if args.files:
+        names = [Path(f).name for f in args.files]
+        missing = [name for name in names if not store.has(name)]
+        if missing:
+            print(f"❌ 저장소에 없는 파일입니다: {', '.join(missing)}")
+            sys.exit(1)
+        targets = store_pdfs(store, names)
+    else:
+        targets = store_pdfs(store)
+
+    legacy = sorted(LEGACY_DIR.glob("*.pdf"))
+    if legacy:
+        print(f"- public/files/forms의 PDF {len(legacy)}개는 저장소 밖이라 제외 (python form_store.py --migrate)")
+    if not targets:
+        print("⚠️ 저장소에 PDF가 없습니다.")
+        return
+
+    optimize_all(store, targets, max(1, args.jobs), args.dry_run, args.force, args.allow_growth)
+
+
+if __name__ == "__main__":
+    main()
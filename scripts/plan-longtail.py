@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+롱테일 작업 계획 생성기 (LONGTAIL-WORKFLOW.md 1~2단계 일괄 처리)
+- PAA 질문(문장형) → 명사형 H1 / 슬러그 변환
+- 첫 핵심어(주제 명사)가 같은 유사 H1끼리 묶어 문서 단위로 그룹핑 (질문 = H2)
+- 기존 wiki 슬러그/키워드 인덱스와 충돌 체크
+- 작업 계획 JSON 저장 + 구조 제안 출력
+
+사용법:
+  python plan-longtail.py questions.txt                 # 한 줄에 질문 하나
+  python plan-longtail.py questions-page1.json          # JSON 배열
+  python plan-longtail.py .claude/keywords/퇴직금.json   # collect-longtail-keywords.py 결과
+  python plan-longtail.py questions.txt --output plan.json --top 20
+"""
+
+import re
+import sys
+import json
+import argparse
+import unicodedata
+from pathlib import Path
+from datetime import datetime
+
+from keyword_index import KeywordIndex, WIKI_DIR
+from keyword_normalize import cluster_keywords, compact_key, strip_particle, to_slug
+
+ROOT_DIR = Path(__file__).parent.parent
+OUTPUT_DIR = ROOT_DIR / ".claude" / "keywords"
+
+# H1에 남길 최대 핵심어 수 (수식어 제외)
+MAX_TITLE_TOKENS = 5
+
+# 같은 문서로 묶을 H1 유사도 (문자 bigram Jaccard, 첫 핵심어가 같은 H1끼리만 비교)
+GROUP_THRESHOLD = 0.5
+
+# 질문 의도 → 명사형 수식어 (먼저 걸리는 규칙 적용)
+INTENT_RULES = [
+    (re.compile(r"얼마"), "금액"),
+    (re.compile(r"언제"), "시기"),
+    (re.compile(r"어떻게\s*(되|됩)"), ""),
+    (re.compile(r"어떻게|어떤\s*방법"), "방법"),
+    (re.compile(r"차이"), "차이"),
+    (re.compile(r"(할|될|받을|쓸)\s*수\s*(있|없)|가능한가|되나요|돼요"), "가능 여부"),
+]
+
+# 제목에서 버릴 단어
+STOPWORDS = {
+    "어떻게", "어떤", "어떠한", "무엇", "무엇인가요", "뭔가요", "뭐", "언제", "얼마", "얼마나", "왜",
+    "어디", "어디서", "어디에", "어디로",
+    "수", "것", "것들", "거", "경우", "때", "등", "및", "제", "저", "저는", "제가", "우리", "이것",
+    "지금", "지금은", "당장", "자세히", "이에", "대해", "대해서", "대한", "관련", "꽤", "좋은", "그", "또",
+    "통해", "통해서", "위해", "위하여", "따라", "하나", "아무도",
+    "있나요", "없나요", "있을까요", "되나요", "하나요", "할까요", "일까요", "인가요",
+    "있는", "없는", "같은", "하는", "되는", "할", "한", "될", "된", "해야", "받을", "받는", "받은", "받아야",
+    "알고", "싶습니다", "궁금합니다", "들었습니다", "하던데", "한다는데", "있다고",
+    "않아", "않고", "않는", "않은", "않게", "않아도",
+}
+
+# 동사/형용사 활용 어미 (이 어미로 끝나는 토큰은 제목에서 제외)
+VERB_ENDING_RE = re.compile(
+    r"(습니다|나요|까요|세요|어요|아요|가요|던데|는데|은데|지만|니다|다고|라고|니까|도록|면서|어서|아서|워서|어야|아야|는지|려고|려면|으면|던)$"
+)
+
+# 활용형으로 쓰인 동사/형용사 어간 ('나오는' → '나오'처럼 조사 제거 후 명사로 남는 것 방지)
+# 두 글자 이상은 어간만 남은 토큰도 제외, 한 글자는 어미가 붙은 경우만 ('주 52시간'의 '주'는 유지)
+VERB_STEMS = ("나오", "지키", "늘리", "줄이", "올리", "계시", "잡히", "내세우", "달라지", "생기", "바뀌", "모르")
+SHORT_VERB_STEMS = ("살", "입", "알", "싶", "들", "받", "주", "쓰", "남", "찾", "오", "가", "내", "두", "놓", "맞", "넘")
+VERB_FORM_RE = re.compile(
+    r"^(?:(?:" + "|".join(VERB_STEMS) + r")(?:는|은|고|지|던|면|며|게|기)?"
+    r"|(?:" + "|".join(SHORT_VERB_STEMS) + r")(?:는|은|고|지|던|면|며|게|기))$"
+)
+
+# 명사 + 서술격 조사 ('빈집일까요' → '빈집', '무엇인가요'는 불용어로 먼저 걸러짐)
+COPULA_RE = re.compile(r"^([가-힣A-Za-z0-9]{2,}?)(일까요|인가요|인지요|입니까|입니다|인지|일지)$")
+
+# '~하다/~되다' 파생 동사 → 명사 어간 ('이체하면' → '이체', '출금할' → '출금')
+HADA_RE = re.compile(
+    r"^([가-힣A-Za-z0-9]{2,}?)(하려면|하나요|했는데|합니다|하면|하는|하고|하여|해서|해야|해도|하기|할|한|되는|되면|되나요|된|될)$"
+)
+
+# 문장 속 조사 - 키워드 정규화보다 공격적으로 제거 ('경매가' → '경매', '빈집들이' → '빈집')
+# 단, 기존 wiki 어휘에 있는 단어('연차휴가', '한도')는 그대로 둔다
+QUESTION_PARTICLES = ("에는", "에도", "이나", "으로", "이", "가", "도", "나", "와", "과", "로", "만", "들")
+# 한 글자 조사와 끝 글자가 같은 명사 (어휘에 없어도 '연차휴가' → '연차휴'처럼 자르지 않음)
+NOUN_TAILS = {
+    "휴가", "국가", "평가", "단가", "원가", "시가", "주가", "대가", "물가", "지가", "공시지가", "호가", "매가",
+    "차이", "나이", "사이", "제도", "한도", "정도", "용도", "지도", "속도", "수도", "고도", "연도", "년도",
+    "결과", "효과", "부과", "학과", "경로", "통로", "진로", "근로", "도로", "미만", "불만", "비만", "코로나",
+}
+SHORT_NOUN_PARTICLE_RE = re.compile(r"^([가-힣])(에서|에는|으로|에|를|는)$")
+
+_SENTENCE_RE = re.compile(r"[^.?!]+[.?!]?")
+_TOKEN_CLEAN_RE = re.compile(r"[^\w가-힣]")
+
+
+def question_sentence(question):
+    """여러 문장 질문에서 실제 질문 문장과 앞선 맥락 분리"""
+    sentences = [s.strip() for s in _SENTENCE_RE.findall(question) if s.strip()]
+    if not sentences:
+        return "", []
+    asked = [i for i, s in enumerate(sentences) if s.endswith("?")]
+    idx = asked[-1] if asked else len(sentences) - 1
+    return sentences[idx], sentences[:idx]
+
+
+def _strip_question_particle(token, vocab):
+    """
+    QUESTION_PARTICLES 하나 제거
+    한 글자 조사('가', '도', '과')는 떼고 남은 말이 wiki 어휘에 있거나, 토큰이 그 글자로 끝나는 명사('휴가')가 아닐 때만
+    """
+    for particle in QUESTION_PARTICLES:
+        if not token.endswith(particle):
+            continue
+        if len(token) - len(particle) < 2:
+            return token   # '돈으로'를 '돈으'로 자르지 않음 (한 글자 명사는 SHORT_NOUN_PARTICLE_RE)
+        stem = token[:-len(particle)]
+        if len(particle) > 1 or stem.lower() in vocab or not token.endswith(tuple(NOUN_TAILS)):
+            return stem
+        return token
+    return token
+
+
+def strip_question_particles(token, vocab):
+    """문장 속 토큰의 조사 제거 (wiki 어휘에 있는 단어는 보존)"""
+    for _ in range(3):  # '빈집들이' → '빈집들' → '빈집'
+        if token.lower() in vocab:
+            break
+        stripped = strip_particle(token)
+        if stripped == token:
+            stripped = _strip_question_particle(token, vocab)
+        if stripped == token:
+            break
+        token = stripped
+    # 한 글자 명사 + 조사 ('집에' → '집', 명사 끝 글자로 잘 안 쓰이는 조사만)
+    match = SHORT_NOUN_PARTICLE_RE.match(token)
+    if match and token.lower() not in vocab:
+        token = match.group(1)
+    return token
+
+
+def content_tokens(text, vocab=frozenset()):
+    """문장에서 제목용 핵심어 추출 (조사/어미/불용어 제거)"""
+    tokens = []
+    for raw in text.split():
+        token = _TOKEN_CLEAN_RE.sub("", raw)
+        # '등의', '것이' 처럼 불용어 + 조사 한 글자
+        if not token or token in STOPWORDS or token[:-1] in STOPWORDS:
+            continue
+        # '~하다' 파생 동사/서술격은 명사만 남기고, 나머지 활용형은 wiki 어휘에 있어도 제외 ('받나요')
+        hada = None if token.lower() in vocab else HADA_RE.match(token) or COPULA_RE.match(token)
+        if hada:
+            token = hada.group(1)
+        elif VERB_FORM_RE.match(token) or VERB_ENDING_RE.search(token):
+            continue
+        if token.lower() not in vocab:
+            token = strip_question_particles(token, vocab)
+        if token and token not in STOPWORDS and token not in tokens:
+            tokens.append(token)
+    return tokens
+
+
+def question_to_title(question, vocab=frozenset()):
+    """
+    PAA 질문 → 명사형 H1
+
+    '퇴직금을 IRP에 이체하면 세금은 어떻게 되나요?' → '퇴직금 IRP 이체 세금'
+    '개인형 IRP는 어떻게 수령하나요?' → '개인형 IRP 수령 방법'
+    """
+    question = unicodedata.normalize("NFC", question).strip()
+    sentence, context = question_sentence(question)
+
+    suffix = ""
+    for pattern, label in INTENT_RULES:
+        if pattern.search(sentence):
+            suffix = label
+            break
+
+    tokens = content_tokens(sentence, vocab)
+    # 질문 문장만으로 주제가 부족하면 앞 문장 맥락에서 보충
+    if len(tokens) < 2:
+        for sent in reversed(context):
+            extra = content_tokens(sent, vocab)
+            tokens = extra + [t for t in tokens if t not in extra]
+
+    tokens = tokens[:MAX_TITLE_TOKENS]
+    for word in suffix.split():
+        # '실시시기' 뒤에 '시기'를 또 붙이지 않음
+        if not any(token.endswith(word) for token in tokens):
+            tokens.append(word)
+
+    return " ".join(tokens)
+
+
+def load_questions(paths):
+    """텍스트(줄 단위) / JSON 배열 / 수집기 결과 JSON에서 질문 목록 로드"""
+    questions = []
+    for path in paths:
+        text = sys.stdin.read() if path == "-" else Path(path).read_text(encoding="utf-8")
+        stripped = text.lstrip()
+        if stripped.startswith("[") or stripped.startswith("{"):
+            data = json.loads(text)
+            if isinstance(data, dict):
+                data = data.get("전체_키워드") or data.get("questions") or []
+            questions.extend(str(q) for q in data)
+        else:
+            questions.extend(line for line in text.splitlines())
+
+    # 빈 줄/트리거('롱테일:') 제거, 순서 유지 중복 제거
+    cleaned = (q.strip() for q in questions)
+    return list(dict.fromkeys(q for q in cleaned if q and q.rstrip(":") != "롱테일"))
+
+
+def build_plan(questions, index, threshold=GROUP_THRESHOLD):
+    """질문 목록 → 문서 단위 작업 계획"""
+    # wiki 키워드/제목에 쓰인 단어 = 조사를 떼면 안 되는 어휘
+    vocab = {token for term in index.exact for token in term.split()}
+
+    titles = {}
+    for q in questions:
+        title = question_to_title(q, vocab)
+        if title:
+            titles.setdefault(title, []).append(q)
+
+    # 첫 핵심어(주제 명사)가 다른 H1은 비슷해도 다른 문서 ('기간입찰' ≠ '기일입찰')
+    by_head = {}
+    for title in titles:
+        by_head.setdefault(compact_key(title.split()[0]), []).append(title)
+    clusters = [cluster for heads in by_head.values() for cluster in cluster_keywords(heads, threshold=threshold)]
+
+    documents = []
+    for cluster in clusters:
+        h1 = cluster["대표"]
+        slug = to_slug(h1)
+        h2 = [q for title in [h1] + cluster["변형"] for q in titles[title]]
+
+        if slug in index.files:
+            status, existing = "기존문서_보강", [slug]
+        else:
+            match = index.lookup(h1)
+            if match and match["type"] in ("exact", "normalized"):
+                status, existing = "기존문서_보강", match["slugs"]
+            elif match:
+                status, existing = "유사문서_확인", match["slugs"]
+            else:
+                status, existing = "신규", []
+
+        documents.append({
+            "slug": slug,
+            "url": f"/w/{slug}",
+            "h1": h1,
+            "meta_title": f"{h1} | 머니위키",
+            "상태": status,
+            "기존_문서": existing,
+            "h2": h2,
+        })
+
+    # 질문이 많은 문서 → 신규 문서 우선
+    order = {"신규": 0, "유사문서_확인": 1, "기존문서_보강": 2}
+    documents.sort(key=lambda d: (order[d["상태"]], -len(d["h2"]), d["slug"]))
+    return documents
+
+
+def print_plan(questions, documents, top):
+    """LONGTAIL-WORKFLOW.md 2단계 형식으로 출력"""
+    counts = {}
+    for doc in documents:
+        counts[doc["상태"]] = counts.get(doc["상태"], 0) + 1
+
+    print("📊 분석 결과")
+    print(f"- 입력 질문: {len(questions)}개")
+    print(f"- 생성 문서: {len(documents)}개 "
+          f"(신규 {counts.get('신규', 0)} / 유사 확인 {counts.get('유사문서_확인', 0)} / "
+          f"기존 보강 {counts.get('기존문서_보강', 0)})")
+    print("\n" + "━" * 28)
+
+    for i, doc in enumerate(documents[:top], 1):
+        tag = "" if doc["상태"] == "신규" else f"  [{doc['상태']}: {', '.join(doc['기존_문서'][:3])}]"
+        print(f"\n📄 문서 {i}: {doc['url']}{tag}")
+        print(f"   H1: {doc['h1']}")
+        for j, q in enumerate(doc["h2"]):
+            branch = "└─" if j == len(doc["h2"]) - 1 else "├─"
+            print(f"{branch} H2: {q}")
+
+    if len(documents) > top:
+        print(f"\n... 외 {len(documents) - top}개 문서")
+    print("\n" + "━" * 28)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="롱테일 질문 → 문서 작업 계획")
+    parser.add_argument("inputs", nargs="+", help="질문 파일 (txt / json, '-'는 stdin)")
+    parser.add_argument("--output", help="작업 계획 JSON 경로 (기본: .claude/keywords/plan-<입력>.json)")
+    parser.add_argument("--threshold", type=float, default=GROUP_THRESHOLD, help="문서 그룹핑 유사도 (0~1)")
+    parser.add_argument("--top", type=int, default=30, help="출력할 문서 수")
+    parser.add_argument("--wiki-dir", default=str(WIKI_DIR), help="wiki 문서 디렉토리")
+    args = parser.parse_args()
+
+    questions = load_questions(args.inputs)
+    if not questions:
+        print("❌ 질문이 없습니다")
+        sys.exit(1)
+
+    index = KeywordIndex.load(args.wiki_dir)
+    documents = build_plan(questions, index, args.threshold)
+    print_plan(questions, documents, args.top)
+
+    if args.output:
+        output_path = Path(args.output)
+    else:
+        stem = "stdin" if args.inputs[0] == "-" else Path(args.inputs[0]).stem
+        output_path = OUTPUT_DIR / f"plan-{stem}.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    plan = {
+        "생성일": datetime.now().strftime("%Y-%m-%d %H:%M"),
+        "입력_질문수": len(questions),
+        "생성_문서수": len(documents),
+        "문서": documents,
+    }
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(plan, f, ensure_ascii=False, indent=2)
+
+    print(f"\n💾 작업 계획 저장: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,25 @@
-"""HWP 파일 내용 읽기"""
+"""
+HWP 파일 내용 읽기 (hwp_reader - 한글 프로그램 없이 Linux에서도 동작)
+
+사용법:
+  python read-hwp-content.py                       # 표준근로계약서
+  python read-hwp-content.py public/files/forms/위임장.hwp
+"""
 import sys
-sys.path.insert(0, "C:/Users/user/hwp-mcp-test/src")
+from pathlib import Path
 
-from tools.hwp_controller import HwpController
+from hwp_reader import extract_text, HwpError
 
-hwp = HwpController()
-hwp.connect(visible=False, register_security_module=False)
+PROJECT_ROOT = Path(__file__).parent.parent
+DEFAULT_PATH = PROJECT_ROOT / "public" / "files" / "forms" / "표준근로계약서.hwp"
 
-# 표준근로계약서 열기
-hwp.open_document("C:/Users/user/wiki-site/public/files/forms/표준근로계약서.hwp")
+hwp_path = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_PATH
 
 # 텍스트 추출
-text = hwp.get_text()
-print(text[:2000] if text else "텍스트 추출 실패")
+try:
+    text = extract_text(hwp_path)
+except (OSError, HwpError) as e:
+    print(f"텍스트 추출 실패: {e}")
+    sys.exit(1)
 
-hwp.disconnect()
+print(text[:2000] if text else "텍스트 추출 실패")
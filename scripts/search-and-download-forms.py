@@ -12,6 +12,7 @@
     python search-and-download-forms.py 폐업신고서
     python search-and-download-forms.py --all
     python search-and-download-forms.py --list
+    python search-and-download-forms.py --refresh   # 바뀐 양식만 다시 받기 (ETag/Last-Modified)
 """
 
 import os
@@ -21,11 +22,15 @@ import json
 import time
 import argparse
 from pathlib import Path
-from urllib.parse import urljoin, quote, unquote, urlparse
+from urllib.parse import urljoin, quote
 
 import requests
 from bs4 import BeautifulSoup
 
+from form_download import download, DownloadError, is_complete, load_checksums
+from form_store import FormStore, download_url
+from form_acquire import fetch_download_links, learn_link
+
 # ============================================================
 # 설정
 # ============================================================
@@ -39,8 +44,7 @@ HEADERS = {
     'Accept-Language': 'ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7',
 }
 
-# 다운로드 가능한 파일 확장자
-DOWNLOAD_EXTENSIONS = ['.hwp', '.pdf', '.doc', '.docx', '.xls', '.xlsx']
+STORE = FormStore.load()
 
 
 # ============================================================
@@ -138,74 +142,10 @@ def search_gangnam(form_name):
 # ============================================================
 def find_download_links(url, form_name):
     """
-    페이지에서 HWP/PDF 다운로드 링크 찾기
+    페이지에서 HWP/PDF 다운로드 링크 찾기 (HTTP + lxml, form_acquire 공용 로직)
     """
     print(f"    📄 페이지 분석 중...")
-
-    try:
-        response = requests.get(url, headers=HEADERS, timeout=30)
-        response.encoding = 'utf-8'
-        soup = BeautifulSoup(response.text, 'lxml')
-
-        download_links = []
-
-        # 모든 링크 검사
-        for link in soup.select('a[href]'):
-            href = link.get('href', '')
-            text = link.get_text(strip=True)
-
-            # 다운로드 링크 판별
-            is_download = False
-            file_ext = None
-
-            # 1. 확장자로 판별
-            for ext in DOWNLOAD_EXTENSIONS:
-                if ext in href.lower():
-                    is_download = True
-                    file_ext = ext.replace('.', '')
-                    break
-
-            # 2. download 키워드로 판별
-            if any(kw in href.lower() for kw in ['download', 'filedown', 'ntsfiledown', 'file/1/get']):
-                is_download = True
-                # 확장자 추측
-                if 'hwp' in href.lower() or 'hwp' in text.lower() or '.hwp' in text.lower():
-                    file_ext = 'hwp'
-                elif 'pdf' in href.lower() or 'pdf' in text.lower():
-                    file_ext = 'pdf'
-                elif 'doc' in href.lower() or 'doc' in text.lower():
-                    file_ext = 'docx'
-                else:
-                    file_ext = 'hwp'  # 기본값
-
-            if is_download and file_ext:
-                # 상대 URL을 절대 URL로 변환
-                full_url = urljoin(url, href)
-
-                # 관련성 점수
-                relevance = 0
-                if form_name in text or form_name in unquote(href):
-                    relevance = 100
-                elif any(kw in text for kw in ['양식', '서식', form_name[:2]]):
-                    relevance = 50
-                else:
-                    relevance = 10
-
-                download_links.append({
-                    'url': full_url,
-                    'text': text[:50] if text else '다운로드',
-                    'ext': file_ext,
-                    'relevance': relevance
-                })
-
-        # 관련성 높은 순으로 정렬
-        download_links.sort(key=lambda x: x['relevance'], reverse=True)
-
-        return download_links[:5]
-
-    except Exception as e:
-        print(f"    ❌ 페이지 분석 실패: {e}")
-        return []
+    return fetch_download_links(url, form_name)
 
 
 # ============================================================
@@ -213,53 +153,32 @@ def find_download_links(url, form_name):
 # ============================================================
 def download_file(url, save_path):
     """
-    파일 다운로드
+    파일 다운로드 (.part 이어받기 + 크기/시그니처 검증 + 원자적 저장)
+    save_path의 확장자는 URL로 추정한 값 - 내용이 PDF/HWP면 그 확장자로 저장
+
+    Returns:
+        저장된 확장자 (실패 시 None)
     """
+    # 이미 가진 파일은 조건부 요청 (서버에서 바뀌지 않았으면 304로 전송 생략)
+    name = os.path.basename(save_path)
+    conditional = STORE.has(name) or is_complete(save_path)
     try:
-        response = requests.get(url, headers=HEADERS, timeout=60, stream=True, allow_redirects=True)
-
-        if response.status_code != 200:
-            print(f"    ❌ HTTP {response.status_code}")
-            return False
-
-        # 파일 크기 체크
-        content_length = response.headers.get('Content-Length', 0)
-        if content_length and int(content_length) < 500:
-            print(f"    ⚠️ 파일이 너무 작음 ({content_length} bytes)")
-            return False
-
-        # HTML 체크
-        content_type = response.headers.get('Content-Type', '')
-        if 'text/html' in content_type and 'attachment' not in response.headers.get('Content-Disposition', ''):
-            # 처음 100바이트 확인
-            first_bytes = response.content[:100]
-            if b'<!DOCTYPE' in first_bytes or b'<html' in first_bytes:
-                print(f"    ⚠️ HTML 페이지임 (파일 아님)")
-                return False
-
-        os.makedirs(os.path.dirname(save_path), exist_ok=True)
-
-        with open(save_path, 'wb') as f:
-            f.write(response.content)
-
-        file_size = os.path.getsize(save_path)
-
-        # 최종 확인: HWP 파일 시그니처 체크
-        with open(save_path, 'rb') as f:
-            header = f.read(8)
+        result = download(url, save_path, headers=HEADERS, conditional=conditional, sniff=True)
+    except (DownloadError, requests.RequestException, OSError) as e:
+        print(f"    ❌ 다운로드 실패: {e}")
+        return None
 
-        # HWP 파일 시그니처: D0 CF 11 E0 (OLE compound)
-        if save_path.endswith('.hwp') and not header.startswith(b'\xd0\xcf\x11\xe0'):
-            print(f"    ⚠️ 유효한 HWP 파일이 아님")
-            os.remove(save_path)
-            return False
+    if result['notModified']:
+        print(f"    ⏭️ 변경 없음 (304): {name}")
+        return result['ext']
 
-        print(f"    ✅ 다운로드 완료: {os.path.basename(save_path)} ({file_size:,} bytes)")
-        return True
+    print(f"    ✅ 다운로드 완료: {os.path.basename(result['path'])} ({result['size']:,} bytes)")
 
-    except Exception as e:
-        print(f"    ❌ 다운로드 실패: {e}")
-        return False
+    # 내용 기준 저장소로 이동 (같은 서식을 다른 이름으로 받았으면 blob 재사용)
+    _, duplicate = STORE.add_file(result['path'], sha=result['sha256'])
+    if duplicate:
+        print("    ♻️ 이미 저장된 파일과 동일 (blob 재사용)")
+    return result['ext']
 
 
 # ============================================================
@@ -285,13 +204,13 @@ def update_json(form_name, ext, source_url=None):
         if 'downloadNames' not in data or not data['downloadNames']:
             data['downloadNames'] = {}
 
-        data['downloads'][ext] = f"/files/forms/{form_name}.{ext}"
+        data['downloads'][ext] = download_url(form_name, ext, STORE)
         data['downloadNames'][ext] = f"{form_name}.{ext}"
 
         with open(json_path, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
 
-        print(f"    📝 JSON 업데이트 완료")
+        print("    📝 JSON 업데이트 완료")
 
     except Exception as e:
         print(f"    ❌ JSON 업데이트 실패: {e}")
@@ -308,16 +227,16 @@ def process_form(form_name):
     print(f"📋 {form_name}")
     print('='*60)
 
-    # 이미 다운로드됐는지 확인
+    # 이미 다운로드됐는지 확인 (잘린 파일/HTML 오류 페이지는 다시 받음)
+    checksums = load_checksums()
     for ext in ['hwp', 'pdf', 'docx']:
-        existing = FORMS_DIR / f"{form_name}.{ext}"
-        if existing.exists() and existing.stat().st_size > 1000:
+        if STORE.has(f"{form_name}.{ext}") or is_complete(FORMS_DIR / f"{form_name}.{ext}", checksums):
             print(f"  ✅ 이미 존재: {form_name}.{ext}")
             return True
 
     # 1. 알려진 URL 확인
     if form_name in KNOWN_DOWNLOAD_URLS:
-        print(f"  📌 알려진 URL 사용")
+        print("  📌 알려진 URL 사용")
         url = KNOWN_DOWNLOAD_URLS[form_name]
 
         # 확장자 추출
@@ -329,8 +248,9 @@ def process_form(form_name):
 
         save_path = str(FORMS_DIR / f"{form_name}.{ext}")
 
-        if download_file(url, save_path):
-            update_json(form_name, ext)
+        saved_ext = download_file(url, save_path)
+        if saved_ext:
+            update_json(form_name, saved_ext)
             return True
 
     # 2. 강남구청 검색
@@ -346,8 +266,10 @@ def process_form(form_name):
 
                 print(f"    ⬇️ 다운로드 시도: {link['text']}")
 
-                if download_file(link['url'], save_path):
-                    update_json(form_name, ext)
+                saved_ext = download_file(link['url'], save_path)
+                learn_link(link, bool(saved_ext))
+                if saved_ext:
+                    update_json(form_name, saved_ext)
                     return True
 
     # 3. 정부24 검색
@@ -362,14 +284,47 @@ def process_form(form_name):
 
             print(f"    ⬇️ 다운로드 시도: {link['text']}")
 
-            if download_file(link['url'], save_path):
-                update_json(form_name, ext)
+            saved_ext = download_file(link['url'], save_path)
+            learn_link(link, bool(saved_ext))
+            if saved_ext:
+                update_json(form_name, saved_ext)
                 return True
 
     print(f"  ❌ 다운로드 실패")
     return False
 
 
+def refresh_forms():
+    """
+    기록된 다운로드 URL로 조건부 재요청 - 서버에서 바뀐 양식만 다시 받음
+    (야간 최신화용, 검색 단계 없이 ETag/Last-Modified만 확인)
+    """
+    records = load_checksums()
+    targets = [(name, record) for name, record in sorted(records.items()) if record.get('url')]
+    print(f"\n🔄 최신화 확인 ({len(targets)}개)")
+
+    changed, unchanged, fail = [], 0, 0
+    for file_name, record in targets:
+        form_name, ext = file_name.rsplit('.', 1)
+        print(f"\n📋 {file_name}")
+        saved_ext = download_file(record['url'], str(FORMS_DIR / file_name))
+        if not saved_ext:
+            fail += 1
+            continue
+        saved_name = f"{form_name}.{saved_ext}"
+        if saved_ext != ext or load_checksums().get(saved_name, {}).get('sha256') != record.get('sha256'):
+            update_json(form_name, saved_ext)
+            changed.append(saved_name)
+        else:
+            unchanged += 1
+        time.sleep(0.5)
+
+    print(f"\n{'='*60}")
+    print(f"📊 결과: 변경 {len(changed)}개, 변경 없음 {unchanged}개, 실패 {fail}개")
+    for file_name in changed:
+        print(f"   🆕 {file_name}")
+
+
 def get_missing_forms():
     """
     다운로드 파일이 없는 양식만 가져오기
@@ -377,7 +332,7 @@ def get_missing_forms():
     missing = []
     for json_file in DATA_DIR.glob('*.json'):
         form_name = json_file.stem
-        has_file = any((FORMS_DIR / f"{form_name}.{ext}").exists()
+        has_file = any(STORE.has(f"{form_name}.{ext}") or (FORMS_DIR / f"{form_name}.{ext}").exists()
                        for ext in ['hwp', 'pdf', 'docx', 'doc', 'xlsx', 'xls'])
         if not has_file:
             missing.append(form_name)
@@ -390,6 +345,7 @@ def main():
     parser.add_argument('--all', '-a', action='store_true', help='미다운로드 양식 전체')
     parser.add_argument('--list', '-l', action='store_true', help='목록 확인')
     parser.add_argument('--missing', '-m', action='store_true', help='미다운로드 목록')
+    parser.add_argument('--refresh', '-r', action='store_true', help='받은 양식 중 서버에서 바뀐 것만 다시 받기')
 
     args = parser.parse_args()
 
@@ -398,6 +354,7 @@ def main():
     if args.list or args.missing:
         missing = get_missing_forms()
         downloaded = [f.stem for f in FORMS_DIR.glob('*.hwp')] + [f.stem for f in FORMS_DIR.glob('*.pdf')]
+        downloaded += [name.rsplit('.', 1)[0] for ext in ['hwp', 'pdf'] for name in STORE.names_with_ext(ext)]
         print(f"\n📊 현황: 다운로드 {len(set(downloaded))}개 / 미다운로드 {len(missing)}개")
         print(f"\n⬜ 미다운로드 ({len(missing)}개):")
         for form in missing[:20]:
@@ -406,6 +363,10 @@ def main():
             print(f"   ... 외 {len(missing)-20}개")
         return
 
+    if args.refresh:
+        refresh_forms()
+        return
+
     if args.all:
         missing = get_missing_forms()
         print(f"\n🚀 전체 다운로드 시작 ({len(missing)}개)")
@@ -432,6 +393,7 @@ def main():
     print("  python search-and-download-forms.py 폐업신고서    # 특정 양식")
     print("  python search-and-download-forms.py --all        # 전체 다운로드")
     print("  python search-and-download-forms.py --missing    # 미다운로드 목록")
+    print("  python search-and-download-forms.py --refresh    # 바뀐 양식만 다시 받기")
 
 
 if __name__ == "__main__":
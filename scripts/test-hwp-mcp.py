@@ -1,6 +1,7 @@
 """
 HWP-MCP 테스트 스크립트
 한글 프로그램과 연결하여 기본적인 문서 생성 테스트
+(저장된 파일 내용 확인은 hwp_reader - 한글 프로그램 없이 파일을 직접 읽음)
 """
 
 import sys
@@ -10,6 +11,7 @@ import os
 sys.path.insert(0, "C:/Users/user/hwp-mcp-test/src")
 
 from tools.hwp_controller import HwpController
+from hwp_reader import iter_blocks, HwpError
 
 def test_basic_connection():
     """기본 연결 테스트"""
@@ -72,6 +74,7 @@ def test_basic_connection():
         print(f"저장 결과: {result}")
         if os.path.exists(save_path):
             print(f"✅ 문서 저장 성공! 파일 크기: {os.path.getsize(save_path)} bytes")
+            verify_saved_document(save_path)
         else:
             print("⚠️ save_document는 성공했지만 파일이 없음 - 보안 경고창 확인 필요")
     except Exception as e:
@@ -85,6 +88,24 @@ def test_basic_connection():
     return True
 
 
+def verify_saved_document(save_path):
+    """저장된 HWP를 hwp_reader로 다시 읽어 텍스트/표 확인"""
+    print("\n[5-1] 저장 파일 내용 확인 (hwp_reader)...")
+    try:
+        blocks = list(iter_blocks(save_path))
+    except HwpError as e:
+        print(f"❌ 파일 읽기 실패: {e}")
+        return False
+
+    texts = [block["text"] for block in blocks if block["type"] == "paragraph"]
+    tables = [block["rows"] for block in blocks if block["type"] == "table"]
+    text_ok = any("HWP-MCP 테스트 문서입니다." in text for text in texts)
+    table_ok = any(rows and rows[0][:2] == ["항목", "내용"] for rows in tables)
+    print(f"{'✅' if text_ok else '❌'} 텍스트 확인 ({len(texts)}개 문단)")
+    print(f"{'✅' if table_ok else '❌'} 표 확인 ({len(tables)}개 표)")
+    return text_ok and table_ok
+
+
 if __name__ == "__main__":
     try:
         success = test_basic_connection()
@@ -490,6 +490,7 @@ export default async function FormDownloadPage({ params }: PageProps) {
         <FormPageClient
           formTitle={form.shortTitle || form.title}
           previewData={previewData}
+          previewImages={form.previewImages}
         />
 
         {/* 중간 광고 */}
@@ -2,6 +2,7 @@
 
 import { useState } from "react";
 import FormPreview from "./FormPreview";
+import type { PreviewImage } from "@/lib/forms-loader";
 
 interface FormField {
   label?: string;
@@ -20,10 +21,13 @@ interface FormRow {
 interface FormPageClientProps {
   formTitle: string;
   previewData: FormRow[];
+  previewImages?: PreviewImage[];
 }
 
-export default function FormPageClient({ formTitle, previewData }: FormPageClientProps) {
+export default function FormPageClient({ formTitle, previewData, previewImages }: FormPageClientProps) {
   const [activeTab, setActiveTab] = useState<"preview" | "example">("preview");
+  // 실제 양식(PDF) 이미지가 있으면 미리보기 탭은 표 마크업 대신 이미지
+  const showImages = activeTab === "preview" && !!previewImages?.length;
 
   return (
     <div className="mb-8">
@@ -73,12 +77,34 @@ export default function FormPageClient({ formTitle, previewData }: FormPageClien
       </div>
 
       {/* 탭 컨텐츠 */}
-      <FormPreview
-        title={formTitle}
-        rows={previewData}
-        mode={activeTab}
-        className="rounded-t-none border-t-0"
-      />
+      {showImages ? (
+        <div className="bg-white border border-neutral-200 border-t-0 rounded-b-lg p-3 space-y-3">
+          {previewImages!.map((image) => {
+            const widths = Object.keys(image.srcset).map(Number).sort((a, b) => a - b);
+            return (
+              <img
+                key={image.page}
+                src={image.srcset[String(widths[widths.length - 1])]}
+                srcSet={widths.map((width) => `${image.srcset[String(width)]} ${width}w`).join(", ")}
+                sizes="(max-width: 768px) 100vw, 768px"
+                width={image.width}
+                height={image.height}
+                alt={`${formTitle} 양식 ${image.page}쪽 미리보기`}
+                loading={image.page === 1 ? "eager" : "lazy"}
+                decoding="async"
+                className="w-full h-auto mx-auto border border-neutral-100"
+              />
+            );
+          })}
+        </div>
+      ) : (
+        <FormPreview
+          title={formTitle}
+          rows={previewData}
+          mode={activeTab}
+          className="rounded-t-none border-t-0"
+        />
+      )}
 
       {/* 안내 문구 */}
       <p className="text-xs text-neutral-500 mt-2">
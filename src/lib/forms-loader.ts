@@ -18,6 +18,14 @@ export interface ExternalDownload {
   description: string;
 }
 
+// PDF 첫 쪽(들) WebP 미리보기 (scripts/generate-previews.py가 기록)
+export interface PreviewImage {
+  page: number;
+  width: number;
+  height: number;
+  srcset: Record<string, string>;  // 너비(px) → 이미지 URL
+}
+
 export interface FormData {
   slug: string;
   title: string;
@@ -38,6 +46,7 @@ export interface FormData {
   };
   externalDownload?: ExternalDownload;  // 외부 다운로드 링크 (HWP 파일 없을 때)
   previewDataKey: string;
+  previewImages?: PreviewImage[];
   relatedArticle?: string;
   relatedDocs?: RelatedDoc[];  // 관련 문서 배열 (하단 내부링크용)
   tips?: string[];